@@ -93,6 +93,10 @@ CREATE INDEX IF NOT EXISTS idx_introspect_ag_tag
 CREATE INDEX IF NOT EXISTS idx_introspect_key_hash
     ON public.introspection_index(unique_key_hash);
 
+-- Normalized status + id for introspect.fetch.v1 keyset pagination
+CREATE INDEX IF NOT EXISTS idx_introspect_status_norm_id
+    ON public.introspection_index((lower(replace(replace(status, '_', ''), '-', ''))), id);
+
 -- === Audit Trigger for updated_at (Optional, requires function) ===
 -- CREATE OR REPLACE FUNCTION update_introspect_updated_at()
 -- RETURNS TRIGGER AS $$
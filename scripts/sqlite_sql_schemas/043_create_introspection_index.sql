@@ -1,6 +1,7 @@
--- Version: 2.1
+-- Version: 2.2
 -- Created: 2025-08-12
 -- Description: Hardened schema for introspection_index with dedupe and indices
+-- 2.2: normalized-status expression index for introspect.fetch.v1 (keyset pages)
 BEGIN;
 
 CREATE TABLE IF NOT EXISTS introspection_index (
@@ -41,6 +42,15 @@ CREATE INDEX IF NOT EXISTS idx_introspect_ag_tag
 CREATE INDEX IF NOT EXISTS idx_introspect_key_hash
     ON introspection_index(unique_key_hash);
 
+-- Normalized status (lower, '_'/'-' stripped) + id: serves
+--   WHERE <status_norm> IN (...) AND id < :cursor ORDER BY id DESC LIMIT n
+-- Queries must spell the expression exactly like this (literals, not binds)
+-- for SQLite to match it; see introspect/providers.py:STATUS_NORM_SQL.
+-- An expression index rather than a column so re-running this file on an
+-- existing database adds it without a table rebuild.
+CREATE INDEX IF NOT EXISTS idx_introspect_status_norm_id
+    ON introspection_index(lower(replace(replace(status, '_', ''), '-', '')), id);
+
 -- Strong dedupe: prefer hash; fallback composite identifier
 CREATE UNIQUE INDEX IF NOT EXISTS uq_introspect_key
     ON introspection_index(unique_key_hash);
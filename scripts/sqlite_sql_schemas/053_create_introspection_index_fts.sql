@@ -1,6 +1,10 @@
--- Version: 1.1
+-- Version: 1.2
 -- Created: 2025-08-12
 -- Description: FTS5 mirror over introspection_index with change-tracking triggers.
+-- 1.2: external-content tables must be told the *old* values on delete/update
+--      ('delete' command); a plain DELETE re-reads the already-updated content
+--      row and left stale tokens behind. Ends with a 'rebuild' so re-applying
+--      repairs existing indexes and indexes rows inserted before the table existed.
 BEGIN;
 
 CREATE VIRTUAL TABLE IF NOT EXISTS introspection_index_fts
@@ -29,13 +33,17 @@ CREATE TRIGGER trg_ix_fts_ai AFTER INSERT ON introspection_index BEGIN
 END;
 
 CREATE TRIGGER trg_ix_fts_au AFTER UPDATE ON introspection_index BEGIN
-  DELETE FROM introspection_index_fts WHERE rowid = old.id;
+  INSERT INTO introspection_index_fts(introspection_index_fts, rowid, filepath, name, symbol_type, description, ag_tag, route_method, route_path, relation_type, target_symbol)
+  VALUES ('delete', old.id, old.filepath, old.name, old.symbol_type, old.description, old.ag_tag, old.route_method, old.route_path, old.relation_type, old.target_symbol);
   INSERT INTO introspection_index_fts(rowid, filepath, name, symbol_type, description, ag_tag, route_method, route_path, relation_type, target_symbol)
   VALUES (new.id, new.filepath, new.name, new.symbol_type, new.description, new.ag_tag, new.route_method, new.route_path, new.relation_type, new.target_symbol);
 END;
 
 CREATE TRIGGER trg_ix_fts_ad AFTER DELETE ON introspection_index BEGIN
-  DELETE FROM introspection_index_fts WHERE rowid = old.id;
+  INSERT INTO introspection_index_fts(introspection_index_fts, rowid, filepath, name, symbol_type, description, ag_tag, route_method, route_path, relation_type, target_symbol)
+  VALUES ('delete', old.id, old.filepath, old.name, old.symbol_type, old.description, old.ag_tag, old.route_method, old.route_path, old.relation_type, old.target_symbol);
 END;
 
+INSERT INTO introspection_index_fts(introspection_index_fts) VALUES ('rebuild');
+
 COMMIT;
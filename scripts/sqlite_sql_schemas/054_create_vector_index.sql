@@ -1,4 +1,4 @@
--- Version: 2.1
+-- Version: 2.2
 -- Created: 2025-08-12
 -- Description: Dense vector storage for introspection_index; optional VSS if available.
 BEGIN;
@@ -18,6 +18,8 @@ CREATE TABLE IF NOT EXISTS introspection_index_embeddings (
 
 CREATE INDEX IF NOT EXISTS idx_ix_embed_model ON introspection_index_embeddings(model);
 CREATE INDEX IF NOT EXISTS idx_ix_embed_dim   ON introspection_index_embeddings(dim);
+-- Serves the retriever.similar.v1 cache stamp (count / max(created_at) per model) from the index
+CREATE INDEX IF NOT EXISTS idx_ix_embed_model_created ON introspection_index_embeddings(model, created_at);
 
 -- Optional VSS (requires sqlite-vss extension):
 -- CREATE VIRTUAL TABLE IF NOT EXISTS introspection_index_embeddings_vss USING vss0(embedding(dim=1536));
@@ -0,0 +1,121 @@
+#v2\backend\core\db\access\engines.py
+"""
+Process-wide SQLAlchemy engine and reflected-table cache for read providers.
+
+- One Engine per URL (connection pool reused across calls); SQLite URLs get
+  check_same_thread=False and the standard pragmas, applied once per pooled
+  DBAPI connection when it is opened.
+- Reflected Table objects cached per (URL, table name); call forget_table()
+  after a query fails so the next call re-reflects, or clear() after a
+  migration.
+- No configuration loading at import time (unlike db_init), so providers can
+  import this freely.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import warnings
+from typing import Any, Dict, Tuple
+
+from sqlalchemy import MetaData, Table, create_engine, event
+from sqlalchemy.exc import SAWarning
+from sqlalchemy.engine import Engine
+
+SQLITE_PRAGMAS: Tuple[Tuple[str, Any], ...] = (
+    ("journal_mode", "WAL"),
+    ("synchronous", "NORMAL"),
+    ("cache_size", -20000),
+    ("temp_store", "MEMORY"),
+    ("mmap_size", 268435456),
+)
+
+_lock = threading.Lock()
+_engines: Dict[Tuple[str, str], Engine] = {}
+_metadata: Dict[Tuple[str, str], MetaData] = {}
+_tables: Dict[Tuple[str, str, str], Table] = {}
+
+
+def _key(url: str) -> Tuple[str, str]:
+    """Relative SQLite paths resolve against the CWD at connect time, so key on it too."""
+    if url.startswith("sqlite:///") and not url.startswith("sqlite:////"):
+        path = url[len("sqlite:///"):]
+        if path and path != ":memory:" and not os.path.isabs(path) and not (len(path) > 1 and path[1] == ":"):
+            return url, os.getcwd()
+    return url, ""
+
+
+def _apply_sqlite_pragmas(dbapi_conn: Any, _record: Any) -> None:
+    cur = dbapi_conn.cursor()
+    try:
+        for name, value in SQLITE_PRAGMAS:
+            try:
+                cur.execute(f"PRAGMA {name}={value}")
+            except Exception:
+                # Pragmas may fail depending on SQLite build / read-only files; not fatal.
+                pass
+    finally:
+        cur.close()
+
+
+def get_engine(url: str) -> Engine:
+    """Return the shared Engine for 'url', creating it on first use."""
+    key = _key(url)
+    engine = _engines.get(key)
+    if engine is not None:
+        return engine
+    with _lock:
+        engine = _engines.get(key)
+        if engine is None:
+            kwargs: Dict[str, Any] = {"future": True}
+            if url.startswith("sqlite"):
+                kwargs["connect_args"] = {"check_same_thread": False}
+            engine = create_engine(url, **kwargs)
+            if url.startswith("sqlite"):
+                event.listen(engine, "connect", _apply_sqlite_pragmas)
+            _engines[key] = engine
+            _metadata[key] = MetaData()
+    return engine
+
+
+def get_table(url: str, name: str) -> Table:
+    """Return the reflected Table 'name' for 'url' (reflected once per process)."""
+    key = _key(url)
+    tkey = key + (name,)
+    table = _tables.get(tkey)
+    if table is not None:
+        return table
+    engine = get_engine(url)
+    with _lock:
+        table = _tables.get(tkey)
+        if table is None:
+            with warnings.catch_warnings():
+                # Expression indexes (e.g. normalized status) can't be reflected; not needed for reads
+                warnings.filterwarnings("ignore", "Skipped unsupported reflection of expression-based index", SAWarning)
+                table = Table(name, _metadata[key], autoload_with=engine)
+            _tables[tkey] = table
+    return table
+
+
+def forget_table(url: str, name: str) -> None:
+    """Drop a cached reflection (e.g. after a query against it failed)."""
+    key = _key(url)
+    with _lock:
+        table = _tables.pop(key + (name,), None)
+        if table is not None and key in _metadata:
+            _metadata[key].remove(table)
+
+
+def clear() -> None:
+    """Dispose every cached engine and drop all reflections."""
+    with _lock:
+        engines = list(_engines.values())
+        _engines.clear()
+        _metadata.clear()
+        _tables.clear()
+    for engine in engines:
+        engine.dispose()
+
+
+__all__ = ["SQLITE_PRAGMAS", "get_engine", "get_table", "forget_table", "clear"]
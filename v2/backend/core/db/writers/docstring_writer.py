@@ -9,6 +9,12 @@ Minimal writer used by the docstring scanner to persist entries into the
   sourced from YAML via the central loader).
 - No environment variables and no hardcoded paths.
 - Upsert semantics: insert by natural key; on conflict, update rolling fields.
+- Bulk path (write_many / buffered): batched INSERT ... ON CONFLICT DO UPDATE
+  on the natural key, one session, a commit every `batch_size` rows. Same
+  update rules as write(). SQLite and PostgreSQL only; other dialects (or a
+  batch that fails for any reason, e.g. a unique_key_hash collision or a
+  locked database) fall back to write() row by row. Rows stay queued until
+  they are committed; pass on_result to learn each row's outcome.
 
 Expected input row keys (as produced by the analyzer adapter):
   file            : repo-relative path (str)
@@ -25,13 +31,19 @@ Expected input row keys (as produced by the analyzer adapter):
 API:
   w = DocstringWriter(agent_id=<int>, mode="introspection_index")
   w.write(row_dict)
+  stats = w.write_many(rows, batch_size=500)   # {"rows", "batches", ..., "rows_per_sec"}
+  with w.buffered(batch_size=500, on_result=cb) as buf:  # flushes the tail on exit
+      buf.write(row_dict, tag)                  # later cb(tag, None) or cb(tag, exc)
+  buf.stats
 """
 
 from __future__ import annotations
 
+import time
 from datetime import datetime, timezone
-from typing import Any, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
+from sqlalchemy import case, func
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
@@ -46,6 +58,11 @@ def _now_utc() -> datetime:
     return datetime.now(timezone.utc)
 
 
+DEFAULT_BATCH_SIZE = 500
+
+_NATURAL_KEY = ("filepath", "symbol_type", "name", "lineno")
+
+
 class DocstringWriter:
     """
     Thin wrapper around SQLAlchemy session for writing introspection records.
@@ -65,9 +82,9 @@ class DocstringWriter:
                 return v.strip()
         return None
 
-    def write(self, row: dict[str, Any]) -> None:
+    def _values(self, row: dict[str, Any]) -> dict[str, Any]:
         """
-        Insert or update a single docstring record.
+        Validate `row` and map it to IntrospectionIndex column values.
         """
         if not isinstance(row, dict):
             raise TypeError("row must be a dict")
@@ -86,7 +103,7 @@ class DocstringWriter:
             # For modules, name may be absent; for class/function we require a name
             raise ValueError("row missing symbol name ('function'|'route'|'name')")
 
-        rec = IntrospectionIndex(
+        return dict(
             filepath=filepath,
             symbol_type=symbol_type,
             name=name,
@@ -100,6 +117,12 @@ class DocstringWriter:
             recurrence_count=0,
         )
 
+    def write(self, row: dict[str, Any]) -> None:
+        """
+        Insert or update a single docstring record.
+        """
+        rec = IntrospectionIndex(**self._values(row))
+
         # Upsert using natural key first; fall back to unique_key_hash if needed
         with get_session() as session:  # type: Session
             try:
@@ -108,7 +131,7 @@ class DocstringWriter:
                 return
             except IntegrityError:
                 session.rollback()
-                self._update_existing(session, rec, prefer_hash=bool(unique_key_hash))
+                self._update_existing(session, rec, prefer_hash=bool(rec.unique_key_hash))
             except Exception:
                 session.rollback()
                 raise
@@ -176,3 +199,187 @@ class DocstringWriter:
             session.commit()
         except Exception:
             session.rollback()
+
+    # ----- bulk path -----
+
+    def write_many(self, rows: Iterable[dict[str, Any]], *, batch_size: int = DEFAULT_BATCH_SIZE) -> Dict[str, Any]:
+        """
+        Upsert many records in batches of `batch_size` (one commit per batch).
+        Returns {"rows", "batches", "fallback_rows", "secs", "rows_per_sec"}.
+        """
+        with self.buffered(batch_size=batch_size) as buf:
+            for row in rows:
+                buf.write(row)
+        return buf.stats
+
+    def buffered(
+        self,
+        *,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        on_result: Optional[Callable[[Any, Optional[Exception]], None]] = None,
+    ) -> "BufferedDocstringWriter":
+        """Buffered writer sharing this writer's validation; use as a context manager."""
+        return BufferedDocstringWriter(self, batch_size=batch_size, on_result=on_result)
+
+
+class BufferedDocstringWriter:
+    """
+    Collects rows and upserts them with one INSERT ... ON CONFLICT DO UPDATE per
+    batch, committing every `batch_size` rows. flush() writes the pending tail;
+    leaving the `with` block flushes and closes the session.
+
+    Queued rows are only dropped once committed. If the batch statement fails,
+    the rows are retried one by one through DocstringWriter.write. Each row's
+    outcome goes to on_result(tag, None | exception) when it is given;
+    otherwise the first failing row's exception propagates and it and the rows
+    after it stay queued.
+    """
+
+    def __init__(
+        self,
+        writer: DocstringWriter,
+        *,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        on_result: Optional[Callable[[Any, Optional[Exception]], None]] = None,
+    ) -> None:
+        self.writer = writer
+        self.batch_size = max(1, int(batch_size))
+        self.on_result = on_result
+        self._pending: List[Tuple[dict[str, Any], Any]] = []
+        self._keys: set[Tuple[Any, ...]] = set()
+        self._session: Optional[Session] = None
+        self._t0 = time.perf_counter()
+        self.rows = 0
+        self.batches = 0
+        self.fallback_rows = 0
+
+    def __enter__(self) -> "BufferedDocstringWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        try:
+            if exc_type is None:
+                self.flush()
+        finally:
+            self.close()
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        secs = time.perf_counter() - self._t0
+        return {
+            "rows": self.rows,
+            "batches": self.batches,
+            "fallback_rows": self.fallback_rows,
+            "secs": round(secs, 3),
+            "rows_per_sec": round(self.rows / secs, 1) if secs > 0 else 0.0,
+        }
+
+    def write(self, row: dict[str, Any], tag: Any = None) -> None:
+        """Validate and queue one record (raises like DocstringWriter.write on bad rows)."""
+        values = self.writer._values(row)
+        key = tuple(values[k] for k in _NATURAL_KEY)
+        if key in self._keys:
+            # Same symbol twice in one batch: ON CONFLICT may touch a row only once per statement
+            self.flush()
+        self._pending.append((values, tag))
+        self._keys.add(key)
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._pending:
+            return
+        if self._session is None:
+            self._session = get_session()
+        session = self._session
+        stmt = _upsert_statement(session)
+        if stmt is not None:
+            try:
+                session.execute(stmt, [values for values, _ in self._pending])
+                session.commit()
+            except Exception:
+                # IntegrityError (unique_key_hash collision on a different natural
+                # key), OperationalError (locked database), ...: retry row by row
+                session.rollback()
+            else:
+                done, self._pending, self._keys = self._pending, [], set()
+                self.rows += len(done)
+                self.batches += 1
+                for _, tag in done:
+                    self._report(tag, None)
+                return
+
+        self.batches += 1
+        pending = self._pending
+        for i, (values, tag) in enumerate(pending):
+            try:
+                self.writer.write(_row_from_values(values))
+            except Exception as e:
+                if self.on_result is None:
+                    self._pending = pending[i:]
+                    self._keys = {tuple(v[k] for k in _NATURAL_KEY) for v, _ in self._pending}
+                    raise
+                self._report(tag, e)
+                continue
+            self.rows += 1
+            self.fallback_rows += 1
+            self._report(tag, None)
+        self._pending, self._keys = [], set()
+
+    def _report(self, tag: Any, error: Optional[Exception]) -> None:
+        if self.on_result is not None:
+            self.on_result(tag, error)
+
+    def close(self) -> None:
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+
+def _upsert_statement(session: Session):
+    """Dialect-specific INSERT ... ON CONFLICT (natural key) DO UPDATE, or None if unsupported."""
+    dialect = session.get_bind().dialect.name
+    if dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    elif dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        return None
+
+    table = IntrospectionIndex.__table__
+    stmt = insert(table)
+    new = stmt.excluded
+    new_desc = func.trim(func.coalesce(new.description, ""))
+    old_desc = func.trim(func.coalesce(table.c.description, ""))
+    # Same rolling-field rules as DocstringWriter._update_existing
+    return stmt.on_conflict_do_update(
+        index_elements=[table.c[k] for k in _NATURAL_KEY],
+        set_={
+            "last_seen_at": new.last_seen_at,
+            "occurrences": func.coalesce(table.c.occurrences, 0) + 1,
+            "description": case(
+                (
+                    (new_desc != "")
+                    & (new_desc != "Bad docstring")
+                    & (func.length(new_desc) > func.length(old_desc)),
+                    new_desc,
+                ),
+                else_=table.c.description,
+            ),
+            "status": case((new.status != "", new.status), else_=table.c.status),
+            "updated_at": func.now(),
+        },
+    )
+
+
+def _row_from_values(values: dict[str, Any]) -> dict[str, Any]:
+    """Inverse of DocstringWriter._values, for the row-by-row fallback."""
+    return {
+        "file": values["filepath"],
+        "filetype": values["symbol_type"],
+        "name": values["name"],
+        "line": values["lineno"],
+        "description": values["description"],
+        "hash": values["unique_key_hash"],
+        "status": values["status"],
+    }
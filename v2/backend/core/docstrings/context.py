@@ -18,16 +18,24 @@ containing:
   - context (optional existing dict to be merged)
 
 All paths are resolved from a provided project_root.
+
+Parsed files (text, line table, AST and a line-number index of def/class
+nodes) are kept in a process-wide LRU keyed by (path, mtime, size), so a batch
+with many symbols per file reads and parses each file once.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from bisect import bisect_left
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import ast
 import io
+import re
+import threading
 
 
 # ------------------------------- I/O ---------------------------------------
@@ -59,16 +67,128 @@ def _resolve_path(project_root: Path, path_or_rel: Optional[str]) -> Optional[Pa
         return p
 
 
+# ----------------------------- File cache ----------------------------------
+
+# Line breaks str.splitlines() honours but the tokenizer (and ast line numbers) do not
+_EXTRA_BREAKS_RX = re.compile("[\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]")
+
+_UNPARSED = object()
+
+
+@dataclass
+class _SourceFile:
+    """One file's text and line table; AST and symbol index are built on first use."""
+    src: str
+    lines: List[str]
+    _tree: Any = field(default=_UNPARSED, repr=False)
+    _starts: List[int] = field(default_factory=list, repr=False)   # sorted def/class header lines
+    _at_line: List[Tuple[ast.AST, str]] = field(default_factory=list, repr=False)
+    _by_name: Dict[str, Tuple[ast.AST, str]] = field(default_factory=dict, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def tree(self, filename: str) -> Optional[ast.AST]:
+        """Parsed module, or None if it does not parse (both cached)."""
+        with self._lock:
+            if self._tree is _UNPARSED:
+                try:
+                    tree: Optional[ast.AST] = ast.parse(self.src, filename=filename)
+                except Exception:
+                    tree = None
+                if tree is not None:
+                    self._index(tree)
+                self._tree = tree
+            return self._tree
+
+    def _index(self, tree: ast.AST) -> None:
+        at_line: Dict[int, Tuple[ast.AST, str]] = {}
+        for n in ast.walk(tree):
+            if isinstance(n, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                kind = "function"
+            elif isinstance(n, ast.ClassDef):
+                kind = "class"
+            else:
+                continue
+            # first in walk order wins, for names and for shared header lines
+            self._by_name.setdefault(n.name, (n, kind))
+            at_line.setdefault(_lineno(n), (n, kind))
+        self._starts = sorted(at_line)
+        self._at_line = [at_line[ln] for ln in self._starts]
+
+    def symbol_named(self, name: str) -> Optional[Tuple[ast.AST, str]]:
+        return self._by_name.get(name)
+
+    def symbol_at_or_after(self, lineno: int) -> Optional[Tuple[ast.AST, str]]:
+        """Closest def/class whose header starts at or after `lineno` (bisect over header lines)."""
+        i = bisect_left(self._starts, lineno)
+        return self._at_line[i] if i < len(self._at_line) else None
+
+    def header_line(self, node: ast.AST) -> Optional[str]:
+        """First source line of `node` from its column on (what ast.get_source_segment starts with)."""
+        if _EXTRA_BREAKS_RX.search(self.src):
+            return None  # line tables disagree; let the caller use ast.get_source_segment
+        ln, col = getattr(node, "lineno", None), getattr(node, "col_offset", None)
+        if not isinstance(ln, int) or not isinstance(col, int) or not (1 <= ln <= len(self.lines)):
+            return None
+        line = self.lines[ln - 1]
+        end_col = getattr(node, "end_col_offset", None)
+        raw = line.encode("utf-8")
+        if getattr(node, "end_lineno", None) == ln and isinstance(end_col, int):
+            return raw[col:end_col].decode("utf-8")
+        return raw[col:].decode("utf-8")
+
+
+class _SourceCache:
+    """Thread-safe LRU of _SourceFile keyed by (path, mtime_ns, size)."""
+
+    def __init__(self, maxsize: int = 256) -> None:
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Tuple[str, int, int], _SourceFile]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, p: Path) -> _SourceFile:
+        """Cached file (raises like _read_text on unreadable files)."""
+        st = p.stat()
+        key = (str(p), st.st_mtime_ns, st.st_size)
+        with self._lock:
+            hit = self._data.get(key)
+            if hit is not None:
+                self._data.move_to_end(key)
+                return hit
+        src = _read_text(p)
+        sf = _SourceFile(src=src, lines=_split_lines(src))
+        with self._lock:
+            self._data[key] = sf
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+        return sf
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+_SOURCES = _SourceCache()
+
+
+def clear_source_cache() -> None:
+    """Drop all cached files (tests, or after bulk rewrites that keep mtime/size)."""
+    _SOURCES.clear()
+
+
 # --------------------------- Python analysis -------------------------------
 
 
-def _node_signature(node: ast.AST, source: str) -> Optional[str]:
+def _node_signature(node: ast.AST, source: str, sf: Optional[_SourceFile] = None) -> Optional[str]:
     """
     Best-effort signature extraction for FunctionDef/AsyncFunctionDef/ClassDef.
     Returns the header line up to the first ':'.
     """
     try:
-        seg = ast.get_source_segment(source, node)
+        # Only the first line is used; take it from the cached line table when possible
+        seg = sf.header_line(node) if sf is not None else None
+        if seg is None:
+            seg = ast.get_source_segment(source, node)
         if not isinstance(seg, str):
             return None
         # take only the header (first line up to ':')
@@ -89,6 +209,7 @@ def _lineno(n: ast.AST) -> int:
 
 
 def _find_target_node(
+    sf: _SourceFile,
     tree: ast.AST,
     lineno: int,
     symbol_name: Optional[str],
@@ -99,33 +220,18 @@ def _find_target_node(
       2) Otherwise, pick the closest def/class starting at or after lineno.
       3) Fallback to the module node.
 
+    Both lookups go through the file's symbol index (dict / bisect), not a tree walk.
+
     Returns: (node, resolved_kind: "function"|"class"|"module")
     """
-    best: Optional[ast.AST] = None
-    best_kind = "module"
-
-    def _is_name_match(n: ast.AST) -> bool:
-        if not symbol_name:
-            return False
-        n_name = getattr(n, "name", None)
-        return isinstance(n_name, str) and n_name == symbol_name
-
-    for n in ast.walk(tree):
-        if isinstance(n, (ast.FunctionDef, ast.AsyncFunctionDef)):
-            if _is_name_match(n):
-                return n, "function"
-            if best is None and _lineno(n) >= max(1, lineno):
-                best = n
-                best_kind = "function"
-        elif isinstance(n, ast.ClassDef):
-            if _is_name_match(n):
-                return n, "class"
-            if best is None and _lineno(n) >= max(1, lineno):
-                best = n
-                best_kind = "class"
-
-    if best is not None:
-        return best, best_kind
+    if symbol_name:
+        hit = sf.symbol_named(symbol_name)
+        if hit is not None:
+            return hit
+
+    hit = sf.symbol_at_or_after(max(1, lineno))
+    if hit is not None:
+        return hit
 
     return tree, "module"
 
@@ -159,14 +265,13 @@ def analyze_python_context(
     """
     opts = options or PythonContextOptions()
     try:
-        src = _read_text(file_path)
+        sf = _SOURCES.get(file_path)
     except Exception:
         return {"signature": None, "context_code": ""}
 
-    lines = _split_lines(src)
-    try:
-        tree = ast.parse(src, filename=str(file_path))
-    except Exception:
+    src, lines = sf.src, sf.lines
+    tree = sf.tree(str(file_path))
+    if tree is None:
         # If it doesn't parse, return a safe slice around the requested lineno
         start = max(0, int(lineno or 1) - 1)
         return {
@@ -174,11 +279,11 @@ def analyze_python_context(
             "context_code": _clip_lines(lines, start, min(len(lines), start + opts.module_max_lines)),
         }
 
-    node, kind = _find_target_node(tree, lineno=max(1, int(lineno or 1)), symbol_name=symbol_name)
+    node, kind = _find_target_node(sf, tree, lineno=max(1, int(lineno or 1)), symbol_name=symbol_name)
 
     # Compute signature and context window
     if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
-        sig = _node_signature(node, src)
+        sig = _node_signature(node, src, sf)
         start = max(0, (_lineno(node) or 1) - 1)
         end = getattr(node, "end_lineno", None)
         if not isinstance(end, int) or end <= start:
@@ -223,7 +328,7 @@ def read_source_window(
         return {"code": "", "start_line": 0, "end_line": 0, "path": str(p) if p else ""}
 
     try:
-        lines = _split_lines(_read_text(p))
+        lines = _SOURCES.get(p).lines
     except Exception:
         return {"code": "", "start_line": 0, "end_line": 0, "path": str(p)}
 
@@ -0,0 +1,175 @@
+#v2\backend\core\introspect\bench_docstrings.py
+"""
+Benchmark: DocStringAnalyzer scan throughput with a fake model.
+
+Generates a synthetic package tree, then scans it with a fake llama model
+(fixed per-call latency, sleeping outside the GIL like llama.cpp inference)
+and an in-memory writer:
+  - sequential: the pre-pipeline loop (parse, summarize and write each file in turn)
+  - pipelined:  traverse_and_write with 1..N model instances
+Reports files/sec and summaries/sec and checks every run writes the same rows.
+
+Run:
+    python -m v2.backend.core.introspect.bench_docstrings [--files 200] [--latency-ms 5] [--instances 4]
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from v2.backend.core.introspect.read_docstrings import DocStringAnalyzer
+
+
+class FakeLlama:
+    """Stands in for llama_cpp.Llama: sleeps `latency` seconds per call, one call at a time."""
+
+    def __init__(self, latency: float, **_: Any) -> None:
+        self.latency = latency
+        self._lock = threading.Lock()
+
+    def __call__(self, prompt: str, max_tokens: int = 64, stop: Any = None) -> Dict[str, Any]:
+        with self._lock:
+            time.sleep(self.latency)
+        body = prompt.split('"""')[1] if '"""' in prompt else prompt
+        return {"choices": [{"text": " " + " ".join(body.split()[:8])}]}
+
+
+class _SinkBatch:
+    def __init__(self, rows: List[Dict[str, Any]]) -> None:
+        self.rows = rows
+        self.stats = {"rows": 0, "batches": 0, "fallback_rows": 0, "secs": 0.0, "rows_per_sec": 0.0}
+
+    def __enter__(self) -> "_SinkBatch":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        return None
+
+    def write(self, row: Dict[str, Any]) -> None:
+        self.rows.append(row)
+        self.stats["rows"] += 1
+
+
+class SinkWriter:
+    """In-memory stand-in for DocstringWriter (write + buffered)."""
+
+    def __init__(self) -> None:
+        self.rows: List[Dict[str, Any]] = []
+
+    def write(self, row: Dict[str, Any]) -> None:
+        self.rows.append(row)
+
+    def buffered(self, *, batch_size: int = 500) -> _SinkBatch:
+        return _SinkBatch(self.rows)
+
+
+def make_tree(root: Path, n_files: int) -> None:
+    for i in range(n_files):
+        pkg = root / f"pkg{i % 20:02d}"
+        pkg.mkdir(parents=True, exist_ok=True)
+        funcs = "\n".join(
+            f'''
+def func_{i}_{j}(a, b):
+    """Combine a and b for step {j} of module {i}; returns the combined value after validation."""
+    return a + b
+'''
+            for j in range(4)
+        )
+        (pkg / f"mod_{i}.py").write_text(
+            f'''"""Synthetic module {i}: helpers used by the docstring benchmark to exercise the scanner."""
+
+
+class Thing{i}:
+    """A thing that holds state for module {i} and exposes a couple of helper methods."""
+
+    def run(self):
+        """Run the thing for module {i}, updating internal state and returning nothing at all."""
+        return None
+
+    def short(self):
+        """Too short."""
+{funcs}
+''',
+            encoding="utf-8",
+        )
+
+
+def _analyzer(root: Path, latency: float, **kw: Any) -> Tuple[DocStringAnalyzer, SinkWriter]:
+    sink = SinkWriter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        an = DocStringAnalyzer(
+            root_path=root,
+            model_path=root / "fake.gguf",
+            model_factory=lambda **k: FakeLlama(latency, **k),
+            writer=sink,
+            **kw,
+        )
+    return an, sink
+
+
+def sequential_scan(an: DocStringAnalyzer, sink: SinkWriter) -> Dict[str, int]:
+    """The scan loop before pipelining: parse, summarize and write one file at a time."""
+    files = llm = 0
+    for full_path, _rel in an._iter_py_files():
+        files += 1
+        for entry in an.extract_docstrings(full_path):
+            summary = entry.get("summary") or ""
+            if "Duplicate" in summary:
+                continue
+            if "Bad docstring" not in summary and "LLM failed" not in summary:
+                llm += 1
+            sink.write(an._to_writer_row(entry))
+    return {"total_files": files, "total_llm": llm}
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--files", type=int, default=200)
+    ap.add_argument("--latency-ms", type=float, default=5.0)
+    ap.add_argument("--instances", type=int, default=4)
+    ap.add_argument("--batch-size", type=int, default=8)
+    args = ap.parse_args()
+    latency = args.latency_ms / 1000.0
+
+    with tempfile.TemporaryDirectory() as td:
+        root = Path(td)
+        make_tree(root, args.files)
+        runs: List[Tuple[str, float, Dict[str, Any], List[Dict[str, Any]]]] = []
+
+        an, sink = _analyzer(root, latency)
+        t0 = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            stats = sequential_scan(an, sink)
+        runs.append(("sequential", time.perf_counter() - t0, stats, sink.rows))
+
+        n = 1
+        while n <= args.instances:
+            an, sink = _analyzer(root, latency, instances=n, batch_size=args.batch_size)
+            t0 = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                stats = an.traverse_and_write()
+            runs.append((f"pipelined x{n}", time.perf_counter() - t0, stats, sink.rows))
+            n *= 2
+
+    print(f"[bench_docstrings] {args.files} files, fake model latency {args.latency_ms:.1f} ms/call")
+    base_rows = runs[0][3]
+    ok = True
+    for name, secs, stats, rows in runs:
+        same = rows == base_rows
+        ok = ok and same
+        print(
+            f"  {name:<14} {secs:>7.2f}s  files/sec={stats['total_files'] / secs:>8.1f}  "
+            f"summaries/sec={stats['total_llm'] / secs:>8.1f}  rows={len(rows)} same={same}"
+        )
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,129 @@
+#v2\backend\core\introspect\bench_fetch.py
+"""
+Benchmark: introspect.fetch.v1 latency with and without the engine/table cache.
+
+Builds a SQLite introspection_index (scripts/sqlite_sql_schemas/043 schema) with
+N rows, ~10% of them 'todo', and times one fetch of max_rows items with both
+providers:
+  - uncached + diagnostics: the previous behaviour (new engine, reflection,
+    count(*) and GROUP BY status on every call), emulated by clearing the cache
+  - cached + diagnostics:   shared engine/table, diagnostics still requested
+  - cached:                 the default hot path (one query)
+Reports the median of --repeat calls per mode and checks the items match, then
+streams every 'todo' row through iter_fetch_pages (keyset pages) and checks the
+count against SQL.
+
+Run:
+    python -m v2.backend.core.introspect.bench_fetch [--rows 10000,1000000] [--max-rows 50]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sqlite3
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+from v2.backend.core.db.access import engines
+from v2.backend.core.introspect.providers import fetch_v1 as introspect_fetch
+from v2.backend.core.introspect.providers import iter_fetch_pages
+from v2.backend.core.prompt_pipeline.executor.sources import fetch_v1 as sources_fetch
+
+SCHEMA = Path(__file__).resolve().parents[4] / "scripts" / "sqlite_sql_schemas" / "043_create_introspection_index.sql"
+
+
+def make_db(path: Path, n_rows: int) -> None:
+    conn = sqlite3.connect(str(path))
+    conn.executescript(SCHEMA.read_text(encoding="utf-8"))
+    statuses = ("active",) * 8 + ("todo", "resolved")
+    batch: List[tuple] = []
+    for i in range(n_rows):
+        batch.append((
+            f"v2/pkg{i % 200:03d}/module_{i // 200:05d}.py",
+            ("function", "class", "method", "module")[i % 4],
+            f"symbol_{i}",
+            i % 400,
+            f"Docstring issue {i}",
+            f"{i:040x}",
+            statuses[i % 10],
+        ))
+        if len(batch) == 50_000:
+            conn.executemany(
+                "INSERT INTO introspection_index (filepath, symbol_type, name, lineno, description, unique_key_hash, status)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                batch,
+            )
+            batch.clear()
+    if batch:
+        conn.executemany(
+            "INSERT INTO introspection_index (filepath, symbol_type, name, lineno, description, unique_key_hash, status)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?)",
+            batch,
+        )
+    conn.commit()
+    conn.close()
+
+
+def median_ms(fn: Callable[[], Any], repeat: int, before: Callable[[], None] = lambda: None) -> float:
+    times = []
+    for _ in range(repeat):
+        before()
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+    return statistics.median(times) * 1000
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--rows", default="10000,1000000")
+    ap.add_argument("--max-rows", type=int, default=50)
+    ap.add_argument("--repeat", type=int, default=7)
+    args = ap.parse_args()
+
+    ok = True
+    with tempfile.TemporaryDirectory() as td:
+        for n in [int(x) for x in args.rows.split(",")]:
+            db = Path(td) / f"bench_{n}.db"
+            make_db(db, n)
+            url = f"sqlite:///{db.as_posix()}"
+            base: Dict[str, Any] = {"sqlalchemy_url": url, "sqlalchemy_table": "introspection_index",
+                                    "status": "todo", "max_rows": args.max_rows}
+            print(f"[bench_fetch] {n} rows, max_rows={args.max_rows}")
+
+            for label, call in (
+                ("introspect.fetch (introspect/providers)", lambda p: introspect_fetch(p)[0]["meta"]["items"]),
+                ("introspect.fetch (executor/sources)", lambda p: sources_fetch(p)["records"]),
+            ):
+                diag = dict(base, diagnostics=True)
+                t_old = median_ms(lambda: call(diag), args.repeat, before=engines.clear)
+                t_diag = median_ms(lambda: call(diag), args.repeat)
+                t_new = median_ms(lambda: call(base), args.repeat)
+                engines.clear()
+                same = call(diag) == call(base)
+                ok = ok and same
+                print(f"  {label}")
+                print(f"    uncached + diagnostics  {t_old:>8.2f} ms")
+                print(f"    cached + diagnostics    {t_diag:>8.2f} ms")
+                print(f"    cached                  {t_new:>8.2f} ms   speedup={t_old / t_new if t_new else 0:6.1f}x  same={same}")
+
+            with sqlite3.connect(str(db)) as conn:
+                expected = conn.execute("SELECT count(*) FROM introspection_index WHERE status = 'todo'").fetchone()[0]
+            t0 = time.perf_counter()
+            pages = streamed = 0
+            for page in iter_fetch_pages(dict(base, max_rows=1000)):
+                pages += 1
+                streamed += len(page)
+            t_stream = (time.perf_counter() - t0) * 1000
+            ok = ok and streamed == expected
+            print(f"  stream all 'todo' rows: {streamed} rows in {pages} keyset pages, {t_stream:.0f} ms  "
+                  f"complete={streamed == expected}")
+            engines.clear()
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,114 @@
+# File: v2/backend/core/introspect/bench_fts.py
+"""
+Benchmark: retriever.enrich.v1 related-symbol lookups over introspection_index_fts.
+
+Builds a SQLite introspection_index with N rows whose names/descriptions draw
+from a Zipf-distributed vocabulary (so some terms are everywhere and most are
+rare), applies the 053 FTS migration (which rebuilds the index), then attaches
+top-5 related symbols to --items fetched records:
+  - naive: one connection + one unpruned BM25 query per item (timed on a sample)
+  - enrich cold: enrich_v1(related_top_n=5), empty LRUs
+  - enrich warm: same records again (LRU hits)
+and reports how many of the naive top-5 hits the pruned queries still return.
+
+Run:
+    python -m v2.backend.core.introspect.bench_fts [--rows 100000] [--items 200]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sqlite3
+import tempfile
+import time
+from pathlib import Path
+
+from v2.backend.core.db.access import engines
+from v2.backend.core.introspect import fts
+from v2.backend.core.introspect.providers import fetch_v1
+from v2.backend.core.prompt_pipeline.executor.providers import enrich_v1
+
+SCHEMAS = Path(__file__).resolve().parents[4] / "scripts" / "sqlite_sql_schemas"
+
+
+def make_db(path: Path, n_rows: int, rng: random.Random) -> None:
+    vocab = [f"w{i}" for i in range(20_000)]
+    weights = [1.0 / (i + 1) for i in range(len(vocab))]
+    conn = sqlite3.connect(str(path))
+    conn.executescript((SCHEMAS / "043_create_introspection_index.sql").read_text(encoding="utf-8"))
+    rows = []
+    for i in range(n_rows):
+        words = rng.choices(vocab, weights, k=10)
+        rows.append((
+            f"v2/pkg{i % 200:03d}/module_{i // 200:05d}.py",
+            ("function", "class", "method", "module")[i % 4],
+            "_".join(words[:2]) + f"_{i}",
+            i % 400,
+            "Docstring issue: " + " ".join(words[2:]),
+            f"{i:040x}",
+            "todo" if i % 10 == 0 else "active",
+        ))
+    conn.executemany(
+        "INSERT INTO introspection_index (filepath, symbol_type, name, lineno, description, unique_key_hash, status)"
+        " VALUES (?, ?, ?, ?, ?, ?, ?)",
+        rows,
+    )
+    conn.commit()
+    conn.close()
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--rows", type=int, default=100_000)
+    ap.add_argument("--items", type=int, default=200)
+    ap.add_argument("--naive-sample", type=int, default=20)
+    args = ap.parse_args()
+    rng = random.Random(0)
+
+    with tempfile.TemporaryDirectory() as td:
+        db = Path(td) / "fts.db"
+        make_db(db, args.rows, rng)
+        conn = sqlite3.connect(str(db))
+        t0 = time.perf_counter()
+        conn.executescript((SCHEMAS / "053_create_introspection_index_fts.sql").read_text(encoding="utf-8"))
+        t_migrate = time.perf_counter() - t0
+        conn.close()
+        url = f"sqlite:///{db.as_posix()}"
+        records = fetch_v1({"sqlalchemy_url": url, "max_rows": args.items})[0]["meta"]["items"]
+        base = {"sqlalchemy_url": url, "records": records, "root": td, "related_top_n": 5}
+
+        sample = records[:args.naive_sample]
+        t0 = time.perf_counter()
+        naive = {}
+        for r in sample:
+            c = sqlite3.connect(str(db))
+            expr = fts.match_expr(fts.query_terms(r["name"], r["description"]))
+            naive[r["id"]] = [row[0] for row in c.execute(fts._SQL, (expr, 6)).fetchall() if row[0] != r["id"]][:5]
+            c.close()
+        t_naive = (time.perf_counter() - t0) / len(sample) * len(records)
+
+        fts.clear_cache()
+        t0 = time.perf_counter()
+        cold = enrich_v1(dict(base))
+        t_cold = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        warm = enrich_v1(dict(base))
+        t_warm = time.perf_counter() - t0
+
+        got = {r["id"]: [x["id"] for x in it["context"].get("related", [])] for r, it in zip(records, cold["items"])}
+        with_related = sum(1 for v in got.values() if v)
+        overlap = sum(len(set(naive[i]) & set(got[i])) for i in naive) / max(1, sum(len(v) for v in naive.values()))
+        ok = "related_error" not in cold and with_related > 0
+        print(f"[bench_fts] {args.rows} rows, {len(records)} items, top 5")
+        print(f"  053 migrate + rebuild     {t_migrate * 1000:>9.1f} ms")
+        print(f"  naive (extrapolated)      {t_naive * 1000:>9.1f} ms")
+        print(f"  enrich cold               {t_cold * 1000:>9.1f} ms   speedup={t_naive / t_cold:7.1f}x  {cold['related_stats']}")
+        print(f"  enrich warm (LRU)         {t_warm * 1000:>9.1f} ms   {warm['related_stats']}")
+        print(f"  items with related={with_related}/{len(records)}  overlap with unpruned top-5={overlap:.2f}")
+        engines.clear()
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
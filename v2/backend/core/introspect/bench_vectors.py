@@ -0,0 +1,138 @@
+# File: v2/backend/core/introspect/bench_vectors.py
+"""
+Benchmark: top-k cosine search over introspection embeddings.
+
+Part 1 (DB, --db-vectors): fills a SQLite introspection_index_embeddings table
+with packed float32 rows and times vectors.load_index cold (table → .npy),
+warm (same process) and from the memory-mapped cache (fresh process state),
+then runs retriever.similar.v1 end to end.
+
+Part 2 (search, --sizes): clustered synthetic vectors at each size, 100 queries:
+  - naive:  one query at a time, full matvec + full argsort
+  - flat:   VectorIndex.search, batched block matmul + argpartition (exact)
+  - ivf:    IVF build time, then search with --nprobe lists; recall@k vs flat
+
+Run:
+    python -m v2.backend.core.introspect.bench_vectors [--sizes 100000,1000000] [--dim 128]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sqlite3
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from v2.backend.core.db.access import engines
+from v2.backend.core.introspect import vectors
+from v2.backend.core.prompt_pipeline.executor.providers import similar_v1
+
+SCHEMAS = Path(__file__).resolve().parents[4] / "scripts" / "sqlite_sql_schemas"
+
+
+def clustered(n: int, dim: int, rng: "np.random.Generator", n_centers: int = 1000) -> "np.ndarray":
+    centers = rng.standard_normal((n_centers, dim), dtype=np.float32)
+    out = np.empty((n, dim), dtype=np.float32)
+    for start in range(0, n, 100_000):
+        m = min(100_000, n - start)
+        out[start:start + m] = centers[rng.integers(0, n_centers, m)] + 0.5 * rng.standard_normal((m, dim), dtype=np.float32)
+    return out
+
+
+def timed(fn):
+    t0 = time.perf_counter()
+    res = fn()
+    return time.perf_counter() - t0, res
+
+
+def bench_db(td: Path, n: int, dim: int, rng: "np.random.Generator") -> bool:
+    db = td / "vectors.db"
+    conn = sqlite3.connect(str(db))
+    for name in ("043_create_introspection_index.sql", "054_create_vector_index.sql"):
+        conn.executescript((SCHEMAS / name).read_text(encoding="utf-8"))
+    data = clustered(n, dim, rng)
+    conn.executemany(
+        "INSERT INTO introspection_index_embeddings (item_id, model, dim, embedding) VALUES (?, 'bench', ?, ?)",
+        ((i + 1, dim, data[i].tobytes()) for i in range(n)),
+    )
+    conn.commit()
+    conn.close()
+    url = f"sqlite:///{db.as_posix()}"
+
+    t_cold, idx = timed(lambda: vectors.load_index(url, "bench"))
+    time.sleep(vectors.STAMP_TTL)
+    t_warm, _ = timed(lambda: vectors.load_index(url, "bench"))
+    vectors.clear_cache()
+    t_mmap, idx2 = timed(lambda: vectors.load_index(url, "bench"))
+    payload = {"sqlalchemy_url": url, "model": "bench", "query_item_ids": [1, 2, 3], "top_k": 5}
+    t_cap, res = timed(lambda: similar_v1(dict(payload)))
+    ok = (
+        isinstance(idx2.matrix, np.memmap)
+        and res.get("count") == 3
+        and all(m["item_id"] != r["query"] for r in res["results"] for m in r["matches"])
+    )
+    print(f"[bench_vectors] DB load, {n} x {dim} float32 ({n * dim * 4 / 2**20:.0f} MiB)")
+    print(f"  cold (table -> .npy)      {t_cold * 1000:>9.1f} ms")
+    print(f"  warm (stamp check)        {t_warm * 1000:>9.1f} ms")
+    print(f"  mmap cache (new process)  {t_mmap * 1000:>9.1f} ms   memmap={isinstance(idx2.matrix, np.memmap)}")
+    print(f"  retriever.similar.v1      {t_cap * 1000:>9.1f} ms   3 item queries, ok={ok}")
+    engines.clear()
+    vectors.clear_cache()
+    return ok
+
+
+def bench_search(n: int, dim: int, n_queries: int, k: int, nprobe: int, rng: "np.random.Generator") -> bool:
+    data = clustered(n, dim, rng)
+    idx = vectors.VectorIndex.from_arrays(np.arange(1, n + 1), data, model="bench")
+    del data
+    queries = idx.matrix[rng.choice(n, n_queries, replace=False)] + 0.05 * rng.standard_normal((n_queries, dim), dtype=np.float32)
+
+    def naive():
+        out = []
+        for q in queries:
+            q = q / np.linalg.norm(q)
+            s = idx.matrix @ q
+            out.append(idx.ids[np.argsort(-s)[:k]])
+        return np.array(out)
+
+    t_naive, ids_naive = timed(naive)
+    t_flat, (ids_flat, _) = timed(lambda: idx.search(queries, k))
+    t_build, ivf = timed(lambda: idx.ensure_ivf())
+    t_ivf, (ids_ivf, _) = timed(lambda: idx.search(queries, k, nprobe=nprobe))
+
+    exact = all(set(a) == set(b) for a, b in zip(ids_naive.tolist(), ids_flat.tolist()))
+    recall = np.mean([len(set(a) & set(b)) / k for a, b in zip(ids_flat.tolist(), ids_ivf.tolist())])
+    per = lambda t: t / n_queries * 1000
+    print(f"[bench_vectors] search {n} x {dim}, {n_queries} queries, k={k}")
+    print(f"  naive per-query argsort   {per(t_naive):>9.2f} ms/query")
+    print(f"  flat batched              {per(t_flat):>9.2f} ms/query   speedup={t_naive / t_flat:6.1f}x  exact={exact}")
+    print(f"  ivf build (nlist={ivf.nlist})    {t_build * 1000:>9.1f} ms")
+    print(f"  ivf nprobe={nprobe:<3}            {per(t_ivf):>9.2f} ms/query   speedup={t_naive / t_ivf:6.1f}x  recall@{k}={recall:.3f}")
+    return exact
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--sizes", default="100000,1000000")
+    ap.add_argument("--db-vectors", type=int, default=100_000)
+    ap.add_argument("--dim", type=int, default=128)
+    ap.add_argument("--queries", type=int, default=100)
+    ap.add_argument("--k", type=int, default=10)
+    ap.add_argument("--nprobe", type=int, default=16)
+    args = ap.parse_args()
+    rng = np.random.default_rng(0)
+
+    ok = True
+    with tempfile.TemporaryDirectory() as td:
+        if args.db_vectors:
+            ok = bench_db(Path(td), args.db_vectors, args.dim, rng) and ok
+    for n in [int(x) for x in args.sizes.split(",") if x]:
+        ok = bench_search(n, args.dim, args.queries, args.k, args.nprobe, rng) and ok
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
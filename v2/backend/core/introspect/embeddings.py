@@ -0,0 +1,245 @@
+# File: v2/backend/core/introspect/embeddings.py
+"""
+Batch producer for introspection_index_embeddings.
+
+Streams introspection_index rows in keyset pages (id > cursor, ascending),
+skips rows whose stored embedding already covers the current text (the row's
+`note` holds "sha1:<digest of the embedded text>"), embeds the rest in batches
+through a pluggable embedder and writes packed float32 BLOBs with executemany,
+one transaction per chunk. Re-running is cheap and resumes where a previous run
+stopped: committed chunks are skipped by their digests, and a bounded run
+(max_items) hands back next_cursor.
+
+Embedders are callables texts -> vectors. The default HashingEmbedder is
+deterministic and dependency-free (signed feature hashing of word tokens and
+character trigrams), so the pipeline is testable without a model; any
+"module:function" target can be plugged in instead.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib
+import math
+import re
+import sys
+import time
+from array import array
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from sqlalchemy import text
+
+from v2.backend.core.db.access import engines
+
+EMBED_TABLE = "introspection_index_embeddings"
+INDEX_TABLE = "introspection_index"
+
+Embedder = Callable[[List[str]], Sequence[Sequence[float]]]
+
+_TOKEN_RX = re.compile(r"[A-Za-z0-9]+")
+
+
+# ------------------------------- embedders -----------------------------------
+
+@dataclass
+class HashingEmbedder:
+    """
+    Deterministic bag-of-features embedder: each lower-cased word and character
+    trigram is hashed (blake2b, so stable across processes) to a signed bucket.
+    Rows are L2-normalised. Similar text → similar vectors, with no model.
+    """
+
+    dim: int = 256
+    trigrams: bool = True
+
+    @property
+    def model(self) -> str:
+        return f"hashing-{self.dim}"
+
+    def _features(self, s: str) -> List[str]:
+        words = [w.lower() for w in _TOKEN_RX.findall(s)]
+        feats = list(words)
+        if self.trigrams:
+            for w in words:
+                padded = f"#{w}#"
+                feats.extend(padded[i:i + 3] for i in range(len(padded) - 2))
+        return feats
+
+    def __call__(self, texts: List[str]) -> List[List[float]]:
+        out: List[List[float]] = []
+        for s in texts:
+            vec = [0.0] * self.dim
+            for feat in self._features(s):
+                h = int.from_bytes(hashlib.blake2b(feat.encode("utf-8"), digest_size=8).digest(), "little")
+                vec[h % self.dim] += 1.0 if (h >> 63) else -1.0
+            norm = math.sqrt(sum(v * v for v in vec)) or 1.0
+            out.append([v / norm for v in vec])
+        return out
+
+
+def resolve_embedder(spec: Any = None, *, dim: int = 256) -> Embedder:
+    """None/"hashing" → HashingEmbedder(dim); a callable → itself; "pkg.mod:func" → imported."""
+    if spec is None or spec == "hashing":
+        return HashingEmbedder(dim=dim)
+    if callable(spec):
+        return spec
+    if isinstance(spec, str) and ":" in spec:
+        mod_name, attr = spec.split(":", 1)
+        fn = getattr(importlib.import_module(mod_name), attr)
+        if not callable(fn):
+            raise TypeError(f"embedder target {spec!r} is not callable")
+        return fn
+    raise ValueError(f"unknown embedder {spec!r}")
+
+
+def pack_f32(vec: Sequence[float]) -> bytes:
+    """Packed little-endian float32 (the BLOB layout vectors.py reads)."""
+    arr = array("f", vec)
+    if sys.byteorder != "little":
+        arr.byteswap()
+    return arr.tobytes()
+
+
+def embed_text(row: Dict[str, Any]) -> str:
+    """Text embedded for one introspection_index row."""
+    parts = [row.get("symbol_type") or "", row.get("name") or "", row.get("filepath") or "", row.get("description") or ""]
+    return "\n".join(p for p in parts if p)
+
+
+def text_note(s: str) -> str:
+    return "sha1:" + hashlib.sha1(s.encode("utf-8")).hexdigest()
+
+
+# ------------------------------- ingestion -----------------------------------
+
+@dataclass
+class EmbedStats:
+    model: str
+    dim: int = 0
+    scanned: int = 0
+    embedded: int = 0
+    unchanged: int = 0
+    empty: int = 0
+    batches: int = 0
+    commits: int = 0
+    secs: float = 0.0
+    embed_secs: float = 0.0
+    next_cursor: Optional[int] = None
+
+    def as_dict(self) -> Dict[str, Any]:
+        d = dict(self.__dict__)
+        d["vectors_per_sec"] = round(self.embedded / self.secs, 1) if self.secs else 0.0
+        return d
+
+
+def embed_missing(
+    url: str,
+    *,
+    model: str,
+    embedder: Embedder,
+    cursor: Optional[int] = None,
+    page_size: int = 1000,
+    batch_size: int = 64,
+    commit_every: int = 1024,
+    max_items: Optional[int] = None,
+) -> EmbedStats:
+    """
+    Embed every introspection_index row (id > cursor) whose text has no current
+    embedding for 'model'. max_items bounds the rows embedded in this call;
+    stats.next_cursor is set when it stopped early (feed it back to resume).
+    """
+    engine = engines.get_engine(url)
+    stats = EmbedStats(model=model)
+    t0 = time.perf_counter()
+    pending: List[Dict[str, Any]] = []  # rows to embed: {id, text, note}
+    ready: List[Dict[str, Any]] = []    # rows to write: {item_id, model, dim, embedding, note}
+    last_id = cursor if cursor is not None else -1
+
+    page_sql = text(
+        f"SELECT i.id, i.filepath, i.symbol_type, i.name, i.description, e.note"
+        f" FROM {INDEX_TABLE} i"
+        f" LEFT JOIN {EMBED_TABLE} e ON e.item_id = i.id AND e.model = :model"
+        f" WHERE i.id > :cursor ORDER BY i.id LIMIT :limit"
+    )
+
+    def flush_embed() -> None:
+        if not pending:
+            return
+        t = time.perf_counter()
+        vecs = embedder([p["text"] for p in pending])
+        stats.embed_secs += time.perf_counter() - t
+        stats.batches += 1
+        if len(vecs) != len(pending):
+            raise ValueError(f"embedder returned {len(vecs)} vectors for {len(pending)} texts")
+        for p, vec in zip(pending, vecs):
+            stats.dim = stats.dim or len(vec)
+            ready.append({"item_id": p["id"], "model": model, "dim": len(vec), "embedding": pack_f32(vec), "note": p["note"]})
+        pending.clear()
+
+    def flush_write() -> None:
+        if not ready:
+            return
+        with engine.begin() as conn:
+            # Replace rather than update in place: the new rows get fresh ids, which
+            # moves the vectors.py cache stamp even within one created_at second.
+            conn.execute(
+                text(f"DELETE FROM {EMBED_TABLE} WHERE model = :model AND item_id = :item_id"),
+                [{"model": model, "item_id": r["item_id"]} for r in ready],
+            )
+            conn.execute(
+                text(
+                    f"INSERT INTO {EMBED_TABLE} (item_id, model, dim, embedding, note)"
+                    f" VALUES (:item_id, :model, :dim, :embedding, :note)"
+                ),
+                ready,
+            )
+        stats.embedded += len(ready)
+        stats.commits += 1
+        ready.clear()
+
+    done = False
+    while not done:
+        with engine.connect() as conn:
+            rows = conn.execute(page_sql, {"model": model, "cursor": last_id, "limit": page_size}).mappings().all()
+        if not rows:
+            break
+        for r in rows:
+            stats.scanned += 1
+            last_id = r["id"]
+            s = embed_text(r)
+            if not s.strip():
+                stats.empty += 1
+                continue
+            note = text_note(s)
+            if r["note"] == note:
+                stats.unchanged += 1
+                continue
+            pending.append({"id": r["id"], "text": s, "note": note})
+            if len(pending) >= batch_size:
+                flush_embed()
+            if len(ready) >= commit_every:
+                flush_write()
+            if max_items is not None and stats.embedded + len(ready) + len(pending) >= max_items:
+                stats.next_cursor = last_id
+                done = True
+                break
+        if len(rows) < page_size:
+            break
+
+    flush_embed()
+    flush_write()
+    stats.secs = time.perf_counter() - t0
+    return stats
+
+
+__all__ = [
+    "EmbedStats",
+    "Embedder",
+    "HashingEmbedder",
+    "embed_missing",
+    "embed_text",
+    "pack_f32",
+    "resolve_embedder",
+    "text_note",
+]
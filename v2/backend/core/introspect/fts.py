@@ -0,0 +1,208 @@
+# File: v2/backend/core/introspect/fts.py
+"""
+BM25 "related symbols" lookups over the introspection_index_fts mirror
+(scripts/sqlite_sql_schemas/053_create_introspection_index_fts.sql; SQLite FTS5).
+
+Each item's name + description become an OR query over the name/description
+columns (names are split on snake_case/camelCase). Terms found in more than
+max_df of the rows are dropped first: they add almost nothing to BM25 but make
+FTS5 score most of the table (~0.2 s per query at 100k rows). Document
+frequencies come from an fts5vocab view and are memoised per term.
+
+All queries of a batch run through a single DBAPI cursor with one SQL string,
+so SQLite prepares the statement once and re-binds it. Results are memoised per
+(url, query, limit); both memos are bounded in-process LRUs (many items share
+names and boilerplate descriptions). clear_cache() drops them, e.g. after a
+re-index.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from v2.backend.core.db.access import engines
+
+FTS_TABLE = "introspection_index_fts"
+INDEX_TABLE = "introspection_index"
+
+VOCAB_TABLE = "temp.introspection_index_fts_vocab"
+
+MAX_TERMS = 16
+MAX_DF = 0.05
+CACHE_SIZE = 4096
+TERM_CACHE_SIZE = 65536
+
+# bm25() weights follow the FTS column order in 053: filepath, name, symbol_type,
+# description, ag_tag, route_method, route_path, relation_type, target_symbol.
+_BM25_WEIGHTS = "0.0, 4.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 0.0"
+
+_SQL = (
+    f"SELECT i.id, i.filepath, i.symbol_type, i.name, i.lineno,"
+    f" bm25({FTS_TABLE}, {_BM25_WEIGHTS}) AS score"
+    f" FROM {FTS_TABLE} JOIN {INDEX_TABLE} i ON i.id = {FTS_TABLE}.rowid"
+    f" WHERE {FTS_TABLE} MATCH ? ORDER BY score LIMIT ?"
+)
+
+_WORD_RX = re.compile(r"[A-Za-z0-9]+")
+_CAMEL_RX = re.compile(r"[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+|[0-9]+")
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from has in is it its of on or that the this to was were will with"
+    " def self cls none true false return returns".split()
+)
+
+_lock = threading.Lock()
+
+
+class _LRU:
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self._d: "OrderedDict[Any, Any]" = OrderedDict()
+
+    def get(self, key: Any) -> Any:
+        with _lock:
+            hit = self._d.get(key)
+            if hit is not None:
+                self._d.move_to_end(key)
+            return hit
+
+    def put(self, key: Any, value: Any) -> None:
+        with _lock:
+            self._d[key] = value
+            self._d.move_to_end(key)
+            while len(self._d) > self.size:
+                self._d.popitem(last=False)
+
+    def clear(self) -> None:
+        with _lock:
+            self._d.clear()
+
+
+_results = _LRU(CACHE_SIZE)  # (url, match expr, limit) -> rows
+_doc_freq = _LRU(TERM_CACHE_SIZE)  # (url, term) -> documents containing term
+
+
+def query_terms(name: Optional[str], description: Optional[str], max_terms: int = MAX_TERMS) -> List[str]:
+    """Distinct lower-cased search terms, name parts first."""
+    terms: List[str] = []
+    seen = set()
+
+    def add(tok: str) -> None:
+        t = tok.lower()
+        if len(t) < 2 or t in _STOPWORDS or t in seen:
+            return
+        seen.add(t)
+        terms.append(t)
+
+    for word in _WORD_RX.findall(name or ""):
+        add(word)
+        for part in _CAMEL_RX.findall(word):
+            add(part)
+    for word in _WORD_RX.findall(description or ""):
+        add(word)
+    return terms[:max_terms]
+
+
+def match_expr(terms: Sequence[str]) -> str:
+    """FTS5 MATCH expression: any term, in the name or description column."""
+    if not terms:
+        return ""
+    return "{name description} : (" + " OR ".join(f'"{t}"' for t in terms) + ")"
+
+
+def clear_cache() -> None:
+    _results.clear()
+    _doc_freq.clear()
+
+
+def _doc_freqs(cur: Any, url: str, terms: Iterable[str]) -> Dict[str, int]:
+    """Document frequency per term (0 when absent), via the fts5vocab 'row' view."""
+    out: Dict[str, int] = {}
+    missing: List[str] = []
+    for t in terms:
+        df = _doc_freq.get((url, t))
+        if df is None:
+            missing.append(t)
+        else:
+            out[t] = df
+    if missing:
+        cur.execute(f"CREATE VIRTUAL TABLE IF NOT EXISTS {VOCAB_TABLE} USING fts5vocab(main, {FTS_TABLE}, 'row')")
+        found: Dict[str, int] = {}
+        for i in range(0, len(missing), 500):
+            chunk = missing[i:i + 500]
+            marks = ", ".join("?" * len(chunk))
+            found.update(cur.execute(f"SELECT term, doc FROM {VOCAB_TABLE} WHERE term IN ({marks})", chunk).fetchall())
+        for t in missing:
+            out[t] = int(found.get(t, 0))
+            _doc_freq.put((url, t), out[t])
+    return out
+
+
+def related_batch(
+    url: str,
+    queries: Iterable[Tuple[Any, Optional[str], Optional[str]]],
+    top_n: int = 5,
+    max_df: float = MAX_DF,
+    stats: Optional[Dict[str, int]] = None,
+) -> Dict[Any, List[Dict[str, Any]]]:
+    """
+    queries: (item_id, name, description) triples. Returns item_id -> up to
+    top_n related rows {id, file, filetype, line, name, score}, best first
+    (score = -bm25, higher is better), never including the item itself.
+    Terms in more than max_df (fraction of rows) are ignored; an item left
+    with no terms gets no related rows.
+    stats (optional) receives queries / cache_hits / executed / terms_dropped.
+    """
+    counts = {"queries": 0, "cache_hits": 0, "executed": 0, "terms_dropped": 0}
+    limit = top_n + 1  # room to drop the item itself
+    item_terms = [(item_id, query_terms(name, description)) for item_id, name, description in queries]
+    resolved: Dict[str, List[Dict[str, Any]]] = {}
+    planned: List[Tuple[Any, str]] = []
+
+    raw = engines.get_engine(url).raw_connection()
+    try:
+        cur = raw.cursor()
+        try:
+            n_rows = cur.execute(f"SELECT max(id) FROM {INDEX_TABLE}").fetchone()[0] or 0
+            df = _doc_freqs(cur, url, {t for _, terms in item_terms for t in terms})
+            cutoff = max(1.0, max_df * n_rows)
+            for item_id, terms in item_terms:
+                kept = [t for t in terms if 0 < df[t] <= cutoff]
+                counts["terms_dropped"] += len(terms) - len(kept)
+                planned.append((item_id, match_expr(kept)))
+
+            for _, expr in planned:
+                if not expr:
+                    continue
+                counts["queries"] += 1
+                if expr in resolved:
+                    counts["cache_hits"] += 1
+                    continue
+                hit = _results.get((url, expr, limit))
+                if hit is None:
+                    hit = [
+                        {"id": r[0], "file": r[1], "filetype": r[2], "name": r[3], "line": r[4], "score": -float(r[5])}
+                        for r in cur.execute(_SQL, (expr, limit)).fetchall()
+                    ]
+                    counts["executed"] += 1
+                    _results.put((url, expr, limit), hit)
+                else:
+                    counts["cache_hits"] += 1
+                resolved[expr] = hit
+        finally:
+            cur.close()
+    finally:
+        raw.close()
+
+    out: Dict[Any, List[Dict[str, Any]]] = {}
+    for item_id, expr in planned:
+        rows = resolved.get(expr, []) if expr else []
+        out[item_id] = [r for r in rows if str(r["id"]) != str(item_id)][:top_n]
+    if stats is not None:
+        stats.update(counts)
+    return out
+
+
+__all__ = ["FTS_TABLE", "MAX_DF", "clear_cache", "match_expr", "query_terms", "related_batch"]
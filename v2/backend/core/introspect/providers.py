@@ -14,8 +14,14 @@ Inputs (payload keys):
   - status: str | list[str]  (e.g., "todo" or ["todo"])
   - status_any: optional list[str]  (alternative filter)
   - max_rows: int (default 50)
-  - exclude_globs: list[str] (applied to filepath)
+  - cursor: int | None. Keyset pagination: only rows with id < cursor. Feed
+    back meta.next_cursor to get the next page (None once exhausted); see
+    iter_fetch_pages().
+  - exclude_globs: list[str] (applied to filepath; pushed down as SQL GLOB on SQLite)
   - segment_excludes: list[str] (reserved; ignored by fetch)
+  - diagnostics: bool (default False). When True, also run the table-wide
+    count(*) / GROUP BY status and include the SQL preview, columns and samples.
+    Off by default so the fetch is a single query on a cached engine/table.
 
 Return:
   [
@@ -25,7 +31,8 @@ Return:
       "sha256": "",
       "meta": {
         "items": [ {id, file, filetype, line, name, description, status}, ... ],
-        "diagnostics": {...}
+        "next_cursor": int | None,
+        "diagnostics": {...}   # summary; full forensics when payload.diagnostics
       }
     }
   ]
@@ -34,12 +41,15 @@ Return:
 import fnmatch
 import os
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
 
-from sqlalchemy import MetaData, Table, create_engine, func, select
+from sqlalchemy import func, literal_column, not_, select
 from sqlalchemy.engine import Engine
 from sqlalchemy.exc import SQLAlchemyError
 
+from v2.backend.core.db.access import engines
+from v2.models.introspection_index import STATUS_NORM_SQL
+
 
 # ------------------------------- helpers -------------------------------------
 
@@ -68,6 +78,8 @@ def _resolve_sqlite_url(url: str) -> Tuple[str, str]:
     # Strip the scheme, tolerate three or four slashes
     if url.startswith("sqlite:////"):
         path_part = url[len("sqlite:////"):]  # e.g., "C:/Users/.../bot_dev.db"
+        if path_part[1:2] != ":":
+            path_part = "/" + path_part  # POSIX absolute: sqlite:////tmp/x.db
     elif url.startswith("sqlite:///"):
         path_part = url[len("sqlite:///"):]   # e.g., "databases/bot_dev.db" or "C:/.../bot_dev.db"
     else:
@@ -117,14 +129,20 @@ def _globs_exclude(path: str, patterns: Iterable[str]) -> bool:
     return False
 
 
+def _glob_to_sql(pattern: str) -> str:
+    """fnmatch pattern → SQLite GLOB pattern (same '*', '?', '[...]'; negation is '^')."""
+    return Path(pattern).as_posix().replace("[!", "[^")
+
+
 def _artifact(kind: str, uri: str, meta: Dict[str, Any]) -> Dict[str, Any]:
     return {"kind": kind, "uri": uri, "sha256": "", "meta": meta}
 
 
-def _problem(code: str, message: str, retryable: bool = False, details: Dict[str, Any] | None = None) -> Dict[str, Any]:
+def _problem(code: str, message: str, retryable: bool = False, details: Dict[str, Any] | None = None,
+             capability: str = "introspect.fetch.v1") -> Dict[str, Any]:
     return _artifact(
         "Problem",
-        "spine://capability/introspect.fetch.v1",
+        f"spine://capability/{capability}",
         {"problem": {"code": code, "message": message, "retryable": retryable, "details": details or {}}}
     )
 
@@ -140,7 +158,10 @@ def fetch_v1(payload: Dict[str, Any], context: Dict[str, Any] | None = None) ->
     status = payload.get("status")
     status_any = payload.get("status_any")
     max_rows: int = int(payload.get("max_rows", 50))
+    cursor = payload.get("cursor")
+    cursor = int(cursor) if cursor not in (None, "") else None
     exclude_globs: List[str] = list(payload.get("exclude_globs") or [])
+    want_diagnostics = bool(payload.get("diagnostics", False))
 
     # Always include safe defaults so pipeline never fails interpolation
     if "**/__pycache__/**" not in exclude_globs:
@@ -163,11 +184,10 @@ def fetch_v1(payload: Dict[str, Any], context: Dict[str, Any] | None = None) ->
                 details={"sqlalchemy_url": sqlalchemy_url, "resolved_path": resolved_path}
             )]
 
-    # Connect & reflect
+    # Connect & reflect (both cached process-wide)
     try:
-        engine: Engine = create_engine(engine_url, future=True)
-        meta = MetaData()
-        table = Table(table_name, meta, autoload_with=engine)
+        engine: Engine = engines.get_engine(engine_url)
+        table = engines.get_table(engine_url, table_name)
     except SQLAlchemyError as e:
         return [_problem("DBConnectError", f"Failed to initialize DB/table: {e}", details={"sqlalchemy_url": engine_url, "table": table_name})]
 
@@ -177,13 +197,26 @@ def fetch_v1(payload: Dict[str, Any], context: Dict[str, Any] | None = None) ->
         # Default to 'todo' if unspecified
         req_norm = ["todo"]
 
-    # Build query (no raw SQL)
+    # Build query. The status expression is rendered verbatim so SQLite can serve
+    # it (plus the id keyset) from idx_introspect_status_norm_id.
     s_col = table.c.status
-    status_norm_expr = func.lower(func.replace(func.replace(s_col, "_", ""), "-", ""))
+    status_norm_expr = literal_column(STATUS_NORM_SQL)
+
+    # On SQLite the globs run in SQL, so one extra row is enough to know whether
+    # another page exists; elsewhere oversample and drop in Python as before.
+    glob_pushdown = engine.dialect.name == "sqlite"
+    if glob_pushdown:
+        fetch_limit = max_rows + 1
+    else:
+        oversample = max(1, min(10, 5 if max_rows <= 50 else max_rows // 10))
+        fetch_limit = max_rows * oversample
 
-    # Oversample factor so we can drop via globs and still keep max_rows
-    oversample = max(1, min(10, 5 if max_rows <= 50 else max_rows // 10))
-    fetch_limit = max_rows * oversample
+    where = [status_norm_expr.in_(req_norm)]
+    if cursor is not None:
+        where.append(table.c.id < cursor)
+    if glob_pushdown:
+        posix_fp = func.replace(table.c.filepath, "\\", "/")
+        where.extend(not_(posix_fp.op("GLOB")(_glob_to_sql(p))) for p in exclude_globs)
 
     stmt = (
         select(
@@ -209,67 +242,87 @@ def fetch_v1(payload: Dict[str, Any], context: Dict[str, Any] | None = None) ->
             table.c.updated_at,
             table.c.mdata,
         )
-        .where(status_norm_expr.in_(req_norm))
+        .where(*where)
         .order_by(table.c.id.desc())
         .limit(fetch_limit)
     )
 
-    # Prepare diagnostics
-    table_cols = [c.name for c in table.columns]
-    sql_preview = ""
-    try:
-        sql_preview = str(stmt.compile(engine, compile_kwargs={"literal_binds": True}))
-    except Exception:
-        # Fallback minimal preview
-        sql_preview = f"SELECT ... FROM {table_name} WHERE normalized(status) IN {req_norm} ORDER BY id DESC LIMIT {fetch_limit}"
-
     diagnostics: Dict[str, Any] = {
         "engine_url": engine_url,
-        "resolved_db_path": resolved_path or "",
         "table": table_name,
-        "cwd": _cwd(),
-        "requested_status": status if isinstance(status, list) else ([status] if isinstance(status, str) else status_any or []),
         "requested_status_norm": req_norm,
         "max_rows": max_rows,
-        "sql_preview": sql_preview,
-        "where_sql_preview": f"normalized status IN {req_norm}",
-        "table_columns": table_cols,
-        "glob_excludes": exclude_globs,
-        "segment_excludes": payload.get("segment_excludes") or [],
     }
+    fallback_preview = (
+        f"SELECT ... FROM {table_name} WHERE normalized(status) IN {req_norm}"
+        + (f" AND id < {cursor}" if cursor is not None else "")
+        + f" ORDER BY id DESC LIMIT {fetch_limit}"
+    )
+    sql_preview = fallback_preview
+    if want_diagnostics:
+        try:
+            sql_preview = str(stmt.compile(engine, compile_kwargs={"literal_binds": True}))
+        except Exception:
+            pass
+        diagnostics.update({
+            "resolved_db_path": resolved_path or "",
+            "cwd": _cwd(),
+            "requested_status": status if isinstance(status, list) else ([status] if isinstance(status, str) else status_any or []),
+            "sql_preview": sql_preview,
+            "where_sql_preview": f"normalized status IN {req_norm}",
+            "cursor": cursor,
+            "glob_pushdown": glob_pushdown,
+            "table_columns": [c.name for c in table.columns],
+            "glob_excludes": exclude_globs,
+            "segment_excludes": payload.get("segment_excludes") or [],
+        })
 
     # Execute & shape
     try:
         with engine.connect() as conn:
-            # total rows (for context) and counts per status
-            try:
-                total = conn.execute(select(func.count()).select_from(table)).scalar_one()
-                diagnostics["table_total_rows"] = int(total)
-            except Exception:
-                pass
-
-            try:
-                sc = conn.execute(select(s_col, func.count().label("count")).group_by(s_col)).all()
-                diagnostics["table_status_counts"] = [{"status": r[0], "count": int(r[1])} for r in sc]
-            except Exception:
-                pass
+            if want_diagnostics:
+                # total rows (for context) and counts per status: full scans, opt-in only
+                try:
+                    total = conn.execute(select(func.count()).select_from(table)).scalar_one()
+                    diagnostics["table_total_rows"] = int(total)
+                except Exception:
+                    pass
+
+                try:
+                    sc = conn.execute(select(s_col, func.count().label("count")).group_by(s_col)).all()
+                    diagnostics["table_status_counts"] = [{"status": r[0], "count": int(r[1])} for r in sc]
+                except Exception:
+                    pass
 
             rows = conn.execute(stmt).mappings().all()
     except SQLAlchemyError as e:
+        # The cached reflection may be stale (e.g. schema migrated); re-reflect next time
+        engines.forget_table(engine_url, table_name)
         return [_problem("DBQueryError", f"Query failed: {e}", details={"sql": sql_preview})]
 
     diagnostics["fetched_rows_before_filters"] = len(rows)
 
-    # Apply glob excludes
+    # Apply glob excludes (again, when pushed down: fnmatch is case-insensitive on
+    # Windows). One row past max_rows tells us another page exists.
     filtered: List[Dict[str, Any]] = []
     for r in rows:
         fp = r.get("filepath") or ""
         if _globs_exclude(fp, exclude_globs):
             continue
         filtered.append(dict(r))
+        if len(filtered) > max_rows and not want_diagnostics:
+            break
 
     diagnostics["fetched_rows_after_filters"] = len(filtered)
 
+    # Keyset cursor: the last row this page consumed, None when the table is exhausted
+    if len(filtered) > max_rows:
+        next_cursor = filtered[max_rows - 1].get("id")
+    elif rows and len(rows) >= fetch_limit:
+        next_cursor = rows[-1].get("id")
+    else:
+        next_cursor = None
+
     # Map to items (match your sample keys)
     items: List[Dict[str, Any]] = []
     for r in filtered[:max_rows]:
@@ -284,14 +337,97 @@ def fetch_v1(payload: Dict[str, Any], context: Dict[str, Any] | None = None) ->
         })
 
     # Add a few human-friendly samples for forensics
-    if filtered:
+    if want_diagnostics and filtered:
         diagnostics["samples"] = {
             "first_5_raw": filtered[:5],
             "first_5_items": items[:5],
         }
 
     # --- IMPORTANT: return a *clean* Result artifact with meta.items ---
-    return [_artifact("Result", "spine://result/introspect.fetch.v1", {"items": items, "diagnostics": diagnostics})]
+    return [_artifact(
+        "Result",
+        "spine://result/introspect.fetch.v1",
+        {"items": items, "next_cursor": next_cursor, "diagnostics": diagnostics},
+    )]
+
+
+def iter_fetch_pages(payload: Dict[str, Any], context: Dict[str, Any] | None = None) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Stream the whole matching backlog as pages of up to max_rows items, newest
+    first, following next_cursor (keyset; no OFFSET). Raises RuntimeError on a
+    Problem artifact.
+    """
+    page_payload = dict(payload)
+    while True:
+        art = fetch_v1(page_payload, context)[0]
+        if art["kind"] == "Problem":
+            prob = art["meta"]["problem"]
+            raise RuntimeError(f"{prob['code']}: {prob['message']}")
+        meta = art["meta"]
+        if meta["items"]:
+            yield meta["items"]
+        if meta.get("next_cursor") is None:
+            return
+        page_payload["cursor"] = meta["next_cursor"]
+
+
+def embed_v1(payload: Dict[str, Any], context: Dict[str, Any] | None = None) -> List[Dict[str, Any]]:
+    """
+    introspect.embed.v1: fill introspection_index_embeddings for rows that have
+    no embedding for 'model' or whose text changed since it was embedded.
+
+    Payload:
+      - sqlalchemy_url: str (required)
+      - embedder: "hashing" (default, deterministic) | "pkg.module:function"
+      - dim: int (hashing embedder only, default 256)
+      - model: str (default "hashing-<dim>" for the hashing embedder, else the embedder spec)
+      - cursor: int | None (resume after this id), max_items: int | None
+      - page_size (1000), batch_size (64), commit_every (1024)
+
+    Returns a Result whose meta carries the run stats (embedded, unchanged,
+    vectors_per_sec, next_cursor, ...); next_cursor is None once the table is
+    covered.
+    """
+    from v2.backend.core.introspect import embeddings
+
+    sqlalchemy_url: str | None = payload.get("sqlalchemy_url")
+    if not sqlalchemy_url:
+        return [_problem("ConfigError", "Missing sqlalchemy_url in payload.",
+                         details={"payload_keys": list(payload.keys())}, capability="introspect.embed.v1")]
+    engine_url, resolved_path = _resolve_sqlite_url(sqlalchemy_url)
+    if engine_url.startswith("sqlite") and resolved_path and not Path(resolved_path).exists():
+        return [_problem("SQLiteFileNotFound", f"SQLite database file not found at absolute path: {resolved_path}",
+                         details={"sqlalchemy_url": sqlalchemy_url, "resolved_path": resolved_path},
+                         capability="introspect.embed.v1")]
+
+    spec = payload.get("embedder") or "hashing"
+    try:
+        embedder = embeddings.resolve_embedder(spec, dim=int(payload.get("dim", 256)))
+    except (ImportError, AttributeError, TypeError, ValueError) as e:
+        return [_problem("EmbedderError", f"Cannot load embedder {spec!r}: {e}", capability="introspect.embed.v1")]
+    model = payload.get("model") or getattr(embedder, "model", None) or str(spec)
+
+    def _opt_int(key: str) -> int | None:
+        v = payload.get(key)
+        return int(v) if v not in (None, "") else None
+
+    try:
+        stats = embeddings.embed_missing(
+            engine_url,
+            model=model,
+            embedder=embedder,
+            cursor=_opt_int("cursor"),
+            page_size=int(payload.get("page_size", 1000)),
+            batch_size=int(payload.get("batch_size", 64)),
+            commit_every=int(payload.get("commit_every", 1024)),
+            max_items=_opt_int("max_items"),
+        )
+    except SQLAlchemyError as e:
+        # Chunks committed before the failure stay; a re-run skips them.
+        return [_problem("DBWriteError", f"Embedding ingestion failed: {e}", retryable=True,
+                         details={"sqlalchemy_url": engine_url, "model": model}, capability="introspect.embed.v1")]
+
+    return [_artifact("Result", "spine://result/introspect.embed.v1", stats.as_dict())]
 
 
 
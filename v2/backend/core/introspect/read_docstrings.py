@@ -11,21 +11,29 @@ Updates in this version:
 - Robust matching: applies glob patterns against repo-relative POSIX paths;
   also prunes dirnames by case-insensitive basename.
 - No env for DB; writer uses YAML-backed engine from db.access.db_init.
+- Pipelined scan: a thread pool parses files ahead of the summarizer, the
+  summarizer batches prompts across `instances` model instances (each with
+  `threads` llama threads), and a writer thread drains finished files into
+  the batched DB writer. Files are summarized and written in walk order, so
+  duplicate detection and row order match a sequential scan.
+- llama_cpp and the DB writer are imported on first use; `model_factory` /
+  `writer` can be injected instead (see bench_docstrings.py).
 
 Spine capability: introspect.docstrings.scan.v1 → run_v1(task, context)
 """
 
 import ast
 import os
+import queue
+import threading
 import time
 import tempfile
 import fnmatch
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Iterable, Tuple
+from typing import List, Dict, Any, Optional, Iterable, Iterator, Tuple, Callable
 
-from llama_cpp import Llama  # type: ignore
-
-from v2.backend.core.db.writers.docstring_writer import DocstringWriter
 from v2.backend.core.spine.contracts import Artifact, Task
 
 
@@ -160,6 +168,18 @@ def _dirnames_from_globs(globs: Iterable[str]) -> List[str]:
     return out
 
 
+# ----------------------------- lazy dependencies ------------------------------
+
+def _load_llama(**kwargs: Any) -> Any:
+    from llama_cpp import Llama  # type: ignore
+    return Llama(**kwargs)
+
+
+def _default_writer() -> Any:
+    from v2.backend.core.db.writers.docstring_writer import DocstringWriter
+    return DocstringWriter(agent_id=1, mode="introspection_index")
+
+
 # ----------------------------- analyzer ---------------------------------------
 
 class DocStringAnalyzer:
@@ -179,6 +199,12 @@ class DocStringAnalyzer:
       exclude_globs   : full-path glob patterns to exclude (repo-relative POSIX)
       char_threshold  : minimum docstring length; below → "Bad docstring"
       max_tokens      : llama max_tokens for summary
+      write_batch_size: rows per batched upsert/commit (default 500)
+      instances       : model instances summarizing in parallel (default 1)
+      parse_workers   : threads parsing files ahead of the summarizer (default 4)
+      batch_size      : prompts collected before dispatching to the instances (default 8)
+      model_factory   : callable(**llama_kwargs) -> model (default: llama_cpp.Llama)
+      writer          : DocstringWriter-like object with buffered() (default: DocstringWriter)
     """
 
     def __init__(
@@ -195,6 +221,12 @@ class DocStringAnalyzer:
         exclude_globs: Optional[Iterable[str]] = None,
         char_threshold: int = 50,
         max_tokens: int = 64,
+        write_batch_size: int = 500,
+        instances: int = 1,
+        parse_workers: int = 4,
+        batch_size: int = 8,
+        model_factory: Optional[Callable[..., Any]] = None,
+        writer: Optional[Any] = None,
     ) -> None:
         os.environ["LLAMA_LOG_LEVEL"] = "60"  # silence noisy C callback logs
 
@@ -203,7 +235,7 @@ class DocStringAnalyzer:
             raise FileNotFoundError(f"Docstring scan root not found: {self.root_path}")
 
         self.model_path = Path(model_path).resolve()
-        if not self.model_path.is_file():
+        if model_factory is None and not self.model_path.is_file():
             raise FileNotFoundError(f"Docstring model not found: {self.model_path}")
 
         self.ctx = int(ctx)
@@ -213,6 +245,10 @@ class DocStringAnalyzer:
         self.status_default = str(status_default or "active")
         self.char_threshold = int(char_threshold)
         self.max_tokens = int(max_tokens)
+        self.write_batch_size = int(write_batch_size)
+        self.instances = max(1, int(instances))
+        self.parse_workers = max(1, int(parse_workers))
+        self.batch_size = max(1, int(batch_size))
 
         base_ex = {"__pycache__", "venv", "env", ".git", "site-packages"}
         extra = {e.strip() for e in (prune_basenames or []) if isinstance(e, str) and e.strip()}
@@ -221,26 +257,32 @@ class DocStringAnalyzer:
 
         self.exclude_globs = tuple(exclude_globs or ())
 
-        size_mb = (self.model_path.stat().st_size or 0) / (1024 * 1024)
+        size_mb = (self.model_path.stat().st_size or 0) / (1024 * 1024) if self.model_path.is_file() else 0.0
         print(
-            f"[DocStringAnalyzer] Loading model {self.model_path.name} ({size_mb:.1f} MB) "
+            f"[DocStringAnalyzer] Loading model {self.model_path.name} ({size_mb:.1f} MB) x{self.instances} "
             f"| ctx={self.ctx} | threads={self.threads} | mlock={'on' if self.use_mlock else 'off'} | gpu_layers={self.gpu_layers}"
         )
 
+        factory = model_factory or _load_llama
         t0 = time.time()
+        self.llms: List[Any] = []
         with _SuppressStdoutCaptureStderr() as cap:
-            self.llm = Llama(
-                model_path=str(self.model_path),
-                n_ctx=self.ctx,
-                n_threads=self.threads,
-                n_gpu_layers=self.gpu_layers,
-                use_mlock=self.use_mlock,
-                verbose=False,
-            )
+            for _ in range(self.instances):
+                self.llms.append(
+                    factory(
+                        model_path=str(self.model_path),
+                        n_ctx=self.ctx,
+                        n_threads=self.threads,
+                        n_gpu_layers=self.gpu_layers,
+                        use_mlock=self.use_mlock,
+                        verbose=False,
+                    )
+                )
         _print_stderr_summary("load", cap.read())
         print(f"[DocStringAnalyzer] Model loaded in {time.time() - t0:.2f}s")
+        self.llm = self.llms[0]
 
-        self.writer = DocstringWriter(agent_id=1, mode="introspection_index")
+        self.writer = writer if writer is not None else _default_writer()
         self.seen_docstrings: set[str] = set()
 
     # ----- AST helpers -----
@@ -262,32 +304,66 @@ class DocStringAnalyzer:
 
     # ----- LLM summarization -----
 
-    def summarize_docstring(self, docstring: Optional[str]) -> str:
+    def _triage(self, docstring: Optional[str]) -> Tuple[Optional[str], str]:
+        """(fixed summary, text): a fixed summary means no model call is needed."""
         text = (docstring or "").strip()
         if len(text) <= self.char_threshold:
-            return "Bad docstring"
+            return "Bad docstring", text
         if text in self.seen_docstrings:
-            return "Duplicate docstring — skipped"
+            return "Duplicate docstring — skipped", text
         self.seen_docstrings.add(text)
+        return None, text
 
+    def _infer(self, llm: Any, text: str) -> str:
         prompt = (
             "Summarize this Python docstring as a concise one-liner:\n"
             f"\"\"\"{text}\"\"\"\n"
             "Summary:"
         )
         try:
-            with _CaptureOnlyStderr() as cap:
-                response = self.llm(prompt, max_tokens=self.max_tokens, stop=["\n"])
-            _print_stderr_summary("infer", cap.read())
+            response = llm(prompt, max_tokens=self.max_tokens, stop=["\n"])
             summary_text = (response.get("choices", [{}])[0].get("text") or "").strip()  # type: ignore[dict-item]
             return summary_text if summary_text else "Bad docstring"
         except Exception as e:
             print(f"[DocStringAnalyzer ❌] LLM summarization failed: {e}")
             return "LLM failed"
 
+    def summarize_docstring(self, docstring: Optional[str]) -> str:
+        fixed, text = self._triage(docstring)
+        if fixed is not None:
+            return fixed
+        with _CaptureOnlyStderr() as cap:
+            summary = self._infer(self.llm, text)
+        _print_stderr_summary("infer", cap.read())
+        return summary
+
+    def _summarize_batch(self, texts: List[str], pool: Optional[ThreadPoolExecutor]) -> List[str]:
+        """Summarize `texts` across the model instances (results in input order)."""
+        if pool is None or len(self.llms) == 1:
+            return [self._infer(self.llm, t) for t in texts]
+        free: "queue.Queue[Any]" = queue.Queue()
+        for llm in self.llms:
+            free.put(llm)
+
+        def _one(text: str) -> str:
+            llm = free.get()  # an instance serves one prompt at a time
+            try:
+                return self._infer(llm, text)
+            finally:
+                free.put(llm)
+
+        return list(pool.map(_one, texts))
+
     # ----- Extraction -----
 
     def extract_docstrings(self, filepath: Path) -> List[Dict[str, Any]]:
+        entries = self._parse_entries(filepath)
+        for entry in entries:
+            entry["summary"] = self.summarize_docstring(entry.pop("_doc", None))
+        return entries
+
+    def _parse_entries(self, filepath: Path) -> List[Dict[str, Any]]:
+        """Entries for `filepath` with the raw docstring under "_doc" (no summaries yet)."""
         try:
             src = filepath.read_text(encoding="utf-8")
             tree = ast.parse(src, filename=str(filepath))
@@ -307,7 +383,6 @@ class DocStringAnalyzer:
         # Module-level docstring
         mod_doc = ast.get_docstring(tree)
         if mod_doc:
-            summary = self.summarize_docstring(mod_doc)
             entries.append(
                 {
                     "subdir": subdir,
@@ -316,7 +391,7 @@ class DocStringAnalyzer:
                     "language": language,
                     "class": "-",
                     "function": "-",
-                    "summary": summary,
+                    "_doc": mod_doc,
                     "_rel_path": rel_path,
                 }
             )
@@ -324,7 +399,6 @@ class DocStringAnalyzer:
         for node in ast.walk(tree):
             if isinstance(node, ast.ClassDef):
                 doc = ast.get_docstring(node)
-                summary = self.summarize_docstring(doc) if doc else "Bad docstring"
                 entries.append(
                     {
                         "subdir": subdir,
@@ -333,13 +407,12 @@ class DocStringAnalyzer:
                         "language": language,
                         "class": node.name,
                         "function": "-",
-                        "summary": summary,
+                        "_doc": doc,
                         "_rel_path": rel_path,
                     }
                 )
             elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
                 doc = ast.get_docstring(node)
-                summary = self.summarize_docstring(doc) if doc else "Bad docstring"
                 cname = self._enclosing_class_name(node)
                 entries.append(
                     {
@@ -349,7 +422,7 @@ class DocStringAnalyzer:
                         "language": language,
                         "class": cname or "-",
                         "function": node.name,
-                        "summary": summary,
+                        "_doc": doc,
                         "_rel_path": rel_path,
                     }
                 )
@@ -410,14 +483,8 @@ class DocStringAnalyzer:
 
     # ----- Traverse & write -----
 
-    def traverse_and_write(self) -> Dict[str, int]:
-        total_files = 0
-        total_written = 0
-        total_skipped = 0
-        total_failed = 0
-        total_llm = 0
-
-        print(f"[DocStringAnalyzer] Starting traversal at {self.root_path}")
+    def _iter_py_files(self) -> Iterator[Tuple[Path, str]]:
+        """(absolute path, repo-relative POSIX path) of every .py file to scan, in walk order."""
         prune = self.prune_basenames
         prune_lower = self.prune_basenames_lower
         patterns = self.exclude_globs
@@ -441,50 +508,147 @@ class DocStringAnalyzer:
                 rel_file = (Path(rel_dir) / filename).as_posix() if rel_dir else filename
                 if _path_matches_any(rel_file, patterns):
                     continue
-
-                total_files += 1
                 full_path = Path(dirpath) / filename
-                rel_path = full_path.relative_to(self.root_path).as_posix()
-                print(f"[DocStringAnalyzer] Processing {rel_path}")
-                try:
-                    records = self.extract_docstrings(full_path)
-                    for entry in records:
-                        summary = (entry.get("summary") or "").strip()
-                        if "LLM failed" in summary:
-                            total_failed += 1
-                            outcome = "LLM summarization failed"
-                        elif "Duplicate" in summary:
-                            total_skipped += 1
-                            continue
-                        elif "Bad docstring" in summary:
-                            outcome = "Too short or missing docstring"
-                        else:
-                            total_llm += 1
-                            outcome = "Docstring summarized successfully"
-
-                        row = self._to_writer_row(entry)
-                        self.writer.write(row)
-                        total_written += 1
-
-                        symbol_type = row["filetype"]
-                        symbol_name = row.get("function") or row.get("route") or row.get("name")
-                        desc_snip = " ".join((row["description"] or "").split())[:120]
-                        if len((row["description"] or "")) > 120:
-                            desc_snip += "…"
-                        print(
-                            f"[DocStringAnalyzer ✅] {row['file']}:{row['line']} "
-                            f"{symbol_type}={symbol_name} — {outcome} — {desc_snip}"
-                        )
-                except Exception as e:
-                    print(f"[DocStringAnalyzer ❌] Error during processing {rel_path}: {e}")
-                    total_failed += 1
+                yield full_path, full_path.relative_to(self.root_path).as_posix()
+
+    def _parsed_in_order(self, pool: ThreadPoolExecutor) -> Iterator[Tuple[str, List[Dict[str, Any]]]]:
+        """Stage 1: parse files on `pool`, a bounded window ahead of the consumer, yielding in walk order."""
+        window: deque = deque()
+        ahead = self.parse_workers * 4
+        for full_path, rel_path in self._iter_py_files():
+            window.append((rel_path, pool.submit(self._parse_entries, full_path)))
+            if len(window) >= ahead:
+                rel, fut = window.popleft()
+                yield rel, fut.result()
+        while window:
+            rel, fut = window.popleft()
+            yield rel, fut.result()
+
+    def _write_entries(self, writer: Any, entries: List[Dict[str, Any]], totals: Dict[str, int]) -> None:
+        """Stage 3 (per file): queue summarized entries and count outcomes (writes are reported by _written)."""
+        for entry in entries:
+            summary = (entry.get("summary") or "").strip()
+            if "LLM failed" in summary:
+                totals["total_failed"] += 1
+                outcome = "LLM summarization failed"
+            elif "Duplicate" in summary:
+                totals["total_skipped"] += 1
+                continue
+            elif "Bad docstring" in summary:
+                outcome = "Too short or missing docstring"
+            else:
+                totals["total_llm"] += 1
+                outcome = "Docstring summarized successfully"
+
+            row = self._to_writer_row(entry)
+            writer.write(row, (row, outcome))
+
+    @staticmethod
+    def _written(totals: Dict[str, int], tag: Tuple[Dict[str, Any], str], error: Optional[Exception]) -> None:
+        """Buffered-writer callback: runs once a queued row is committed (or failed to be)."""
+        row, outcome = tag
+        if error is not None:
+            print(f"[DocStringAnalyzer ❌] Error writing {row['file']}:{row['line']}: {error}")
+            totals["total_failed"] += 1
+            return
+        totals["total_written"] += 1
+
+        symbol_type = row["filetype"]
+        symbol_name = row.get("function") or row.get("route") or row.get("name")
+        desc_snip = " ".join((row["description"] or "").split())[:120]
+        if len((row["description"] or "")) > 120:
+            desc_snip += "…"
+        print(
+            f"[DocStringAnalyzer ✅] {row['file']}:{row['line']} "
+            f"{symbol_type}={symbol_name} — {outcome} — {desc_snip}"
+        )
+
+    def traverse_and_write(self) -> Dict[str, Any]:
+        totals = dict(total_files=0, total_written=0, total_skipped=0, total_failed=0, total_llm=0)
+        print(
+            f"[DocStringAnalyzer] Starting traversal at {self.root_path} "
+            f"(parse_workers={self.parse_workers}, instances={len(self.llms)}, batch_size={self.batch_size})"
+        )
+        t0 = time.perf_counter()
+
+        # Stage 3: the writer thread drains summarized files; rows are upserted in batches
+        done: "queue.Queue[Optional[Tuple[str, List[Dict[str, Any]]]]]" = queue.Queue()
+        writer_state: Dict[str, Any] = {}
 
+        def _drain() -> None:
+            try:
+                on_result = lambda tag, error: self._written(totals, tag, error)
+                with self.writer.buffered(batch_size=self.write_batch_size, on_result=on_result) as writer:
+                    while True:
+                        item = done.get()
+                        if item is None:
+                            break
+                        rel_path, entries = item
+                        try:
+                            self._write_entries(writer, entries, totals)
+                        except Exception as e:
+                            print(f"[DocStringAnalyzer ❌] Error during processing {rel_path}: {e}")
+                            totals["total_failed"] += 1
+                writer_state["stats"] = writer.stats
+            except BaseException as e:  # surfaced by the caller after join()
+                writer_state["error"] = e
+                while done.get() is not None:  # discard the rest up to the sentinel
+                    pass
+
+        drain = threading.Thread(target=_drain, name="docstrings-writer", daemon=True)
+        drain.start()
+
+        # Stage 2: summarize in walk order, dispatching prompts in batches
+        files: List[Tuple[str, List[Dict[str, Any]]]] = []
+        jobs: List[Tuple[Dict[str, Any], str]] = []
+
+        def _flush(infer_pool: Optional[ThreadPoolExecutor]) -> None:
+            if jobs:
+                with _CaptureOnlyStderr() as cap:
+                    outs = self._summarize_batch([text for _, text in jobs], infer_pool)
+                _print_stderr_summary("infer", cap.read())
+                for (entry, _), summary in zip(jobs, outs):
+                    entry["summary"] = summary
+                jobs.clear()
+            for item in files:
+                done.put(item)
+            files.clear()
+
+        infer_pool = ThreadPoolExecutor(max_workers=len(self.llms)) if len(self.llms) > 1 else None
+        try:
+            with ThreadPoolExecutor(max_workers=self.parse_workers) as parse_pool:
+                for rel_path, entries in self._parsed_in_order(parse_pool):
+                    totals["total_files"] += 1
+                    print(f"[DocStringAnalyzer] Processing {rel_path}")
+                    for entry in entries:
+                        fixed, text = self._triage(entry.pop("_doc", None))
+                        if fixed is not None:
+                            entry["summary"] = fixed
+                        else:
+                            jobs.append((entry, text))
+                    files.append((rel_path, entries))
+                    if len(jobs) >= self.batch_size:
+                        _flush(infer_pool)
+                _flush(infer_pool)
+        finally:
+            if infer_pool is not None:
+                infer_pool.shutdown()
+            done.put(None)
+            drain.join()
+        if "error" in writer_state:
+            raise writer_state["error"]
+
+        secs = time.perf_counter() - t0
+        ws = writer_state.get("stats") or {}
+        print(
+            f"[DocStringAnalyzer] Wrote {ws.get('rows', 0)} rows in {ws.get('batches', 0)} batches "
+            f"({ws.get('rows_per_sec', 0.0)} rows/sec, {ws.get('fallback_rows', 0)} via single-row fallback)"
+        )
         return dict(
-            total_files=total_files,
-            total_written=total_written,
-            total_skipped=total_skipped,
-            total_failed=total_failed,
-            total_llm=total_llm,
+            **totals,
+            rows_per_sec=ws.get("rows_per_sec", 0.0),
+            files_per_sec=round(totals["total_files"] / secs, 1) if secs > 0 else 0.0,
+            summaries_per_sec=round(totals["total_llm"] / secs, 1) if secs > 0 else 0.0,
         )
 
 
@@ -522,6 +686,12 @@ def run_v1(task: Task, context: Dict[str, Any]) -> List[Artifact]:
       segment_excludes (list[str]): directory basenames to prune (case-insensitive)
       status (str)              : status to write to DB rows
       model_path (str)          : .gguf model absolute path
+
+    Optional payload keys:
+      instances (int)           : model instances summarizing in parallel (default 1)
+      threads (int)             : llama threads per instance (default 8)
+      parse_workers (int)       : file-parsing threads (default 4)
+      batch_size (int)          : prompts per dispatch (default 8)
     """
     p = task.payload or {}
     try:
@@ -532,6 +702,10 @@ def run_v1(task: Task, context: Dict[str, Any]) -> List[Artifact]:
         segment_excludes = list(p.get("segment_excludes") or [])
         status = str(p.get("status") or "").strip() or "active"
         model_path = str(p.get("model_path") or "").strip()
+        instances = int(p.get("instances") or 1)
+        threads = int(p.get("threads") or 8)
+        parse_workers = int(p.get("parse_workers") or 4)
+        batch_size = int(p.get("batch_size") or 8)
 
         if not url:
             return _problem("InvalidPayload", "Missing 'sqlalchemy_url'.")
@@ -555,7 +729,7 @@ def run_v1(task: Task, context: Dict[str, Any]) -> List[Artifact]:
             root_path=root,
             model_path=mp,
             ctx=8192,                 # increased context size
-            threads=8,
+            threads=threads,
             gpu_layers=0,
             use_mlock=False if os.name == "nt" else True,
             status_default=status,
@@ -563,6 +737,9 @@ def run_v1(task: Task, context: Dict[str, Any]) -> List[Artifact]:
             exclude_globs=exclude_globs,
             char_threshold=50,
             max_tokens=64,
+            instances=instances,
+            parse_workers=parse_workers,
+            batch_size=batch_size,
         )
 
         print(f"[DocStringAnalyzer] Using model: {analyzer.model_path}")
@@ -580,6 +757,9 @@ def run_v1(task: Task, context: Dict[str, Any]) -> List[Artifact]:
                 "duplicates_skipped": int(stats.get("total_skipped", 0)),
                 "parse_or_llm_failures": int(stats.get("total_failed", 0)),
                 "llm_summaries": int(stats.get("total_llm", 0)),
+                "rows_per_sec": float(stats.get("rows_per_sec", 0.0)),
+                "files_per_sec": float(stats.get("files_per_sec", 0.0)),
+                "summaries_per_sec": float(stats.get("summaries_per_sec", 0.0)),
                 "duration_sec": dur,
                 "status": "ok",
             }
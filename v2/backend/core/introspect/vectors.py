@@ -0,0 +1,438 @@
+# File: v2/backend/core/introspect/vectors.py
+"""
+Dense-vector similarity over introspection_index_embeddings.
+
+Embeddings (packed little-endian float32 BLOBs, one row per (item_id, model))
+are loaded per model into one contiguous, L2-normalised float32 matrix. The
+matrix is saved as .npy under a cache directory and memory-mapped back, so a
+warm process (or the next one) does not touch the table again. Each cache is
+tagged with an invalidation stamp — (count, max(id), max(created_at)) for the
+model — and rebuilt when the stamp moves; writers that re-embed an item in
+place must bump created_at (introspect.embed.v1 does).
+
+Queries are top-k cosine similarity:
+  - flat: batched matmul over row blocks with an argpartition merge (exact)
+  - ivf:  spherical k-means coarse quantiser; only the nprobe nearest lists
+          are scanned (approximate; built on demand and cached with the matrix)
+
+numpy is optional for the rest of the introspect package; the functions here
+raise RuntimeError when it is missing.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None  # type: ignore
+
+from sqlalchemy import text
+
+from v2.backend.core.db.access import engines
+
+EMBED_TABLE = "introspection_index_embeddings"
+# Rows per matmul block in flat search / assignment (bounds the score buffer)
+BLOCK_ROWS = 65536
+# Seconds a process trusts a stamp before re-reading it from the DB
+STAMP_TTL = 1.0
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise RuntimeError("numpy is required for vector search (pip install numpy)")
+
+
+# ------------------------------- packing -------------------------------------
+
+def pack_embedding(vec: Sequence[float]) -> bytes:
+    """float sequence → packed little-endian float32 BLOB."""
+    _require_numpy()
+    return np.asarray(vec, dtype="<f4").tobytes()
+
+
+def unpack_embedding(blob: bytes) -> "np.ndarray":
+    _require_numpy()
+    return np.frombuffer(blob, dtype="<f4")
+
+
+def _normalize_rows(m: "np.ndarray") -> "np.ndarray":
+    """L2-normalise rows in place (zero rows stay zero)."""
+    for start in range(0, m.shape[0], BLOCK_ROWS):
+        block = m[start:start + BLOCK_ROWS]
+        norms = np.linalg.norm(block, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        block /= norms
+    return m
+
+
+def _topk_merge(
+    best_s: Optional["np.ndarray"], best_i: Optional["np.ndarray"], s: "np.ndarray", i: "np.ndarray", k: int
+) -> Tuple["np.ndarray", "np.ndarray"]:
+    """Merge a (q, b) block of scores/row indices into the running (q, <=k) best."""
+    if best_s is not None:
+        s = np.concatenate([best_s, s], axis=1)
+        i = np.concatenate([best_i, i], axis=1)
+    if s.shape[1] > k:
+        part = np.argpartition(-s, k - 1, axis=1)[:, :k]
+        s = np.take_along_axis(s, part, axis=1)
+        i = np.take_along_axis(i, part, axis=1)
+    return s, i
+
+
+# --------------------------------- IVF ---------------------------------------
+
+@dataclass
+class IVFIndex:
+    """Inverted lists over a normalised matrix: rows order[offsets[l]:offsets[l+1]] belong to list l."""
+
+    centroids: "np.ndarray"  # (nlist, dim), normalised
+    order: "np.ndarray"      # (n,) row indices grouped by list
+    offsets: "np.ndarray"    # (nlist + 1,)
+
+    @property
+    def nlist(self) -> int:
+        return int(self.centroids.shape[0])
+
+    @classmethod
+    def build(
+        cls, matrix: "np.ndarray", nlist: Optional[int] = None, *, iters: int = 10, sample: Optional[int] = None, seed: int = 0
+    ) -> "IVFIndex":
+        _require_numpy()
+        n = matrix.shape[0]
+        nlist = max(1, min(n, nlist or int(np.sqrt(n))))
+        rng = np.random.default_rng(seed)
+        sample = min(n, sample or max(nlist * 64, 10_000))
+        train = np.ascontiguousarray(matrix[np.sort(rng.choice(n, size=sample, replace=False))], dtype=np.float32)
+        centroids = train[rng.choice(sample, size=nlist, replace=False)].copy()
+        for _ in range(iters):
+            assign = _assign(train, centroids)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assign, train)
+            counts = np.bincount(assign, minlength=nlist)
+            empty = counts == 0
+            if empty.any():
+                # Re-seed empty lists from random training rows
+                sums[empty] = train[rng.choice(sample, size=int(empty.sum()), replace=False)]
+            centroids = _normalize_rows(sums)
+        assign = _assign(matrix, centroids)
+        order = np.argsort(assign, kind="stable")
+        offsets = np.concatenate([[0], np.cumsum(np.bincount(assign, minlength=nlist))])
+        return cls(centroids=centroids, order=order, offsets=offsets)
+
+    def rows_for(self, q: "np.ndarray", nprobe: int) -> "np.ndarray":
+        """Row indices in the nprobe lists nearest to the (normalised) query q."""
+        sims = self.centroids @ q
+        nprobe = max(1, min(nprobe, self.nlist))
+        lists = np.argpartition(-sims, nprobe - 1)[:nprobe]
+        return np.concatenate([self.order[self.offsets[l]:self.offsets[l + 1]] for l in lists])
+
+    def save(self, path: Path) -> None:
+        tmp = path.with_name(path.name + ".tmp.npz")
+        np.savez(tmp, centroids=self.centroids, order=self.order, offsets=self.offsets)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: Path) -> "IVFIndex":
+        with np.load(path) as z:
+            return cls(centroids=z["centroids"], order=z["order"], offsets=z["offsets"])
+
+
+def _assign(rows: "np.ndarray", centroids: "np.ndarray") -> "np.ndarray":
+    out = np.empty(rows.shape[0], dtype=np.int64)
+    for start in range(0, rows.shape[0], BLOCK_ROWS):
+        out[start:start + BLOCK_ROWS] = np.argmax(rows[start:start + BLOCK_ROWS] @ centroids.T, axis=1)
+    return out
+
+
+# ----------------------------- vector index ----------------------------------
+
+@dataclass
+class VectorIndex:
+    """Normalised embedding matrix for one model; ids[i] is the item_id of matrix[i] (ascending)."""
+
+    model: str
+    ids: "np.ndarray"     # (n,) int64, sorted
+    matrix: "np.ndarray"  # (n, dim) float32, unit rows; usually a read-only memmap
+    stamp: List[Any]
+    ivf: Optional[IVFIndex] = None
+    cache_base: Optional[Path] = None
+
+    @property
+    def dim(self) -> int:
+        return int(self.matrix.shape[1])
+
+    def __len__(self) -> int:
+        return int(self.matrix.shape[0])
+
+    @classmethod
+    def from_arrays(cls, ids: Sequence[int], vectors: Any, *, model: str = "", stamp: Optional[List[Any]] = None) -> "VectorIndex":
+        """Build an in-memory index (normalises a float32 copy of 'vectors', sorts by id)."""
+        _require_numpy()
+        ids_a = np.asarray(ids, dtype=np.int64)
+        m = np.array(vectors, dtype=np.float32)
+        order = np.argsort(ids_a, kind="stable")
+        if not np.array_equal(order, np.arange(len(ids_a))):
+            ids_a, m = ids_a[order], m[order]
+        return cls(model=model, ids=ids_a, matrix=_normalize_rows(m), stamp=list(stamp or []))
+
+    def rows_of(self, item_ids: Sequence[int]) -> "np.ndarray":
+        """Matrix rows for item_ids; -1 where an item has no embedding."""
+        item_ids = np.asarray(item_ids, dtype=np.int64)
+        pos = np.searchsorted(self.ids, item_ids)
+        pos_c = np.minimum(pos, max(len(self.ids) - 1, 0))
+        found = (pos < len(self.ids)) & (self.ids[pos_c] == item_ids) if len(self.ids) else np.zeros(len(item_ids), bool)
+        return np.where(found, pos_c, -1)
+
+    def ensure_ivf(self, nlist: Optional[int] = None, **kwargs: Any) -> IVFIndex:
+        """Build (or load from the cache directory) the IVF lists for this matrix."""
+        _require_numpy()
+        want = max(1, min(len(self), nlist or int(np.sqrt(max(len(self), 1)))))
+        if self.ivf is not None and self.ivf.nlist == want:
+            return self.ivf
+        path = self.cache_base.with_name(f"{self.cache_base.name}.ivf{want}.npz") if self.cache_base else None
+        if path is not None and path.exists():
+            try:
+                self.ivf = IVFIndex.load(path)
+                return self.ivf
+            except (OSError, ValueError, KeyError):
+                pass
+        self.ivf = IVFIndex.build(self.matrix, want, **kwargs)
+        if path is not None:
+            try:
+                self.ivf.save(path)
+            except OSError:
+                pass
+        return self.ivf
+
+    def search(
+        self,
+        queries: Any,
+        k: int = 10,
+        *,
+        nprobe: Optional[int] = None,
+        exclude_rows: Optional[Sequence[int]] = None,
+    ) -> Tuple["np.ndarray", "np.ndarray"]:
+        """
+        Top-k cosine similarity. Returns (item_ids, scores), each (q, k') with
+        k' = min(k, n), best first. nprobe uses the IVF lists (ensure_ivf first);
+        otherwise the search is exact. exclude_rows[i] (>= 0) is a matrix row that
+        query i must not return (e.g. the query item itself). Slots with no
+        candidate (k >= n with an exclusion, short IVF lists) come back as
+        id -1 with score -inf.
+        """
+        _require_numpy()
+        q = np.array(queries, dtype=np.float32, ndmin=2)
+        if q.shape[1] != self.dim:
+            raise ValueError(f"query dim {q.shape[1]} != index dim {self.dim}")
+        _normalize_rows(q)
+        n = len(self)
+        k = max(1, min(k, n))
+        excl = np.full(q.shape[0], -1, dtype=np.int64) if exclude_rows is None else np.asarray(exclude_rows, dtype=np.int64)
+
+        if nprobe is not None and self.ivf is not None:
+            out_s = np.full((q.shape[0], k), -np.inf, dtype=np.float32)
+            out_r = np.full((q.shape[0], k), -1, dtype=np.int64)
+            for qi in range(q.shape[0]):
+                rows = self.ivf.rows_for(q[qi], nprobe)
+                if excl[qi] >= 0:
+                    rows = rows[rows != excl[qi]]
+                s = self.matrix[rows] @ q[qi]
+                kk = min(k, len(rows))
+                if kk == 0:
+                    continue
+                part = np.argpartition(-s, kk - 1)[:kk]
+                out_s[qi, :kk] = s[part]
+                out_r[qi, :kk] = rows[part]
+            best_s, best_r = out_s, out_r
+        else:
+            best_s = best_r = None
+            for start in range(0, n, BLOCK_ROWS):
+                block = self.matrix[start:start + BLOCK_ROWS]
+                s = q @ block.T
+                hit = (excl >= start) & (excl < start + block.shape[0])
+                if hit.any():
+                    s[np.nonzero(hit)[0], excl[hit] - start] = -np.inf
+                r = np.broadcast_to(np.arange(start, start + block.shape[0], dtype=np.int64), s.shape)
+                best_s, best_r = _topk_merge(best_s, best_r, s, r, k)
+
+        order = np.argsort(-best_s, axis=1, kind="stable")
+        best_s = np.take_along_axis(best_s, order, axis=1)
+        best_r = np.take_along_axis(best_r, order, axis=1)
+        # Excluded rows are only masked to -inf, so they can still fill a slot when k >= n
+        best_r = np.where(np.isfinite(best_s), best_r, -1)
+        ids = np.where(best_r >= 0, self.ids[np.maximum(best_r, 0)], -1)
+        return ids, best_s
+
+
+# ------------------------------ DB loading -----------------------------------
+
+_lock = threading.Lock()
+_indexes: Dict[Tuple[str, str], Tuple[VectorIndex, float]] = {}
+
+
+def embedding_stamp(url: str, model: str) -> List[Any]:
+    """Invalidation stamp for one model's embeddings: [count, max(id), max(created_at)]."""
+    with engines.get_engine(url).connect() as conn:
+        # Separate subqueries so SQLite can answer each from an index (the max()
+        # optimisation does not apply to a combined aggregate)
+        row = conn.execute(
+            text(
+                f"SELECT (SELECT count(*) FROM {EMBED_TABLE} WHERE model = :model),"
+                f" (SELECT max(id) FROM {EMBED_TABLE} WHERE model = :model),"
+                f" (SELECT max(created_at) FROM {EMBED_TABLE} WHERE model = :model)"
+            ),
+            {"model": model},
+        ).one()
+    return [int(row[0]), row[1], None if row[2] is None else str(row[2])]
+
+
+def _default_cache_dir(url: str) -> Optional[Path]:
+    db = engines.get_engine(url).url.database
+    if url.startswith("sqlite") and db and db != ":memory:":
+        return Path(db).resolve().parent / ".vector_cache"
+    return None
+
+
+def _read_matrix(url: str, model: str, count: int) -> Tuple["np.ndarray", "np.ndarray", List[Any]]:
+    """
+    (ids, raw float32 matrix, stamp) for 'model', skipping rows whose dim disagrees
+    with the first. `count` only sizes the initial buffers: rows committed after it
+    was taken are still loaded, and the stamp is computed from the rows actually
+    read (one SELECT, so one consistent snapshot).
+    """
+    cap = max(1, count)
+    ids = np.empty(cap, dtype=np.int64)
+    m: Optional["np.ndarray"] = None
+    n = 0
+    seen = 0
+    max_id: Any = None
+    max_created: Any = None
+    with engines.get_engine(url).connect() as conn:
+        res = conn.execute(
+            text(
+                f"SELECT item_id, dim, embedding, id, created_at FROM {EMBED_TABLE}"
+                f" WHERE model = :model ORDER BY item_id"
+            ),
+            {"model": model},
+        )
+        while True:
+            batch = res.fetchmany(20_000)
+            if not batch:
+                break
+            seen += len(batch)
+            for r in batch:
+                if r[3] is not None and (max_id is None or r[3] > max_id):
+                    max_id = r[3]
+                if r[4] is not None and (max_created is None or r[4] > max_created):
+                    max_created = r[4]
+            if m is None:
+                m = np.empty((cap, int(batch[0][1])), dtype=np.float32)
+            nbytes = m.shape[1] * 4
+            good = [r for r in batch if int(r[1]) == m.shape[1] and len(r[2]) == nbytes]
+            if not good:
+                continue
+            b = len(good)
+            if n + b > len(ids):
+                cap = max(n + b, 2 * len(ids))
+                ids = np.resize(ids, cap)
+                grown = np.empty((cap, m.shape[1]), dtype=np.float32)
+                grown[:n] = m[:n]
+                m = grown
+            ids[n:n + b] = [r[0] for r in good]
+            m[n:n + b] = np.frombuffer(b"".join(bytes(r[2]) for r in good), dtype="<f4").reshape(b, m.shape[1])
+            n += b
+    stamp = [seen, max_id, None if max_created is None else str(max_created)]
+    if m is None:
+        return ids[:0], np.empty((0, 0), dtype=np.float32), stamp
+    return ids[:n], m[:n], stamp
+
+
+def load_index(url: str, model: str, *, cache_dir: Optional[Path] = None, refresh: bool = False) -> VectorIndex:
+    """
+    The VectorIndex for (url, model): from this process if its stamp is current,
+    else from the .npy cache (memory-mapped), else rebuilt from the table.
+    """
+    _require_numpy()
+    key = (url, model)
+    now = time.monotonic()
+    cached = _indexes.get(key)
+    if cached is not None and not refresh and now - cached[1] < STAMP_TTL:
+        return cached[0]
+
+    stamp = embedding_stamp(url, model)
+    if cached is not None and not refresh and cached[0].stamp == stamp:
+        _indexes[key] = (cached[0], now)
+        return cached[0]
+
+    with _lock:
+        cache_dir = Path(cache_dir) if cache_dir else _default_cache_dir(url)
+        base = None
+        if cache_dir is not None:
+            base = cache_dir / hashlib.sha1(f"{url}\0{model}".encode("utf-8")).hexdigest()[:16]
+            meta_fp = base.with_name(base.name + ".meta.json")
+            if not refresh and meta_fp.exists():
+                try:
+                    meta = json.loads(meta_fp.read_text(encoding="utf-8"))
+                    if meta.get("stamp") == stamp and meta.get("model") == model:
+                        idx = VectorIndex(
+                            model=model,
+                            ids=np.load(base.with_name(base.name + ".ids.npy")),
+                            matrix=np.load(base.with_name(base.name + ".vecs.npy"), mmap_mode="r"),
+                            stamp=stamp,
+                            cache_base=base,
+                        )
+                        _indexes[key] = (idx, now)
+                        return idx
+                except (OSError, ValueError):
+                    pass
+
+        # The table may have moved since the stamp was read; keep the one
+        # that matches the rows loaded, so the next check sees the change.
+        ids, m, stamp = _read_matrix(url, model, stamp[0])
+        _normalize_rows(m)
+        idx = VectorIndex(model=model, ids=ids, matrix=m, stamp=stamp)
+        if base is not None:
+            try:
+                cache_dir.mkdir(parents=True, exist_ok=True)
+                for old in cache_dir.glob(base.name + ".*"):
+                    old.unlink()
+                np.save(base.with_name(base.name + ".ids.tmp.npy"), ids)
+                np.save(base.with_name(base.name + ".vecs.tmp.npy"), m)
+                os.replace(base.with_name(base.name + ".ids.tmp.npy"), base.with_name(base.name + ".ids.npy"))
+                os.replace(base.with_name(base.name + ".vecs.tmp.npy"), base.with_name(base.name + ".vecs.npy"))
+                base.with_name(base.name + ".meta.json").write_text(
+                    json.dumps({"model": model, "stamp": stamp, "url": url}), encoding="utf-8"
+                )
+                idx.matrix = np.load(base.with_name(base.name + ".vecs.npy"), mmap_mode="r")
+                idx.cache_base = base
+            except OSError:
+                pass
+        _indexes[key] = (idx, now)
+        return idx
+
+
+def clear_cache() -> None:
+    """Forget in-process indexes (disk caches are kept and re-validated by stamp)."""
+    with _lock:
+        _indexes.clear()
+
+
+__all__ = [
+    "EMBED_TABLE",
+    "IVFIndex",
+    "VectorIndex",
+    "clear_cache",
+    "embedding_stamp",
+    "load_index",
+    "pack_embedding",
+    "unpack_embedding",
+]
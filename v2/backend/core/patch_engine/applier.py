@@ -6,6 +6,8 @@ from pathlib import Path
 from typing import List, Optional, Tuple, Dict
 import re
 
+from .workspace import break_link
+
 # ------------------------------------------------------------------------------
 # Result DTO
 # ------------------------------------------------------------------------------
@@ -199,6 +201,8 @@ class PatchApplier:
     def _write_lines(self, path: Path, lines: List[str], *, prefer_eol: str | None = None) -> None:
         path.parent.mkdir(parents=True, exist_ok=True)
         content = "".join(lines if prefer_eol is None else self._coerce_eol(lines, prefer_eol))
+        # Workspaces may be hardlink farms of the mirror; never write through a shared inode
+        break_link(path)
         # Avoid platform newline translation on write
         with path.open("w", encoding="utf-8", newline="") as f:
             f.write(content)
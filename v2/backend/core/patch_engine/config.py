@@ -65,8 +65,13 @@ class PatchEngineConfig:
       - mirror_current: directory where the sandbox (or fixed target) root lives.
       - source_seed_dir: path to the source tree used to seed the target (may be empty for 'skip' strategy).
       - initial_tests / extensive_tests: optional test command lines to run.
+      - test_jobs: how many test commands may run concurrently (they must be independent).
+      - test_timeout_s: per-command timeout in seconds (None = no limit).
+      - test_fail_fast: stop a phase at its first failing command.
       - archive_enabled: if True, keep archived copies inside the target before overwrites.
       - promotion_enabled: if True, allow promotion to 'live' (generally False in CI/engine).
+      - workspace_link_mode: how workspaces/snapshots are materialised ('copy', 'hardlink',
+        'reflink' or 'auto'); see WorkspaceManager.link_mode.
       - ignore_globs: extra patterns to ignore when seeding (e.g., ["output", ".git", "__pycache__"]).
       - safety: SafetyLimits object; callers may pass custom limits or rely on defaults().
     """
@@ -76,9 +81,13 @@ class PatchEngineConfig:
 
     initial_tests: List[str] = field(default_factory=list)
     extensive_tests: List[str] = field(default_factory=list)
+    test_jobs: int = 1
+    test_timeout_s: Optional[float] = None
+    test_fail_fast: bool = False
 
     archive_enabled: bool = False
     promotion_enabled: bool = False
+    workspace_link_mode: str = "copy"
 
     # Allow callers to pass patterns to skip when seeding the mirror/target
     ignore_globs: List[str] = field(default_factory=list)
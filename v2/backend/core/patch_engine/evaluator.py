@@ -1,10 +1,14 @@
 # File: backend/core/patch_engine/evaluator.py
 from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+import os
+import signal
 import subprocess
+import threading
 import time
 import json
 
@@ -21,36 +25,96 @@ class TestResult:
     duration_ms: int
     reports: Dict[str, Any]
     logs_path: Path
+    # Longest single command: the floor for duration_ms however many jobs run
+    critical_path_ms: int = 0
+    # Sum of all command durations (what a sequential run would take)
+    total_command_ms: int = 0
 
 
 class Evaluator:
     """
     Executes provided shell commands as tests.
-    - commands: list[str] executed with shell=True, cwd=workspace
-    - writing stdout/stderr logs per command to logs_dir
-    - returns TestResult with structured summary
+    - commands: list[str] executed with shell=True, cwd=workspace; they are
+      independent, so up to `jobs` run at once
+    - stdout+stderr of each command are streamed to logs_dir/cmd_NN.log
+    - timeout_s: per-command limit; the command's process group is killed
+    - fail_fast: on the first failure, kill running commands and skip the rest
+    - returns TestResult with structured summary (wall, critical-path and
+      summed command times)
 
     NOTE: Commands may be empty → treated as pass.
     """
 
-    def __init__(self, workspace: Path, logs_dir: Path, reports_dir: Path):
+    def __init__(
+        self,
+        workspace: Path,
+        logs_dir: Path,
+        reports_dir: Path,
+        *,
+        jobs: int = 1,
+        timeout_s: Optional[float] = None,
+        fail_fast: bool = False,
+    ):
         self.workspace = workspace
         self.logs_dir = logs_dir
         self.reports_dir = reports_dir
+        self.jobs = max(1, int(jobs or 1))
+        self.timeout_s = timeout_s
+        self.fail_fast = fail_fast
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._running: Dict[int, subprocess.Popen] = {}
 
-    def _run_command(self, cmd: str, idx: int) -> tuple[bool, float, Path]:
-        self.logs_dir.mkdir(parents=True, exist_ok=True)
+    def _run_command(self, cmd: str, idx: int) -> Dict[str, Any]:
         log_fp = self.logs_dir / f"cmd_{idx:02d}.log"
-        t0 = time.perf_counter()
-        proc = subprocess.run(cmd, cwd=self.workspace, shell=True, capture_output=True, text=True)
-        dt = time.perf_counter() - t0
+        if self._stop.is_set():
+            return {"status": "skipped", "exit": None, "ms": 0, "log": log_fp}
+
         with open(log_fp, "w", encoding="utf-8", newline="") as f:
             f.write(f"$ {cmd}\n\n")
-            f.write(proc.stdout or "")
-            if proc.stderr:
-                f.write("\n[stderr]\n" + proc.stderr)
-            f.write(f"\n\n[exit] {proc.returncode}\n")
-        return proc.returncode == 0, dt, log_fp
+            f.flush()
+            t0 = time.perf_counter()
+            proc = subprocess.Popen(
+                cmd,
+                cwd=self.workspace,
+                shell=True,
+                stdout=f,
+                stderr=subprocess.STDOUT,
+                **_new_group_kwargs(),
+            )
+            with self._lock:
+                self._running[idx] = proc
+            # fail-fast may have fired between the check above and Popen
+            if self._stop.is_set():
+                _kill_tree(proc)
+            status = None
+            try:
+                rc = proc.wait(timeout=self.timeout_s)
+            except subprocess.TimeoutExpired:
+                _kill_tree(proc)
+                rc = proc.wait()
+                status = "timeout"
+            dt = time.perf_counter() - t0
+            with self._lock:
+                self._running.pop(idx, None)
+            if status is None:
+                status = "passed" if rc == 0 else ("cancelled" if self._stop.is_set() else "failed")
+            f.write(f"\n\n[exit] {rc}\n")
+            if status == "timeout":
+                f.write(f"[timeout] killed after {self.timeout_s}s\n")
+            elif status == "cancelled":
+                f.write("[cancelled] fail-fast after another command failed\n")
+
+        if status != "passed" and self.fail_fast:
+            self._cancel_running()
+        return {"status": status, "exit": rc, "ms": int(dt * 1000), "log": log_fp}
+
+    def _cancel_running(self) -> None:
+        self._stop.set()
+        with self._lock:
+            procs = list(self._running.values())
+        for proc in procs:
+            _kill_tree(proc)
 
     def run(self, phase: TestPhase, commands: List[str]) -> TestResult:
         if not commands:
@@ -63,17 +127,36 @@ class Evaluator:
                 logs_path=self.logs_dir / f"{phase}_empty.log",
             )
 
-        total_ok = True
-        total_ms = 0.0
+        self.logs_dir.mkdir(parents=True, exist_ok=True)
+        self._stop.clear()
+        t0 = time.perf_counter()
+        indexed = list(enumerate(commands, start=1))
+        if self.jobs == 1:
+            results = [self._run_command(cmd, i) for i, cmd in indexed]
+        else:
+            with ThreadPoolExecutor(max_workers=min(self.jobs, len(indexed))) as pool:
+                results = list(pool.map(lambda ic: self._run_command(ic[1], ic[0]), indexed))
+        wall_ms = int((time.perf_counter() - t0) * 1000)
+
         logs_index: Dict[str, str] = {}
-        for i, cmd in enumerate(commands, start=1):
-            ok, dt, log_fp = self._run_command(cmd, i)
-            logs_index[f"cmd_{i:02d}"] = log_fp.name
-            total_ok = total_ok and ok
-            total_ms += dt
+        command_reports: Dict[str, Dict[str, Any]] = {}
+        for (i, cmd), res in zip(indexed, results):
+            key = f"cmd_{i:02d}"
+            command_reports[key] = {"cmd": cmd, "status": res["status"], "exit": res["exit"], "ms": res["ms"]}
+            if res["status"] != "skipped":
+                logs_index[key] = res["log"].name
+        total_ok = all(r["status"] == "passed" for r in results)
+        critical_ms = max(r["ms"] for r in results)
+        total_cmd_ms = sum(r["ms"] for r in results)
 
         # Write a small reports index JSON
-        reports = {"logs": logs_index}
+        reports = {
+            "logs": logs_index,
+            "commands": command_reports,
+            "jobs": self.jobs,
+            "wall_ms": wall_ms,
+            "critical_path_ms": critical_ms,
+        }
         reports_fp = self.reports_dir / f"{phase}_reports.json"
         self.reports_dir.mkdir(parents=True, exist_ok=True)
         with open(reports_fp, "w", encoding="utf-8") as f:
@@ -81,7 +164,32 @@ class Evaluator:
         return TestResult(
             phase=phase,
             passed=total_ok,
-            duration_ms=int(total_ms * 1000),
+            duration_ms=wall_ms,
             reports=reports,
             logs_path=reports_fp,
+            critical_path_ms=critical_ms,
+            total_command_ms=total_cmd_ms,
         )
+
+
+def _new_group_kwargs() -> Dict[str, Any]:
+    """Start each shell in its own process group so a kill takes its children too."""
+    if os.name == "nt":
+        return {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+    return {"start_new_session": True}
+
+
+def _kill_tree(proc: subprocess.Popen) -> None:
+    if proc.poll() is not None:
+        return
+    try:
+        if os.name == "nt":
+            subprocess.run(
+                ["taskkill", "/F", "/T", "/PID", str(proc.pid)],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+        else:
+            os.killpg(proc.pid, signal.SIGKILL)
+    except (OSError, subprocess.SubprocessError):
+        proc.kill()
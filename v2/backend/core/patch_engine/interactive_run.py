@@ -11,7 +11,7 @@ import hashlib
 
 from .config import PatchEngineConfig
 from .scope import Scope
-from .workspace import WorkspaceManager, sha256_dir
+from .workspace import WorkspaceManager, merkle_dir
 from .evaluator import Evaluator, TestPhase
 from .applier import PatchApplier
 from .run_manifest import RunManifest, new_run_id
@@ -47,6 +47,7 @@ def run_one(
         snapshots_root=cfg.snapshots_root,
         archives_root=cfg.archives_root,
         keep_last_snapshots=cfg.keep_last_snapshots,
+        link_mode=cfg.workspace_link_mode,
     )
 
     # Ensure mirror exists (seed if necessary)
@@ -110,19 +111,22 @@ def run_one(
 
     # Working copy
     ws.clone_to_workspace(workspace_dir)
+    base_tree = ws.mirror_tree_digest()
     manifest.add_section(
         "workspace",
-        {"path": str(workspace_dir), "base_mirror_digest": sha256_dir(cfg.mirror_current)},
+        {"path": str(workspace_dir), "base_mirror_digest": base_tree.root, "digest_scheme": "merkle-sha256"},
     )
 
     # Initial tests
-    evaluator = Evaluator(workspace=workspace_dir, logs_dir=logs_dir / "initial", reports_dir=reports_dir)
+    eval_opts = {"jobs": cfg.test_jobs, "timeout_s": cfg.test_timeout_s, "fail_fast": cfg.test_fail_fast}
+    evaluator = Evaluator(workspace=workspace_dir, logs_dir=logs_dir / "initial", reports_dir=reports_dir, **eval_opts)
     initial_res = evaluator.run(TestPhase.INITIAL, cfg.initial_tests)
     manifest.add_section(
         "initial_tests",
         {
             "passed": initial_res.passed,
             "duration_ms": initial_res.duration_ms,
+            "critical_path_ms": initial_res.critical_path_ms,
             "reports": initial_res.reports,
             "logs_path": str(initial_res.logs_path),
         },
@@ -134,7 +138,14 @@ def run_one(
     # Snapshot (pre-change) & optional archive
     snap_id, snap_dir = ws.snapshot_mirror()
     manifest.add_section(
-        "snapshot", {"snapshot_id": snap_id, "path": str(snap_dir), "digest": sha256_dir(snap_dir)}
+        "snapshot",
+        {
+            "snapshot_id": snap_id,
+            "path": str(snap_dir),
+            # Same scheme as workspace.base_mirror_digest, so the two can be compared
+            "digest": merkle_dir(snap_dir)[0].root,
+            "digest_scheme": "merkle-sha256",
+        },
     )
     if cfg.archive_enabled:
         archive_path = ws.archive_snapshot(snap_dir, f"prechange_{snap_id}")
@@ -158,13 +169,14 @@ def run_one(
         return manifest
 
     # Extensive tests
-    evaluator2 = Evaluator(workspace=workspace_dir, logs_dir=logs_dir / "extensive", reports_dir=reports_dir)
+    evaluator2 = Evaluator(workspace=workspace_dir, logs_dir=logs_dir / "extensive", reports_dir=reports_dir, **eval_opts)
     ext_res = evaluator2.run(TestPhase.EXTENSIVE, cfg.extensive_tests)
     manifest.add_section(
         "extensive_tests",
         {
             "passed": ext_res.passed,
             "duration_ms": ext_res.duration_ms,
+            "critical_path_ms": ext_res.critical_path_ms,
             "reports": ext_res.reports,
             "logs_path": str(ext_res.logs_path),
         },
@@ -175,13 +187,14 @@ def run_one(
 
     # Promotion is explicitly disabled unless cfg.promotion_enabled is True
     if getattr(cfg, "promotion_enabled", False):
-        from .workspace import sha256_dir as _d  # local alias
         ws.promote(workspace_dir)
+        new_tree = ws.mirror_tree_digest()
         manifest.add_section(
             "promotion",
             {
                 "status": "promoted",
-                "new_mirror_digest": _d(cfg.mirror_current),
+                "new_mirror_digest": new_tree.root,
+                "changed_dirs": new_tree.changed_dirs(base_tree),
                 "promotion_enabled": True,
             },
         )
@@ -193,7 +206,7 @@ def run_one(
                 "status": "skipped",
                 "reason": "promotion_disabled",
                 "would_promote_from": str(workspace_dir),
-                "current_mirror_digest": sha256_dir(cfg.mirror_current),
+                "current_mirror_digest": ws.mirror_tree_digest().root,
                 "promotion_enabled": False,
             },
         )
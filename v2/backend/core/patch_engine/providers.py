@@ -1,7 +1,8 @@
 # v2/backend/core/patch_engine/providers.py
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
 import os, json, re, shutil
 from datetime import datetime
 import dataclasses
@@ -16,10 +17,10 @@ from v2.backend.core.utils.io.output_writer import OutputWriter
 
 # Be resilient to either package layout (v2.patches.* or patches.*)
 try:
-    from v2.patches.core.rewrite import apply_docstring_update
+    from v2.patches.core.rewrite import apply_docstring_updates
     from v2.patches.core.patch_ops import PatchOps
 except Exception:
-    from patches.core.rewrite import apply_docstring_update  # type: ignore
+    from patches.core.rewrite import apply_docstring_updates  # type: ignore
     from patches.core.patch_ops import PatchOps  # type: ignore
 
 
@@ -134,13 +135,65 @@ def _prune_empty_dirs(run_root: Path, subdirs: List[str]) -> None:
             continue
 
 
+# -------------------- per-file patch work --------------------
+def _apply_file_group(
+    relpath: str,
+    abspath: str,
+    updates: List[Tuple[int, str]],
+    base: str,
+    run_root: Path,
+    file_ops: FileOps,
+    patch_ops: PatchOps,
+) -> Dict[str, Any]:
+    """
+    Read one file once, apply all of its docstring updates in a single pass,
+    write one combined unified diff and the sandbox copy.
+    """
+    res: Dict[str, Any] = {"patch": None, "applied": [False] * len(updates), "error": None, "warn": None}
+    try:
+        original_src = file_ops.read_text(Path(abspath))
+    except Exception as e:
+        res["error"] = f"ReadError: {e}"
+        return res
+
+    try:
+        updated_src, res["applied"] = apply_docstring_updates(original_src, updates, relpath=relpath)
+    except Exception as e:
+        res["error"] = f"RewriteError: {e}"
+        return res
+
+    # 1) unified diff into /patches/
+    try:
+        res["patch"] = patch_ops.write_patch(
+            run_root=run_root / "patches",
+            base_name=base,
+            original_src=original_src,
+            updated_src=updated_src,
+            relpath_label=relpath,
+        )
+    except Exception as e:
+        res["error"] = f"PatchWriteError: {e}"
+        return res
+
+    # 2) updated file into /sandbox_applied/
+    try:
+        patch_ops.apply_to_sandbox(run_root, relpath, updated_src)
+    except Exception as e:
+        res["warn"] = f"SandboxWriteWarning: {e}"
+    return res
+
+
 # -------------------- capability: write patches (UNIFIED DIFFS) + populate run folders --------------------
 def apply_files_v1(task: Task, context: Dict[str, Any]) -> List[Artifact]:
     """
     Spine capability: patch.apply_files.v1
 
+    Items are grouped by file: each file is read and parsed once, all of its
+    updates are applied bottom-up in one pass, and one combined diff is written
+    per file. Files are processed on a thread pool (`workers`).
+
     Writes:
-      - patches/*.patch     (unified diffs)
+      - patches/*.patch     (one unified diff per file)
       - sandbox_applied/... (updated files)
       - items/*.json        (per-item intents)
       - summary.csv         (append-only)
@@ -157,6 +210,7 @@ def apply_files_v1(task: Task, context: Dict[str, Any]) -> List[Artifact]:
       - raw_responses: list[dict] responses from LLM provider
       - prepared_batch: list[dict] prompt build batch
       - verify_summary: dict with 'count' and 'errors'
+      - workers: int, files processed concurrently (default min(8, cpu count))
     """
     p: Dict[str, Any] = dict(getattr(task, "payload", {}) or {})
     out_base: str = str(p.get("out_base") or "").strip()
@@ -245,65 +299,68 @@ def apply_files_v1(task: Task, context: Dict[str, Any]) -> List[Artifact]:
         errors.append({"stage": "verify_reports", "error": f"{type(e).__name__}: {e}"})
 
     # ---------- patches + sandbox + items + summary ----------
+    # Group by file, keeping first-seen file order and item order within a file
+    groups: Dict[Tuple[str, str], List[Tuple[int, Dict[str, Any]]]] = {}
     for idx, it in enumerate(items):
         relpath = (it.get("relpath") or it.get("file") or "").replace("\\", "/")
         abspath = it.get("path") or ""
-        doc = it.get("docstring") or ""
-        lineno = int(it.get("target_lineno") or 1)
-
-        rec_id = str(it.get("id", idx))
-        signature = str(it.get("signature", ""))
-
         if not relpath or not abspath:
             errors.append({"index": idx, "error": "Missing relpath/path"})
-            out.append_summary(rec_id, relpath or "", signature, "", False, "Missing relpath/path")
-            continue
-
-        try:
-            original_src = file_ops.read_text(Path(abspath))
-        except Exception as e:
-            errors.append({"index": idx, "error": f"ReadError: {e}", "path": abspath})
-            out.append_summary(rec_id, relpath, signature, "", False, f"ReadError: {e}")
-            continue
-
-        try:
-            updated_src = apply_docstring_update(original_src, lineno, str(doc), relpath=relpath)
-        except Exception as e:
-            errors.append({"index": idx, "error": f"RewriteError: {e}", "path": abspath})
-            out.append_summary(rec_id, relpath, signature, "", False, f"RewriteError: {e}")
+            out.append_summary(str(it.get("id", idx)), relpath or "", str(it.get("signature", "")), "", False,
+                               "Missing relpath/path")
             continue
+        groups.setdefault((relpath, str(abspath)), []).append((idx, it))
 
+    jobs: List[Tuple[str, str, List[Tuple[int, Dict[str, Any]]], str]] = []
+    bases: Dict[str, int] = {}
+    for (relpath, abspath), members in groups.items():
         base = re.sub(r"[^A-Za-z0-9_.-]+", "_", relpath)
+        seen = bases.get(base, 0)
+        bases[base] = seen + 1
+        jobs.append((relpath, abspath, members, base if not seen else f"{base}__{seen + 1}"))
 
-        # 1) unified diff into /patches/
-        try:
-            patch_fp = patch_ops.write_patch(
-                run_root=patches_root,
-                base_name=base,
-                original_src=original_src,
-                updated_src=updated_src,
-                relpath_label=relpath,
-                per_item_suffix=f"__{idx:02d}",
-            )
-        except Exception as e:
-            errors.append({"index": idx, "error": f"PatchWriteError: {e}", "relpath": relpath})
-            out.append_summary(rec_id, relpath, signature, "", False, f"PatchWriteError: {e}")
-            continue
+    workers = max(1, int(p.get("workers") or min(8, os.cpu_count() or 1)))
 
-        # 2) updated file into /sandbox_applied/
-        try:
-            patch_ops.apply_to_sandbox(run_root, relpath, updated_src)
-        except Exception as e:
-            errors.append({"index": idx, "warn": f"SandboxWriteWarning: {e}", "relpath": relpath})
+    def _run(job: Tuple[str, str, List[Tuple[int, Dict[str, Any]]], str]) -> Dict[str, Any]:
+        relpath, abspath, members, base = job
+        updates = [(int(it.get("target_lineno") or 1), str(it.get("docstring") or "")) for _i, it in members]
+        return _apply_file_group(relpath, abspath, updates, base, run_root, file_ops, patch_ops)
 
-        # 3) persist the input item
-        try:
-            out.write_item({"id": rec_id, **it})
-        except Exception:
-            pass
-
-        written.append({"patch": str(patch_fp), "relpath": relpath})
-        out.append_summary(rec_id, relpath, signature, str(patch_fp), True, "")
+    if workers > 1 and len(jobs) > 1:
+        with ThreadPoolExecutor(max_workers=min(workers, len(jobs)), thread_name_prefix="apply-files") as pool:
+            results: List[Dict[str, Any]] = list(pool.map(_run, jobs))
+    else:
+        results = [_run(job) for job in jobs]
+
+    # Reports are written here, in item order per file, so they do not depend on scheduling
+    for (relpath, abspath, members, _base), res in zip(jobs, results):
+        patch_fp: Optional[Path] = res["patch"]
+        applied_ids: List[str] = []
+        for (idx, it), applied in zip(members, res["applied"]):
+            rec_id = str(it.get("id", idx))
+            signature = str(it.get("signature", ""))
+            if res["error"]:
+                loc = {"path": abspath} if res["error"].startswith(("ReadError", "RewriteError")) else {"relpath": relpath}
+                errors.append({"index": idx, "error": res["error"], **loc})
+                out.append_summary(rec_id, relpath, signature, "", False, res["error"])
+                continue
+
+            # persist the input item
+            try:
+                out.write_item({"id": rec_id, **it})
+            except Exception:
+                pass
+
+            if applied:
+                applied_ids.append(rec_id)
+                out.append_summary(rec_id, relpath, signature, str(patch_fp), True, "")
+            else:
+                out.append_summary(rec_id, relpath, signature, str(patch_fp), False,
+                                   "NoChange: no matching symbol, superseded or overlapping")
+        if res["warn"]:
+            errors.append({"index": members[0][0], "warn": res["warn"], "relpath": relpath})
+        if patch_fp is not None:
+            written.append({"patch": str(patch_fp), "relpath": relpath, "items": applied_ids})
 
     # ---------- FINALIZE: normalize & prune ----------
     try:
@@ -333,6 +390,7 @@ def apply_files_v1(task: Task, context: Dict[str, Any]) -> List[Artifact]:
 
     meta = {
         "count": len([w for w in written if w.get("patch")]),
+        "items_applied": sum(len(w.get("items") or []) for w in written),
         "run_dir": str(run_root),
         "patches": written,
         "errors": errors,
@@ -1,12 +1,33 @@
 # File: backend/core/patch_engine/workspace.py
 from __future__ import annotations
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Dict, List, Optional
 import os
+import json
 import shutil
 import hashlib
 import time
 
+try:  # reflinks are a Linux ioctl (btrfs, XFS, bcachefs, overlayfs on those)
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+# <linux/fs.h>: _IOW(0x94, 9, int)
+FICLONE = 0x40049409
+
+LINK_MODES = ("copy", "hardlink", "reflink", "auto")
+OBJECTS_DIR = "objects"
+_INLINE_HASH_MAX = 1 << 20
+
+# Files at least this large are hashed on a thread pool (hashlib drops the GIL)
+PARALLEL_HASH_MIN = 4 << 20
+# Files modified this close to the start of a scan are hashed but not cached,
+# since a same-tick rewrite would leave (inode, size, mtime_ns) unchanged.
+_RACY_NS = 2_000_000_000
+
 
 def now_ts() -> str:
     return time.strftime("%Y-%m-%d_%H-%M-%SZ", time.gmtime())
@@ -30,12 +51,181 @@ def sha256_dir(root: Path) -> str:
     return sha.hexdigest()
 
 
+@dataclass
+class TreeDigest:
+    """
+    Merkle digest of a directory tree.
+
+    files: posix relpath -> sha256 of content
+    dirs:  posix relpath ('' is the root) -> sha256 over the sorted
+           ("f"|"d", name, digest) entries of that directory
+    """
+    root: str
+    dirs: Dict[str, str]
+    files: Dict[str, str]
+    hashed: int = 0  # files actually read in this scan (cache misses)
+
+    def changed_dirs(self, other: "TreeDigest") -> List[str]:
+        """Directories whose digest differs from 'other' (including added/removed ones)."""
+        keys = set(self.dirs) | set(other.dirs)
+        return sorted(k for k in keys if self.dirs.get(k) != other.dirs.get(k))
+
+    def changed_files(self, other: "TreeDigest") -> List[str]:
+        keys = set(self.files) | set(other.files)
+        return sorted(k for k in keys if self.files.get(k) != other.files.get(k))
+
+
+def merkle_dir(
+    root: Path,
+    cache: Optional[Dict[str, list]] = None,
+    *,
+    workers: Optional[int] = None,
+    parallel_min_bytes: int = PARALLEL_HASH_MIN,
+) -> tuple[TreeDigest, Dict[str, list]]:
+    """
+    Merkle digest of 'root'. 'cache' maps relpath -> [inode, size, mtime_ns, sha256]
+    from a previous scan; files whose stat key still matches are not re-read.
+    Returns (digest, new_cache); new_cache holds only files present now.
+    Unreadable files are skipped, as in sha256_dir.
+    """
+    root = root.resolve()
+    cache = cache or {}
+    new_cache: Dict[str, list] = {}
+    racy_after = time.time_ns() - _RACY_NS
+    files: Dict[str, str] = {}
+    large: List[tuple[str, str, list]] = []
+    children: Dict[str, List[str]] = {}
+    hashed = 0
+
+    for dirpath, _, filenames in os.walk(root):
+        rel_dir = os.path.relpath(dirpath, root).replace(os.sep, "/")
+        rel_dir = "" if rel_dir == "." else rel_dir
+        children.setdefault(rel_dir, [])
+        if rel_dir:
+            children.setdefault(rel_dir.rpartition("/")[0], []).append(rel_dir)
+        for name in filenames:
+            fp = os.path.join(dirpath, name)
+            rel = f"{rel_dir}/{name}" if rel_dir else name
+            try:
+                st = os.stat(fp)
+            except OSError:
+                continue
+            key = [st.st_ino, st.st_size, st.st_mtime_ns]
+            hit = cache.get(rel)
+            if hit is not None and hit[:3] == key:
+                files[rel] = hit[3]
+                new_cache[rel] = hit
+                continue
+            if st.st_size >= parallel_min_bytes:
+                large.append((rel, fp, key))
+                continue
+            try:
+                digest = _sha256_file(Path(fp))
+            except OSError:
+                continue
+            hashed += 1
+            files[rel] = digest
+            if st.st_mtime_ns < racy_after:
+                new_cache[rel] = key + [digest]
+
+    if large:
+        def _hash(item: tuple[str, str, list]) -> Optional[str]:
+            try:
+                return _sha256_file(Path(item[1]))
+            except OSError:
+                return None
+
+        n = workers or min(8, os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=max(1, min(n, len(large)))) as pool:
+            for (rel, _, key), digest in zip(large, pool.map(_hash, large)):
+                if digest is None:
+                    continue
+                hashed += 1
+                files[rel] = digest
+                if key[2] < racy_after:
+                    new_cache[rel] = key + [digest]
+
+    by_dir: Dict[str, List[tuple[str, str, str]]] = {d: [] for d in children}
+    for rel, digest in files.items():
+        parent, _, name = rel.rpartition("/")
+        by_dir[parent].append(("f", name, digest))
+    dirs: Dict[str, str] = {}
+    # Deepest first, so every child is done before its parent
+    for d in sorted(children, key=lambda x: x.count("/") + bool(x), reverse=True):
+        entries = by_dir[d] + [("d", c.rpartition("/")[2], dirs[c]) for c in children[d]]
+        sha = hashlib.sha256()
+        for kind, name, digest in sorted(entries, key=lambda e: e[1]):
+            sha.update(f"{kind}\0{name}\0{digest}\n".encode("utf-8"))
+        dirs[d] = sha.hexdigest()
+    return TreeDigest(root=dirs[""], dirs=dirs, files=files, hashed=hashed), new_cache
+
+
+def _sha256_file(fp: Path) -> str:
+    sha = hashlib.sha256()
+    with open(fp, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+def reflink_file(src: Path, dst: Path) -> bool:
+    """
+    Clone src → dst sharing extents (FICLONE). Returns False, leaving no dst
+    behind, when the platform or filesystem cannot do it.
+    """
+    if fcntl is None:
+        return False
+    try:
+        with open(src, "rb") as fs, open(dst, "wb") as fd:
+            fcntl.ioctl(fd.fileno(), FICLONE, fs.fileno())
+    except OSError:
+        try:
+            os.unlink(dst)
+        except OSError:
+            pass
+        return False
+    shutil.copystat(src, dst)
+    return True
+
+
+def break_link(path: Path) -> None:
+    """
+    Give 'path' its own inode if it is a hardlink shared with another tree, so an
+    in-place write cannot leak into the mirror or a snapshot. Call before
+    opening a workspace file for writing; no-op for unshared or missing files.
+    """
+    try:
+        st = os.lstat(path)
+    except FileNotFoundError:
+        return
+    if st.st_nlink <= 1 or not os.path.isfile(path) or os.path.islink(path):
+        return
+    tmp = path.with_name(path.name + ".__cow")
+    if not reflink_file(path, tmp):
+        shutil.copy2(path, tmp)
+    os.replace(tmp, path)
+
+
 @dataclass
 class WorkspaceManager:
     mirror_current: Path
     snapshots_root: Path
     archives_root: Path
     keep_last_snapshots: int = 5
+    # How clones/snapshots/promotions materialise files:
+    #   copy     - full copies (original behaviour)
+    #   hardlink - hardlink farm; writers must call break_link() first
+    #   reflink  - copy-on-write clones, falling back to copies
+    #   auto     - reflink, else hardlink, else copy
+    # Any mode other than 'copy' also makes snapshots content-addressed.
+    link_mode: str = "copy"
+    _reflink_ok: bool = field(default=True, init=False, repr=False)
+    _digests: dict = field(default_factory=dict, init=False, repr=False)
+    _file_digests: Optional[dict] = field(default=None, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.link_mode not in LINK_MODES:
+            raise ValueError(f"link_mode must be one of {LINK_MODES}, got {self.link_mode!r}")
 
     def ensure_mirror_seeded(self, seed_dir: Path | None) -> None:
         """
@@ -69,7 +259,7 @@ class WorkspaceManager:
     def clone_to_workspace(self, workspace_dir: Path) -> None:
         if workspace_dir.exists():
             shutil.rmtree(workspace_dir)
-        shutil.copytree(self.mirror_current, workspace_dir)
+        self._clone_tree(self.mirror_current, workspace_dir)
 
     def snapshot_mirror(self) -> tuple[str, Path]:
         snap_id = now_ts()
@@ -77,7 +267,10 @@ class WorkspaceManager:
         dest.parent.mkdir(parents=True, exist_ok=True)
         if dest.exists():
             shutil.rmtree(dest)
-        shutil.copytree(self.mirror_current, dest)
+        if self.link_mode == "copy":
+            shutil.copytree(self.mirror_current, dest)
+        else:
+            self._snapshot_content_addressed(self.mirror_current, dest)
         self._gc_old_snapshots()
         return snap_id, dest
 
@@ -89,7 +282,7 @@ class WorkspaceManager:
         staging = parent / (self.mirror_current.name + "__staging")
         if staging.exists():
             shutil.rmtree(staging)
-        shutil.copytree(from_workspace, staging)
+        self._clone_tree(from_workspace, staging)
 
         tmp_old = parent / (self.mirror_current.name + "__old")
         if tmp_old.exists():
@@ -114,11 +307,146 @@ class WorkspaceManager:
         return archive_path
 
     def mirror_digest(self) -> str:
+        """Flat sha256_dir digest of the mirror (full read); mirror_tree_digest() is the cached Merkle one."""
         return sha256_dir(self.mirror_current)
 
+    def mirror_tree_digest(self) -> TreeDigest:
+        """
+        Merkle digest of the mirror with per-directory digests. Per-file hashes are
+        cached on (inode, size, mtime_ns) in '<mirror>.digests.json' beside the
+        mirror, so only files changed since the last call are re-read. Its root is
+        not comparable with sha256_dir()/mirror_digest(); compare it with
+        merkle_dir() of another tree (e.g. a snapshot).
+        """
+        cache_path = self._digest_cache_path()
+        if self._file_digests is None:
+            try:
+                self._file_digests = json.loads(cache_path.read_text(encoding="utf-8")).get("files", {})
+            except (OSError, ValueError, AttributeError):
+                self._file_digests = {}
+        digest, new_cache = merkle_dir(self.mirror_current, self._file_digests)
+        if new_cache != self._file_digests:
+            tmp = cache_path.with_name(cache_path.name + ".tmp")
+            try:
+                tmp.write_text(json.dumps({"version": 1, "files": new_cache}, separators=(",", ":")), encoding="utf-8")
+                os.replace(tmp, cache_path)
+            except OSError:
+                pass  # cache is an optimisation only
+        self._file_digests = new_cache
+        return digest
+
+    def _digest_cache_path(self) -> Path:
+        return self.mirror_current.parent / f"{self.mirror_current.name}.digests.json"
+
+    # ---------- copy-on-write helpers ----------
+
+    def _link_file(self, src: str, dst: str) -> str:
+        """copytree copy_function: materialise one file according to link_mode."""
+        mode = self.link_mode
+        if mode in ("reflink", "auto") and self._reflink_ok:
+            if reflink_file(Path(src), Path(dst)):
+                return dst
+            # Same filesystem for the whole tree, so don't retry per file
+            self._reflink_ok = False
+        if mode in ("hardlink", "auto"):
+            try:
+                os.link(src, dst)
+                return dst
+            except OSError:
+                pass  # cross-device or unsupported: copy
+        return shutil.copy2(src, dst)
+
+    def _clone_tree(self, src: Path, dst: Path) -> None:
+        if self.link_mode == "copy":
+            shutil.copytree(src, dst)
+        else:
+            shutil.copytree(src, dst, copy_function=self._link_file)
+
+    def _object_for(self, src: str, store: str, known: set) -> str:
+        """
+        Return the store object holding src's content, adding it if missing.
+        Objects are always independent copies (or reflinks) of the mirror, never
+        hardlinks to it, so in-place writes to the mirror cannot reach them.
+        """
+        st = os.stat(src)
+        key = (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns)
+        digest = self._digests.get(key)
+        data = None
+        if digest is None:
+            if st.st_size <= _INLINE_HASH_MAX:
+                # Small file: read once, hash, and reuse the bytes if the object is new
+                with open(src, "rb") as f:
+                    data = f.read()
+                digest = hashlib.sha256(data).hexdigest()
+            else:
+                digest = _sha256_file(Path(src))
+            self._digests[key] = digest
+        fan = os.path.join(store, digest[:2])
+        obj = os.path.join(fan, digest)
+        if digest not in known:
+            if fan not in known:
+                os.makedirs(fan, exist_ok=True)
+                known.add(fan)
+            if not os.path.exists(obj):
+                tmp = f"{obj}.{os.getpid()}.tmp"
+                if self._reflink_ok and reflink_file(Path(src), Path(tmp)):
+                    pass
+                elif data is not None:
+                    self._reflink_ok = False
+                    with open(tmp, "wb") as f:
+                        f.write(data)
+                    shutil.copystat(src, tmp)
+                else:
+                    self._reflink_ok = False
+                    shutil.copy2(src, tmp)
+                os.replace(tmp, obj)
+            known.add(digest)
+        return obj
+
+    def _snapshot_content_addressed(self, src: Path, dest: Path) -> None:
+        """
+        Build 'dest' as hardlinks into snapshots_root/objects/<sha[:2]>/<sha>, so
+        files unchanged between snapshots occupy the disk once.
+        """
+        src_root = str(src.resolve())
+        store = str(self.snapshots_root / OBJECTS_DIR)
+        # One listing of the store instead of a stat per object
+        known: set = set()
+        if os.path.isdir(store):
+            for fan in os.scandir(store):
+                known.add(fan.path)
+                known.update(os.listdir(fan.path))
+        for dirpath, _, filenames in os.walk(src_root):
+            out_dir = os.path.join(dest, os.path.relpath(dirpath, src_root))
+            os.makedirs(out_dir, exist_ok=True)
+            for name in filenames:
+                obj = self._object_for(os.path.join(dirpath, name), store, known)
+                out = os.path.join(out_dir, name)
+                try:
+                    os.link(obj, out)
+                except OSError:
+                    shutil.copy2(obj, out)
+
     def _gc_old_snapshots(self) -> None:
-        snaps = sorted([p for p in self.snapshots_root.iterdir() if p.is_dir()], key=lambda p: p.name)
+        snaps = sorted(
+            [p for p in self.snapshots_root.iterdir() if p.is_dir() and p.name != OBJECTS_DIR],
+            key=lambda p: p.name,
+        )
         if len(snaps) <= self.keep_last_snapshots:
             return
         for p in snaps[:-self.keep_last_snapshots]:
             shutil.rmtree(p, ignore_errors=True)
+        self._gc_objects()
+
+    def _gc_objects(self) -> None:
+        """Drop store objects no longer linked from any snapshot."""
+        store = self.snapshots_root / OBJECTS_DIR
+        if not store.is_dir():
+            return
+        for fan in store.iterdir():
+            for obj in fan.iterdir():
+                try:
+                    if obj.stat().st_nlink <= 1:
+                        obj.unlink()
+                except OSError:
+                    continue
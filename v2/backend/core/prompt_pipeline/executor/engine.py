@@ -341,6 +341,8 @@ def run_v1(task_like: Any, context: Optional[Dict[str, Any]] = None, **kwargs) -
                     for b in messages_batch
                 ],
                 "ask_spec": payload.get("ask_spec") or {},
+                "concurrency": payload.get("llm_concurrency", 1),
+                "cache": payload.get("llm_cache"),
             },
             {"phase": "LLM"},
         )
@@ -370,6 +372,8 @@ def run_v1(task_like: Any, context: Optional[Dict[str, Any]] = None, **kwargs) -
                 "model": payload.get("model"),
                 "batches": per_item_batches,
                 "ask_spec": payload.get("ask_spec") or {},
+                "concurrency": payload.get("llm_concurrency", 1),
+                "cache": payload.get("llm_cache"),
             },
             {"phase": "LLM.FALLBACK"},
         )
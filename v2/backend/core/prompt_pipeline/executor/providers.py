@@ -5,8 +5,9 @@ This module must remain domain-agnostic. It turns DB/introspection records into
 generic pipeline "items" the engine can pass to domain adapters via Spine.
 
 Capabilities implemented here:
-  - retriever.enrich.v1 -> enrich_v1
-  - results.unpack.v1   -> unpack_results_v1
+  - retriever.enrich.v1  -> enrich_v1
+  - retriever.similar.v1 -> similar_v1
+  - results.unpack.v1    -> unpack_results_v1
 """
 from __future__ import annotations
 
@@ -14,6 +15,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Sequence
 import fnmatch
+import math
 import os
 
 
@@ -72,7 +74,9 @@ def enrich_v1(task_like: Any, context: Optional[Dict[str, Any]] = None, **kwargs
       "project_root": "",        # optional; defaults to CWD
       "records": [ {...}, ... ], # rows from introspect.fetch
       "exclude_globs": ["output/**", ...],
-      "segment_excludes": ["**/__pycache__/**", ...]  # alias of exclude_globs
+      "segment_excludes": ["**/__pycache__/**", ...], # alias of exclude_globs
+      "related_top_n": 0,        # >0: attach context.related from the FTS5 index
+      "sqlalchemy_url": ""       # required when related_top_n > 0
     }
 
     Returns:
@@ -84,11 +88,17 @@ def enrich_v1(task_like: Any, context: Optional[Dict[str, Any]] = None, **kwargs
           "relpath": "",
           "signature": "",
           "lang": "",
-          "context": { ... }  # passthrough extras
+          "context": { ... }  # passthrough extras (+ "related": [...])
         },
         ...
       ]
     }
+
+    With related_top_n, every kept item whose record has a name/description
+    gets context.related: the top-N other symbols by BM25 over
+    introspection_index_fts ({id, file, filetype, line, name, score}), looked up
+    in one batch (see introspect.fts). Lookup failures leave items unchanged and
+    add "related_error".
     """
     payload: Dict[str, Any] = (getattr(task_like, "payload", None) or task_like or {})
     payload.update(kwargs or {})
@@ -96,8 +106,10 @@ def enrich_v1(task_like: Any, context: Optional[Dict[str, Any]] = None, **kwargs
     root = payload.get("root") or payload.get("project_root") or os.getcwd()
     records: List[Dict[str, Any]] = list(payload.get("records") or [])
     exclude_globs: List[str] = list(payload.get("exclude_globs") or payload.get("segment_excludes") or [])
+    related_top_n = int(payload.get("related_top_n") or 0)
 
     items: List[Dict[str, Any]] = []
+    kept: List[Dict[str, Any]] = []
     for r in records:
         rid = str(r.get("id") or r.get("relpath") or r.get("path") or "")
         # Crucial fix: accept DB row shapes {'file': '...'} or {'filepath': '...'}
@@ -127,13 +139,119 @@ def enrich_v1(task_like: Any, context: Optional[Dict[str, Any]] = None, **kwargs
                 "context": item.context,
             }
         )
+        kept.append(r)
 
     result: Dict[str, Any] = {"items": items}
+    if related_top_n > 0 and items:
+        url = payload.get("sqlalchemy_url")
+        if not url:
+            result["related_error"] = "related_top_n requires sqlalchemy_url"
+        else:
+            try:
+                from v2.backend.core.introspect import fts
+
+                stats: Dict[str, int] = {}
+                related = fts.related_batch(
+                    url,
+                    ((r.get("id"), r.get("name"), r.get("description")) for r in kept),
+                    top_n=related_top_n,
+                    stats=stats,
+                )
+                for it, r in zip(items, kept):
+                    rel = related.get(r.get("id"))
+                    if rel:
+                        it["context"] = dict(it["context"] or {}, related=rel)
+                result["related_stats"] = stats
+            except Exception as e:  # FTS table missing, not SQLite, ...
+                result["related_error"] = f"{type(e).__name__}: {e}"
     if not items:
         result["warning"] = "No valid targets found for this run."
     return result
 
 
+def similar_v1(task_like: Any, context: Optional[Dict[str, Any]] = None, **kwargs) -> Dict[str, Any]:
+    """Top-k cosine neighbours from introspection_index_embeddings.
+
+    Payload (task.payload + kwargs):
+    {
+      "sqlalchemy_url": "sqlite:///...",
+      "model": "",                    # embedding model name (rows are per model)
+      "query_vectors": [[...], ...],  # and/or
+      "query_item_ids": [12, 34],     # use these items' stored embeddings as queries
+      "top_k": 10,
+      "exclude_self": true,           # drop the query item from its own matches
+      "index": "flat",                # "flat" (exact) | "ivf" (approximate)
+      "nlist": null, "nprobe": 8,     # ivf only; nlist defaults to sqrt(n)
+      "cache_dir": null               # default: <sqlite db dir>/.vector_cache
+    }
+
+    Returns:
+    {
+      "results": [ {"query": <item_id or vector index>, "matches": [{"item_id": 1, "score": 0.93}, ...]}, ... ],
+      "count": <queries>,
+      "index": {"model": "", "vectors": n, "dim": d, "kind": "flat"|"ivf"}
+    }
+    On error: {"results": [], "count": 0, "error": "..."}
+    """
+    payload: Dict[str, Any] = (getattr(task_like, "payload", None) or task_like or {})
+    payload.update(kwargs or {})
+
+    url = payload.get("sqlalchemy_url")
+    model = payload.get("model")
+    if not url or not model:
+        return {"results": [], "count": 0, "error": "Missing required payload keys: sqlalchemy_url and model"}
+    top_k = int(payload.get("top_k") or 10)
+    kind = str(payload.get("index") or "flat").lower()
+
+    try:
+        from v2.backend.core.introspect import vectors
+
+        idx = vectors.load_index(url, model, cache_dir=payload.get("cache_dir"))
+        if len(idx) == 0:
+            return {"results": [], "count": 0, "error": f"No embeddings stored for model {model!r}"}
+
+        labels: List[Any] = []
+        queries: List[Any] = []
+        exclude: List[int] = []
+        item_ids = [int(i) for i in payload.get("query_item_ids") or []]
+        if item_ids:
+            rows = idx.rows_of(item_ids)
+            for iid, row in zip(item_ids, rows.tolist()):
+                if row < 0:
+                    continue  # no embedding for this item
+                labels.append(iid)
+                queries.append(idx.matrix[row])
+                exclude.append(row if payload.get("exclude_self", True) else -1)
+        for n, vec in enumerate(payload.get("query_vectors") or []):
+            labels.append(n)
+            queries.append(vec)
+            exclude.append(-1)
+        if not queries:
+            return {"results": [], "count": 0, "error": "No usable query_vectors or query_item_ids"}
+
+        nprobe = None
+        if kind == "ivf":
+            idx.ensure_ivf(payload.get("nlist"))
+            nprobe = int(payload.get("nprobe") or 8)
+        ids, scores = idx.search(queries, top_k, nprobe=nprobe, exclude_rows=exclude)
+    except Exception as e:
+        # Do NOT raise; return a structured, non-string error
+        return {"results": [], "count": 0, "error": f"Similarity search failed: {e}"}
+
+    results = []
+    # Padding slots (id -1, score -inf) are not matches, and -inf is not valid JSON
+    for label, row_ids, row_scores in zip(labels, ids.tolist(), scores.tolist()):
+        results.append({
+            "query": label,
+            "matches": [{"item_id": i, "score": s} for i, s in zip(row_ids, row_scores) if i >= 0 and math.isfinite(s)],
+        })
+    return {
+        "results": results,
+        "count": len(results),
+        "index": {"model": model, "vectors": len(idx), "dim": idx.dim, "kind": "ivf" if nprobe else "flat"},
+    }
+
+
 def unpack_results_v1(task_like: Any, context: Optional[Dict[str, Any]] = None, **kwargs) -> Dict[str, Any]:
     """Domain-agnostic 'unpack' that normalizes various result wrappers into {"items":[...]}.
 
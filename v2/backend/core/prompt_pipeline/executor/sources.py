@@ -22,10 +22,12 @@ import contextlib
 try:
     # SQLAlchemy is expected by the project
     from sqlalchemy import create_engine, text, inspect  # type: ignore
+    from v2.backend.core.db.access import engines  # type: ignore
 except Exception as e:  # pragma: no cover
     create_engine = None  # type: ignore
     text = None  # type: ignore
     inspect = None  # type: ignore
+    engines = None  # type: ignore
 
 
 # ----------------------------- helpers ---------------------------------------
@@ -86,6 +88,14 @@ def _discover_columns(engine, table: str) -> List[str]:
     return cols
 
 
+def _table_columns(url: str, engine, table: str) -> List[str]:
+    """Column names from the process-wide reflection cache, else _discover_columns."""
+    try:
+        return [c.name for c in engines.get_table(url, table).columns]
+    except Exception:
+        return _discover_columns(engine, table)
+
+
 def _make_select_columns(requested: List[str], actual: List[str]) -> Tuple[str, List[str]]:
     """
     Build the SELECT columns clause from requested vs actual.
@@ -192,11 +202,12 @@ def fetch_v1(task_like: Any, context: Optional[Dict[str, Any]] = None, **kwargs)
 
     records: List[Dict[str, Any]] = []
     with contextlib.ExitStack() as stack:
-        engine = create_engine(url, future=True)
+        # Shared engine (pool reused across calls); reflection cached per table
+        engine = engines.get_engine(url)
         conn = stack.enter_context(engine.connect())
 
         # Discover actual columns to avoid selecting non-existent ones
-        actual_cols = _discover_columns(engine, table)
+        actual_cols = _table_columns(url, engine, table)
         select_clause, out_cols = _make_select_columns(columns, actual_cols)
 
         # Build WHERE
@@ -249,6 +260,7 @@ def fetch_v1(task_like: Any, context: Optional[Dict[str, Any]] = None, **kwargs)
                     rec["id"] = rec.get("unique_key_hash") or rec.get("name") or rec.get("filepath") or ""
                 records.append(rec)
         except Exception as e:
+            engines.forget_table(url, table)
             # Do NOT raise; return a structured, non-string error
             return {
                 "records": [],
@@ -0,0 +1,201 @@
+# File: v2/backend/core/prompt_pipeline/llm/bench_llm.py
+"""
+Benchmarks for the LLM layer against a local mock HTTP server (no network).
+
+The mock server speaks just enough of the Chat Completions API for the
+providers: every POST sleeps `latency` seconds (simulated model time) and
+returns a single-choice completion.
+
+Sections:
+  - transport: per-request latency, fresh `urlopen` connection vs the pooled
+    keep-alive transport (loopback, so no TLS/DNS; real endpoints save more)
+  - complete_batches.v1: wall clock as concurrency goes from 1 to 32
+  - cache: a cold run vs a repeated run served from the response cache
+
+Run:
+    python -m v2.backend.core.prompt_pipeline.llm.bench_llm [--batches 64] [--latency 0.05]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Sequence
+from pathlib import Path
+from urllib.request import Request, urlopen
+
+from .cache import get_cache
+from .providers import complete_batches_v1
+from .transport import HTTPPool
+
+
+class _ChatHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # allow keep-alive
+    disable_nagle_algorithm = True  # headers and body go out in separate writes
+
+    def do_POST(self) -> None:  # noqa: N802 (http.server naming)
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.loads(self.rfile.read(length) or b"{}")
+        time.sleep(self.server.latency)  # type: ignore[attr-defined]
+        content = json.dumps({"items": [{"id": "mock-1", "docstring": "Mock."}]})
+        out = json.dumps({
+            "id": "chatcmpl-mock",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model", "mock"),
+            "choices": [{"index": 0, "finish_reason": "stop",
+                         "message": {"role": "assistant", "content": content}}],
+            "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+        }).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(out)))
+        self.end_headers()
+        self.wfile.write(out)
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128  # default backlog (5) drops connections at high concurrency
+
+
+class MockChatServer:
+    """Context manager running a threaded mock Chat Completions server on 127.0.0.1."""
+
+    def __init__(self, latency: float = 0.05) -> None:
+        self.latency = latency
+        self._srv: _Server | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        assert self._srv is not None
+        host, port = self._srv.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def __enter__(self) -> "MockChatServer":
+        self._srv = _Server(("127.0.0.1", 0), _ChatHandler)
+        self._srv.latency = self.latency  # type: ignore[attr-defined]
+        self._thread = threading.Thread(target=self._srv.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        if self._srv is not None:
+            self._srv.shutdown()
+            self._srv.server_close()
+
+
+def _batches(n: int) -> List[List[Dict[str, str]]]:
+    return [[{"role": "user", "content": f"batch {i}"}] for i in range(n)]
+
+
+def bench_transport(base_url: str, *, requests: int = 200) -> Dict[str, float]:
+    """Mean per-request latency (ms): one `urlopen` connection per call vs a keep-alive pool."""
+    url = f"{base_url}/chat/completions"
+    payload = {"model": "mock", "messages": [{"role": "user", "content": "ping"}]}
+    data = json.dumps(payload).encode("utf-8")
+    headers = {"Content-Type": "application/json"}
+
+    t0 = time.perf_counter()
+    for _ in range(requests):
+        with urlopen(Request(url, data=data, headers=headers, method="POST"), timeout=30) as resp:
+            resp.read()
+    fresh = (time.perf_counter() - t0) / requests
+
+    pool = HTTPPool(max_per_host=1)
+    t0 = time.perf_counter()
+    for _ in range(requests):
+        pool.post_json(url, headers, payload, timeout=30)
+    pooled = (time.perf_counter() - t0) / requests
+    pool.close()
+
+    return {"fresh_ms": round(fresh * 1000, 3), "pooled_ms": round(pooled * 1000, 3),
+            "connects": pool.stats["connects"], "requests": requests}
+
+
+def bench_complete_batches(
+    base_url: str,
+    *,
+    batches: int = 64,
+    levels: Sequence[int] = (1, 2, 4, 8, 16, 32),
+) -> List[Dict[str, Any]]:
+    """Time llm.complete_batches.v1 over `batches` requests at each concurrency level."""
+    rows: List[Dict[str, Any]] = []
+    msgs = _batches(batches)
+    for level in levels:
+        t0 = time.perf_counter()
+        results = complete_batches_v1({
+            "provider": "openai",
+            "model": "mock",
+            "batches": msgs,
+            "ask_spec": {},
+            "base_url": base_url,
+            "concurrency": level,
+            "cache": False,
+        })
+        wall = time.perf_counter() - t0
+        errors = sum(1 for r in results if isinstance(r, dict) and "__provider_error__" in r)
+        rows.append({"concurrency": level, "batches": batches, "wall_s": round(wall, 3), "errors": errors})
+    return rows
+
+
+def bench_cache(base_url: str, *, batches: int = 64) -> Dict[str, float]:
+    """Run the same batches twice against a fresh cache; the second run should be all hits."""
+    msgs = _batches(batches)
+    with tempfile.TemporaryDirectory() as td:
+        spec = {"path": str(Path(td) / "responses.sqlite3")}
+        walls = []
+        for _ in range(2):
+            t0 = time.perf_counter()
+            complete_batches_v1({"provider": "openai", "model": "mock", "batches": msgs, "ask_spec": {},
+                                 "base_url": base_url, "cache": spec, "run_dir": td})
+            walls.append(time.perf_counter() - t0)
+        stats = json.loads((Path(td) / "llm" / "cache_stats.json").read_text(encoding="utf-8"))
+        get_cache(spec["path"]).close()
+    return {"cold_s": round(walls[0], 3), "warm_s": round(walls[1], 3),
+            "hits": stats.get("hits", 0), "misses": stats.get("misses", 0)}
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--batches", type=int, default=64)
+    ap.add_argument("--latency", type=float, default=0.05, help="simulated per-request latency (seconds)")
+    ap.add_argument("--requests", type=int, default=200, help="requests for the transport section")
+    args = ap.parse_args()
+
+    # The mock server ignores credentials, but the provider insists on one.
+    os.environ.setdefault("OPENAI_API_KEY", "bench-not-a-real-key")
+
+    with MockChatServer(latency=0.0) as srv:
+        t = bench_transport(srv.base_url, requests=args.requests)
+        print(f"[bench_llm] transport: {t['requests']} sequential requests")
+        print(f"  fresh connection  {t['fresh_ms']:>8.3f} ms/request")
+        print(f"  keep-alive pool   {t['pooled_ms']:>8.3f} ms/request  (connects={t['connects']})")
+
+    with MockChatServer(latency=args.latency) as srv:
+        print(f"[bench_llm] complete_batches.v1: {args.batches} batches, latency={args.latency}s")
+        base = None
+        for row in bench_complete_batches(srv.base_url, batches=args.batches):
+            base = base or row["wall_s"]
+            speedup = base / row["wall_s"] if row["wall_s"] else 0.0
+            print(f"  concurrency={row['concurrency']:>2}  wall={row['wall_s']:>7.3f}s  "
+                  f"speedup={speedup:5.1f}x  errors={row['errors']}")
+
+        c = bench_cache(srv.base_url, batches=args.batches)
+        print(f"[bench_llm] cache: {args.batches} batches, sequential")
+        print(f"  cold run  {c['cold_s']:>7.3f}s")
+        print(f"  warm run  {c['warm_s']:>7.3f}s  (hits={c['hits']} misses={c['misses']})")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,220 @@
+# File: v2/backend/core/prompt_pipeline/llm/cache.py
+"""
+Content-addressed, disk-backed LLM response cache (SQLite, stdlib only).
+
+Re-running the pipeline over an unchanged tree sends byte-identical prompts;
+this cache answers those from disk instead of the provider.
+
+Public entry points:
+  - request_key(kind, provider, model, messages, ask_spec, endpoint="") -> str
+  - ResponseCache(path, ttl_secs=..., max_bytes=...)
+      .get(key) -> Optional[str]
+      .put(key, value: str) -> None
+  - get_cache(path=None, **limits) -> ResponseCache   (one instance per path)
+  - open_cache(spec) -> Optional[ResponseCache]       (payload spec; opt-in)
+  - record_stats(run_dir, counts) -> None             (accumulates llm/cache_stats.json)
+
+Notes:
+- The key is a sha256 over canonical JSON (sorted keys, fixed separators) of
+  the request and the endpoint URL it is sent to (the same model name on two
+  servers must not share answers); credentials are never part of it.
+- Caching is opt-in: open_cache() only returns a store for an explicit spec.
+  DEFAULT_CACHE_PATH is relative to the working directory.
+- Entries older than `ttl_secs` are treated as misses and deleted.
+- When the stored payload exceeds `max_bytes`, least-recently-used entries are
+  evicted first.
+- Safe to share across threads (one connection guarded by a lock).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+DEFAULT_CACHE_PATH = Path("output") / "llm_cache" / "responses.sqlite3"
+DEFAULT_TTL_SECS = 7 * 24 * 3600
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS llm_responses (
+    key      TEXT PRIMARY KEY,
+    value    TEXT NOT NULL,
+    size     INTEGER NOT NULL,
+    created  REAL NOT NULL,
+    accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_llm_responses_accessed ON llm_responses(accessed);
+"""
+
+
+def request_key(
+    kind: str,
+    provider: str,
+    model: str,
+    messages: List[Dict[str, Any]],
+    ask_spec: Dict[str, Any],
+    endpoint: str = "",
+) -> str:
+    """
+    Canonical hash of a request. `kind` namespaces callers that store different
+    value shapes (e.g. raw text vs a full response dict) for the same request;
+    `endpoint` is the resolved URL the request goes to.
+    """
+    blob = json.dumps(
+        {"v": 2, "kind": kind, "provider": provider or "", "model": model or "",
+         "endpoint": endpoint or "", "messages": messages or [], "ask_spec": ask_spec or {}},
+        sort_keys=True,
+        ensure_ascii=True,
+        separators=(",", ":"),
+        default=repr,
+    ).encode("utf-8")
+    return hashlib.sha256(blob).hexdigest()
+
+
+class ResponseCache:
+    """SQLite-backed key → text store with TTL and size-bounded LRU eviction."""
+
+    def __init__(
+        self,
+        path: Path | str = DEFAULT_CACHE_PATH,
+        *,
+        ttl_secs: float = DEFAULT_TTL_SECS,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ) -> None:
+        self.path = Path(path)
+        self.ttl_secs = float(ttl_secs)
+        self.max_bytes = int(max_bytes)
+        self.stats = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        row = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM llm_responses").fetchone()
+        self._bytes = int(row[0] or 0)
+
+    def get(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, size, created FROM llm_responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.stats["misses"] += 1
+                return None
+            value, size, created = row
+            if now - created > self.ttl_secs:
+                self._conn.execute("DELETE FROM llm_responses WHERE key = ?", (key,))
+                self._bytes -= int(size)
+                self.stats["misses"] += 1
+                self.stats["evictions"] += 1
+                return None
+            self._conn.execute("UPDATE llm_responses SET accessed = ? WHERE key = ?", (now, key))
+            self.stats["hits"] += 1
+            return value
+
+    def put(self, key: str, value: str) -> None:
+        size = len(value.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+        now = time.time()
+        with self._lock:
+            old = self._conn.execute("SELECT size FROM llm_responses WHERE key = ?", (key,)).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_responses(key, value, size, created, accessed) VALUES (?, ?, ?, ?, ?)",
+                (key, value, size, now, now),
+            )
+            self._bytes += size - (int(old[0]) if old else 0)
+            self.stats["stores"] += 1
+            if self._bytes > self.max_bytes:
+                self._evict_lru()
+
+    def _evict_lru(self) -> None:
+        # caller holds self._lock
+        rows = self._conn.execute("SELECT key, size FROM llm_responses ORDER BY accessed ASC").fetchall()
+        doomed: List[tuple] = []
+        for key, size in rows:
+            if self._bytes <= self.max_bytes:
+                break
+            doomed.append((key,))
+            self._bytes -= int(size)
+        if doomed:
+            self._conn.executemany("DELETE FROM llm_responses WHERE key = ?", doomed)
+            self.stats["evictions"] += len(doomed)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+# ---------------------------- shared instances -----------------------------
+
+_CACHES: Dict[str, ResponseCache] = {}
+_CACHES_LOCK = threading.Lock()
+
+
+def get_cache(
+    path: Path | str | None = None,
+    *,
+    ttl_secs: Optional[float] = None,
+    max_bytes: Optional[int] = None,
+) -> ResponseCache:
+    """Return the process-wide cache for `path`, applying any limit overrides."""
+    p = Path(path or DEFAULT_CACHE_PATH).resolve()
+    with _CACHES_LOCK:
+        cache = _CACHES.get(str(p))
+        if cache is None:
+            cache = ResponseCache(p)
+            _CACHES[str(p)] = cache
+    if ttl_secs is not None:
+        cache.ttl_secs = float(ttl_secs)
+    if max_bytes is not None:
+        cache.max_bytes = int(max_bytes)
+    return cache
+
+
+def open_cache(spec: Any = None) -> Optional[ResponseCache]:
+    """
+    Resolve a provider payload's `cache` value (caching is opt-in):
+      - None / False / {"bypass": true} -> None (no cache)
+      - True / {}                       -> default cache
+      - {"path", "ttl_secs", "max_mb"}  -> configured cache
+    Any failure to open the store also yields None; caching is never fatal.
+    """
+    if spec is None or spec is False:
+        return None
+    opts = spec if isinstance(spec, dict) else {}
+    if opts.get("bypass"):
+        return None
+    try:
+        max_mb = opts.get("max_mb")
+        return get_cache(
+            opts.get("path"),
+            ttl_secs=opts.get("ttl_secs"),
+            max_bytes=int(float(max_mb) * 1024 * 1024) if max_mb is not None else None,
+        )
+    except Exception:
+        return None
+
+
+def record_stats(run_dir: Path | str, counts: Dict[str, Any]) -> None:
+    """Add this call's counters to <run_dir>/llm/cache_stats.json (best-effort)."""
+    p = Path(run_dir) / "llm" / "cache_stats.json"
+    try:
+        totals: Dict[str, Any] = json.loads(p.read_text(encoding="utf-8")) if p.exists() else {}
+        for k, v in counts.items():
+            if isinstance(v, (int, float)) and not isinstance(v, bool):
+                totals[k] = totals.get(k, 0) + v
+            else:
+                totals[k] = v
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_text(json.dumps(totals, indent=2, ensure_ascii=False), encoding="utf-8")
+    except Exception:
+        # never crash the pipeline because we couldn't write a file
+        pass
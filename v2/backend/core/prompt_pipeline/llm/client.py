@@ -3,7 +3,7 @@
 Domain-agnostic LLM client.
 
 Public entry points:
-  - complete_v1(provider, model, messages, ask_spec, api_key=None) -> str
+  - complete_v1(provider, model, messages, ask_spec, api_key=None, use_cache=False) -> str
   - complete(provider, model, messages, ask_spec, api_key=None) -> str  (compat)
   - run(provider, model, messages, ask_spec, api_key=None) -> str       (compat)
 
@@ -12,15 +12,23 @@ Notes:
 - The caller is responsible for supplying `api_key` (we do not read env here).
 - If the HTTP call fails, we return a deterministic JSON diagnostic so the
   pipeline can continue.
+- HTTP goes through the shared keep-alive pool in `transport.py`, which the
+  llm.complete*.v1 providers use as well.
+- With use_cache=True, successful provider responses are memoized in the
+  on-disk response cache (`cache.py`), keyed on the request and endpoint.
 """
 
 from __future__ import annotations
 
 import json
 from typing import Any, Dict, List, Optional
-from urllib.request import Request, urlopen
 from urllib.error import URLError, HTTPError
 
+from .cache import open_cache, request_key
+from .transport import post_json
+
+_OPENAI_CHAT_URL = "https://api.openai.com/v1/chat/completions"
+
 
 # -------------------------- utilities --------------------------
 
@@ -64,11 +72,21 @@ def _mock_items_json(n: int = 1) -> str:
     return json.dumps({"items": items, "schema": "generic.v1"}, ensure_ascii=False)
 
 
+def _chat_completions_url(base_url: Optional[str]) -> str:
+    """
+    Accept either a full Chat Completions URL or an API base (".../v1") and
+    return the full endpoint URL.
+    """
+    url = (base_url or "").strip().rstrip("/")
+    if not url:
+        return _OPENAI_CHAT_URL
+    if url.endswith("/chat/completions"):
+        return url
+    return f"{url}/chat/completions"
+
+
 def _http_post_json(url: str, headers: Dict[str, str], payload: Dict[str, Any]) -> str:
-    data = json.dumps(payload).encode("utf-8")
-    req = Request(url, data=data, headers=headers, method="POST")
-    with urlopen(req, timeout=120) as resp:
-        return resp.read().decode("utf-8")
+    return post_json(url, headers, payload, timeout=120)
 
 
 # --------------------------- providers ---------------------------
@@ -80,7 +98,7 @@ def _openai_complete(model: str, messages: List[Dict[str, Any]], ask_spec: Dict[
     if not api_key or not isinstance(api_key, str):
         raise RuntimeError("OpenAI API key is required and must be a non-empty string")
 
-    url = (base_url or ask_spec.get("base_url") or "").strip() or "https://api.openai.com/v1/chat/completions"
+    url = _chat_completions_url(base_url or ask_spec.get("base_url"))
     ask = _shim_response_format(ask_spec or {})
     payload: Dict[str, Any] = {
         "model": model,
@@ -112,7 +130,14 @@ def _openai_complete(model: str, messages: List[Dict[str, Any]], ask_spec: Dict[
 
 # --------------------------- public API ---------------------------
 
-def complete_v1(provider: str, model: str, messages: List[Dict[str, Any]], ask_spec: Dict[str, Any], api_key: Optional[str] = None) -> str:
+def complete_v1(
+    provider: str,
+    model: str,
+    messages: List[Dict[str, Any]],
+    ask_spec: Dict[str, Any],
+    api_key: Optional[str] = None,
+    use_cache: bool = False,
+) -> str:
     """
     Preferred entry point used by llm.providers.
     Returns a *string* (raw model text). On failure, returns a deterministic mock JSON.
@@ -122,7 +147,17 @@ def complete_v1(provider: str, model: str, messages: List[Dict[str, Any]], ask_s
         if prov == "openai":
             if not api_key:
                 raise RuntimeError("OPENAI_API_KEY missing (secrets not supplied to client)")
-            return _openai_complete(model, messages, ask_spec, api_key=api_key)
+            cache = open_cache(bool(use_cache))
+            endpoint = _chat_completions_url((ask_spec or {}).get("base_url"))
+            key = request_key("client.text", prov, model, messages, ask_spec, endpoint) if cache else ""
+            if cache is not None:
+                hit = cache.get(key)
+                if hit is not None:
+                    return hit
+            text = _openai_complete(model, messages, ask_spec, api_key=api_key)
+            if cache is not None:
+                cache.put(key, text)
+            return text
         elif prov in ("mock", "", "none"):
             n = (ask_spec or {}).get("n", 1)
             return _mock_items_json(int(n) if isinstance(n, int) else 1)
@@ -140,10 +175,10 @@ def complete_v1(provider: str, model: str, messages: List[Dict[str, Any]], ask_s
         return json.dumps({"items": [], "diagnostic": diag, "schema": "generic.v1"}, ensure_ascii=False)
 
 
-def complete(provider: str, model: str, messages: List[Dict[str, Any]], ask_spec: Dict[str, Any], api_key: Optional[str] = None) -> str:
-    return complete_v1(provider, model, messages, ask_spec, api_key=api_key)
+def complete(provider: str, model: str, messages: List[Dict[str, Any]], ask_spec: Dict[str, Any], api_key: Optional[str] = None, use_cache: bool = False) -> str:
+    return complete_v1(provider, model, messages, ask_spec, api_key=api_key, use_cache=use_cache)
 
 
-def run(provider: str, model: str, messages: List[Dict[str, Any]], ask_spec: Dict[str, Any], api_key: Optional[str] = None) -> str:
-    return complete_v1(provider, model, messages, ask_spec, api_key=api_key)
+def run(provider: str, model: str, messages: List[Dict[str, Any]], ask_spec: Dict[str, Any], api_key: Optional[str] = None, use_cache: bool = False) -> str:
+    return complete_v1(provider, model, messages, ask_spec, api_key=api_key, use_cache=use_cache)
 
@@ -2,8 +2,20 @@
 from __future__ import annotations
 
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+from .cache import ResponseCache, open_cache, record_stats, request_key
+from .client import _chat_completions_url
+from .transport import configure_pool, get_pool, post_json
+
+# Upper bound on in-flight requests for llm.complete_batches.v1
+_MAX_CONCURRENCY = 32
+
+# Retries on 429 / 5xx / connection errors, as the OpenAI SDK's default max_retries
+_MAX_RETRIES = 2
 
 def _ensure_dir(p: Path) -> None:
     p.mkdir(parents=True, exist_ok=True)
@@ -16,39 +28,22 @@ def _save_json(obj: Any, path: Path) -> None:
         # best-effort only; never crash the pipeline because we couldn't write a file
         pass
 
-def _to_dict(resp: Any) -> Dict[str, Any]:
-    # OpenAI 1.x client returns Pydantic-like models with model_dump/json
-    for attr in ("model_dump", "to_dict", "dict"):
-        fn = getattr(resp, attr, None)
-        if callable(fn):
-            try:
-                d = fn()
-                if isinstance(d, dict):
-                    return d
-            except Exception:
-                pass
-    # Last resort: try JSON parse of a model_dump_json method
-    for attr in ("model_dump_json",):
-        fn = getattr(resp, attr, None)
-        if callable(fn):
-            try:
-                return json.loads(fn())
-            except Exception:
-                pass
-    # If it's already a dict
-    if isinstance(resp, dict):
-        return resp
-    # Give up
-    return {"raw": str(resp)}
-
-def _openai_chat_complete(model: str, messages: List[Dict[str, Any]], ask_spec: Dict[str, Any]) -> Dict[str, Any]:
-    # Import lazily to avoid hard dependency at import time
-    try:
-        from openai import OpenAI
-    except Exception as e:
-        return {"__provider_error__": f"OpenAI client import failed: {e}"}
+def _openai_base_url(base_url: Optional[str]) -> Optional[str]:
+    # The SDK falls back to OPENAI_BASE_URL when no base_url is passed
+    return base_url or os.environ.get("OPENAI_BASE_URL") or None
+
+def _openai_chat_complete(
+    model: str,
+    messages: List[Dict[str, Any]],
+    ask_spec: Dict[str, Any],
+    base_url: Optional[str] = None,
+    api_key: Optional[str] = None,
+) -> Dict[str, Any]:
+    # Same credential lookup the OpenAI SDK performs when constructed without arguments
+    key = api_key or os.environ.get("OPENAI_API_KEY")
+    if not key:
+        return {"__provider_error__": "OpenAI API key missing (payload api_key or OPENAI_API_KEY)"}
 
-    client = OpenAI()
     kwargs: Dict[str, Any] = {
         "model": model,
         "messages": messages,
@@ -65,11 +60,47 @@ def _openai_chat_complete(model: str, messages: List[Dict[str, Any]], ask_spec:
         # <-- the thing you asked to be guaranteed
         kwargs["response_format"] = ask_spec["response_format"]
 
+    headers = {"Authorization": f"Bearer {key}"}
+    # Organization / project scoping, read from the same env vars as the SDK
+    if os.environ.get("OPENAI_ORG_ID"):
+        headers["OpenAI-Organization"] = os.environ["OPENAI_ORG_ID"]
+    if os.environ.get("OPENAI_PROJECT_ID"):
+        headers["OpenAI-Project"] = os.environ["OPENAI_PROJECT_ID"]
     try:
-        resp = client.chat.completions.create(**kwargs)
-        return _to_dict(resp)
+        # Shared keep-alive pool (transport.py): no per-call TCP/TLS handshake
+        url = _chat_completions_url(_openai_base_url(base_url))
+        raw = post_json(url, headers, kwargs, timeout=120, max_retries=_MAX_RETRIES)
     except Exception as e:
         return {"__provider_error__": f"OpenAI chat.completions.create failed: {e}"}
+    try:
+        obj = json.loads(raw)
+    except ValueError:
+        return {"raw": raw}
+    return obj if isinstance(obj, dict) else {"raw": raw}
+
+def _cached_chat_complete(
+    cache: Optional[ResponseCache],
+    provider: str,
+    model: str,
+    messages: List[Dict[str, Any]],
+    ask_spec: Dict[str, Any],
+    base_url: Optional[str] = None,
+    api_key: Optional[str] = None,
+) -> Tuple[Dict[str, Any], bool]:
+    """Serve from the response cache when possible; returns (result, cache_hit)."""
+    endpoint = _chat_completions_url(_openai_base_url(base_url))
+    key = request_key("chat.completions", provider, model, messages, ask_spec, endpoint) if cache else ""
+    if cache is not None:
+        hit = cache.get(key)
+        if hit is not None:
+            try:
+                return json.loads(hit), True
+            except ValueError:
+                pass
+    result = _openai_chat_complete(model, messages, ask_spec, base_url=base_url, api_key=api_key)
+    if cache is not None and "__provider_error__" not in result and "error" not in result:
+        cache.put(key, json.dumps(result, ensure_ascii=False))
+    return result, False
 
 def complete_v1(payload: Dict[str, Any], context: Optional[Dict[str, Any]] = None) -> Any:
     """
@@ -80,6 +111,8 @@ def complete_v1(payload: Dict[str, Any], context: Optional[Dict[str, Any]] = Non
       - messages: OpenAI-style messages
       - ask_spec: {temperature, top_p, max_tokens, response_format, ...}
       - run_dir: optional path to persist raw results
+      - base_url / api_key: optional overrides (default: OPENAI_BASE_URL or api.openai.com, OPENAI_API_KEY)
+      - cache: optional response-cache spec {path, ttl_secs, max_mb, bypass}; off unless given
     Returns:
       - raw provider response (dict) wrapped in a list (for consistency with batches)
         OR a Problem artifact on failure.
@@ -89,6 +122,8 @@ def complete_v1(payload: Dict[str, Any], context: Optional[Dict[str, Any]] = Non
     messages = payload.get("messages") or []
     ask_spec = payload.get("ask_spec") or {}
     run_dir = payload.get("run_dir")
+    base_url = payload.get("base_url")
+    api_key = payload.get("api_key")
 
     if provider != "openai":
         return [{
@@ -97,15 +132,27 @@ def complete_v1(payload: Dict[str, Any], context: Optional[Dict[str, Any]] = Non
             "meta": {"problem": {"code": "ProviderUnsupported", "message": f"Unsupported provider '{provider}'", "retryable": False, "details": {}}}
         }]
 
-    result = _openai_chat_complete(model, messages, ask_spec)
+    cache = open_cache(payload.get("cache"))
+    result, hit = _cached_chat_complete(cache, provider, model, messages, ask_spec, base_url=base_url, api_key=api_key)
 
     # Persist raw forensics
     if run_dir:
-        _save_json({"provider": provider, "model": model, "messages": messages, "ask_spec": ask_spec, "result": result},
+        _save_json({"provider": provider, "model": model, "messages": messages, "ask_spec": ask_spec, "result": result,
+                    "cache_hit": hit},
                    Path(run_dir) / "llm" / "result_single.json")
+        record_stats(run_dir, {"hits": int(hit), "misses": int(cache is not None and not hit),
+                               "bypassed": int(cache is None)})
 
     return [result]
 
+def _coerce_concurrency(value: Any) -> int:
+    """Clamp a requested concurrency to [1, _MAX_CONCURRENCY]; junk means sequential."""
+    try:
+        n = int(value)
+    except (TypeError, ValueError):
+        return 1
+    return max(1, min(n, _MAX_CONCURRENCY))
+
 def complete_batches_v1(payload: Dict[str, Any], context: Optional[Dict[str, Any]] = None) -> Any:
     """
     Capability: llm.complete_batches.v1
@@ -113,14 +160,23 @@ def complete_batches_v1(payload: Dict[str, Any], context: Optional[Dict[str, Any
       - provider, model, ask_spec
       - batches: List[List[message]]  (each is a chat message sequence)
       - run_dir: optional path to persist raw results
+      - concurrency: optional max in-flight requests (default 1 = sequential, capped at 32)
+      - base_url / api_key: optional overrides (default: OPENAI_BASE_URL or api.openai.com, OPENAI_API_KEY)
+      - cache: optional response-cache spec {path, ttl_secs, max_mb, bypass}; off unless given
     Returns:
-      - List[raw provider response dicts] (one per batch)
+      - List[raw provider response dicts] (one per batch, in input order)
+
+    With concurrency > 1 batches are dispatched on a bounded thread pool; each
+    result_batch_{i}.json is written as soon as batch i finishes.
     """
     provider = payload.get("provider")
     model = payload.get("model")
     batches = payload.get("batches") or []
     ask_spec = payload.get("ask_spec") or {}
     run_dir = payload.get("run_dir")
+    base_url = payload.get("base_url")
+    api_key = payload.get("api_key")
+    concurrency = _coerce_concurrency(payload.get("concurrency", 1))
 
     if provider != "openai":
         return [{
@@ -129,15 +185,28 @@ def complete_batches_v1(payload: Dict[str, Any], context: Optional[Dict[str, Any
             "meta": {"problem": {"code": "ProviderUnsupported", "message": f"Unsupported provider '{provider}'", "retryable": False, "details": {}}}
         }]
 
-    results: List[Dict[str, Any]] = []
-    for i, messages in enumerate(batches):
-        result = _openai_chat_complete(model, messages, ask_spec)
-        results.append(result)
+    cache = open_cache(payload.get("cache"))
+
+    def _one(i: int, messages: List[Dict[str, Any]]) -> Tuple[Dict[str, Any], bool]:
+        result, hit = _cached_chat_complete(cache, provider, model, messages, ask_spec, base_url=base_url, api_key=api_key)
         if run_dir:
-            _save_json({"provider": provider, "model": model, "messages": messages, "ask_spec": ask_spec, "result": result},
+            _save_json({"provider": provider, "model": model, "messages": messages, "ask_spec": ask_spec, "result": result,
+                        "cache_hit": hit},
                        Path(run_dir) / "llm" / f"result_batch_{i}.json")
+        return result, hit
+
+    if concurrency == 1 or len(batches) <= 1:
+        outcomes = [_one(i, messages) for i, messages in enumerate(batches)]
+    else:
+        if get_pool().max_per_host < concurrency:
+            # Let every worker keep its connection alive between batches
+            configure_pool(max_per_host=concurrency)
+        # The pool size caps in-flight requests; map() yields results in input order.
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(batches)), thread_name_prefix="llm-batch") as pool:
+            outcomes = list(pool.map(_one, range(len(batches)), batches))
 
-    return results
-
-
-
+    if run_dir:
+        hits = sum(1 for _, hit in outcomes if hit)
+        record_stats(run_dir, {"hits": hits, "misses": len(outcomes) - hits if cache is not None else 0,
+                               "bypassed": len(outcomes) if cache is None else 0})
+    return [result for result, _ in outcomes]
@@ -0,0 +1,245 @@
+# File: v2/backend/core/prompt_pipeline/llm/transport.py
+"""
+Pooled keep-alive HTTP transport for the LLM layer (stdlib only).
+
+`urlopen` opens a fresh connection per call, paying DNS + TCP (+ TLS) setup on
+every completion. This module keeps idle `http.client` connections per
+(scheme, host, port) and hands them back out to later requests.
+
+Public entry points:
+  - get_pool() -> HTTPPool                      (process-wide singleton)
+  - configure_pool(max_per_host=..., idle_timeout=...) -> HTTPPool
+  - post_json(url, headers, payload, timeout=120.0, max_retries=0) -> str
+
+Notes:
+- `max_per_host` bounds the number of *idle* connections kept per host;
+  concurrent callers beyond that still get a connection, it is just closed
+  instead of being returned to the pool.
+- Idle connections older than `idle_timeout` seconds are evicted lazily.
+- Errors mirror urllib's: HTTP status >= 400 raises `HTTPError`, socket-level
+  failures raise `URLError`, so existing `except (HTTPError, URLError)` callers
+  keep working.
+- post_json(max_retries=N) retries 429, 5xx and `URLError` up to N times with
+  exponential backoff (jittered, capped at `max_backoff`), honouring a
+  `Retry-After` header when the server sends one.
+"""
+
+from __future__ import annotations
+
+import http.client
+import io
+import json
+import random
+import ssl
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.error import HTTPError, URLError
+from urllib.parse import urlsplit
+
+_HostKey = Tuple[str, str, int]
+
+# Failures that mean a reused keep-alive socket was closed by the server
+# while idle; the request is retried once on a fresh connection.
+_STALE_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.BadStatusLine,
+    ConnectionResetError,
+    BrokenPipeError,
+)
+
+
+def _retryable_status(status: int) -> bool:
+    return status == 429 or status >= 500
+
+
+def _retry_delay(attempt: int, headers: Optional[Dict[str, str]], backoff: float, max_backoff: float) -> float:
+    """Seconds to wait before retry `attempt` (0-based): Retry-After if given, else jittered 2**n backoff."""
+    for name, value in (headers or {}).items():
+        if name.lower() != "retry-after":
+            continue
+        try:
+            secs = float(value)
+        except ValueError:
+            try:
+                secs = parsedate_to_datetime(value).timestamp() - time.time()
+            except (TypeError, ValueError):
+                break
+        return min(max(0.0, secs), max_backoff)
+    return min(max_backoff, backoff * (2 ** attempt)) * (1.0 - 0.25 * random.random())
+
+
+class HTTPPool:
+    """Thread-safe pool of keep-alive HTTP(S) connections keyed by host."""
+
+    def __init__(self, max_per_host: int = 8, idle_timeout: float = 60.0) -> None:
+        self.max_per_host = max(1, int(max_per_host))
+        self.idle_timeout = float(idle_timeout)
+        self._idle: Dict[_HostKey, List[Tuple[http.client.HTTPConnection, float]]] = {}
+        self._lock = threading.Lock()
+        self._ssl_ctx: Optional[ssl.SSLContext] = None
+        self.stats = {"connects": 0, "reuses": 0, "evictions": 0, "retries": 0}
+
+    # ---- connection management ----
+
+    def _connect(self, key: _HostKey, timeout: float) -> http.client.HTTPConnection:
+        scheme, host, port = key
+        if scheme == "https":
+            if self._ssl_ctx is None:
+                self._ssl_ctx = ssl.create_default_context()
+            return http.client.HTTPSConnection(host, port, timeout=timeout, context=self._ssl_ctx)
+        return http.client.HTTPConnection(host, port, timeout=timeout)
+
+    def _evict_expired(self, now: float) -> None:
+        # caller holds self._lock
+        for key, conns in list(self._idle.items()):
+            keep = []
+            for conn, ts in conns:
+                if now - ts > self.idle_timeout:
+                    conn.close()
+                    self.stats["evictions"] += 1
+                else:
+                    keep.append((conn, ts))
+            if keep:
+                self._idle[key] = keep
+            else:
+                del self._idle[key]
+
+    def _acquire(self, key: _HostKey, timeout: float) -> Tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            self._evict_expired(time.monotonic())
+            conns = self._idle.get(key)
+            if conns:
+                conn, _ = conns.pop()  # most recently used first
+                self.stats["reuses"] += 1
+                if conn.sock is not None:
+                    conn.sock.settimeout(timeout)
+                return conn, True
+            self.stats["connects"] += 1
+        return self._connect(key, timeout), False
+
+    def _release(self, key: _HostKey, conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            conns = self._idle.setdefault(key, [])
+            if len(conns) < self.max_per_host:
+                conns.append((conn, time.monotonic()))
+                return
+        conn.close()
+
+    def close(self) -> None:
+        """Close every idle connection."""
+        with self._lock:
+            for conns in self._idle.values():
+                for conn, _ in conns:
+                    conn.close()
+            self._idle.clear()
+
+    # ---- requests ----
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        body: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = 120.0,
+    ) -> Tuple[int, str, Dict[str, str], bytes]:
+        """Send one request; returns (status, reason, headers, body)."""
+        parts = urlsplit(url)
+        scheme = (parts.scheme or "http").lower()
+        if scheme not in ("http", "https") or not parts.hostname:
+            raise URLError(f"unsupported URL: {url!r}")
+        port = parts.port or (443 if scheme == "https" else 80)
+        key: _HostKey = (scheme, parts.hostname, port)
+        path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+
+        for attempt in (0, 1):
+            conn, reused = self._acquire(key, timeout)
+            try:
+                conn.request(method, path, body=body, headers=headers or {})
+                resp = conn.getresponse()
+                data = resp.read()
+            except _STALE_ERRORS as e:
+                conn.close()
+                if reused and attempt == 0:
+                    continue
+                raise URLError(e) from e
+            except (OSError, http.client.HTTPException) as e:
+                # e.g. timeouts or IncompleteRead: the connection is unusable
+                conn.close()
+                raise URLError(e) from e
+
+            if resp.will_close:
+                conn.close()
+            else:
+                self._release(key, conn)
+            return resp.status, resp.reason, dict(resp.getheaders()), data
+
+        raise URLError(f"request to {url!r} failed")  # pragma: no cover (loop always returns/raises)
+
+    def post_json(
+        self,
+        url: str,
+        headers: Dict[str, str],
+        payload: Dict[str, Any],
+        timeout: float = 120.0,
+        *,
+        max_retries: int = 0,
+        backoff: float = 0.5,
+        max_backoff: float = 8.0,
+    ) -> str:
+        data = json.dumps(payload).encode("utf-8")
+        hdrs = {"Content-Type": "application/json", **(headers or {})}
+        retries = max(0, int(max_retries))
+        for attempt in range(retries + 1):
+            try:
+                status, reason, resp_headers, body = self.request("POST", url, body=data, headers=hdrs, timeout=timeout)
+            except URLError:
+                if attempt >= retries:
+                    raise
+                delay = _retry_delay(attempt, None, backoff, max_backoff)
+            else:
+                if status < 400:
+                    return body.decode("utf-8")
+                if attempt >= retries or not _retryable_status(status):
+                    raise HTTPError(url, status, reason, resp_headers, io.BytesIO(body))  # type: ignore[arg-type]
+                delay = _retry_delay(attempt, resp_headers, backoff, max_backoff)
+            with self._lock:
+                self.stats["retries"] += 1
+            time.sleep(delay)
+        raise URLError(f"request to {url!r} failed")  # pragma: no cover (loop always returns/raises)
+
+
+# ---------------------------- process-wide pool ----------------------------
+
+_POOL: Optional[HTTPPool] = None
+_POOL_LOCK = threading.Lock()
+
+
+def get_pool() -> HTTPPool:
+    """Return the shared pool (created on first use)."""
+    global _POOL
+    if _POOL is None:
+        with _POOL_LOCK:
+            if _POOL is None:
+                _POOL = HTTPPool()
+    return _POOL
+
+
+def configure_pool(*, max_per_host: Optional[int] = None, idle_timeout: Optional[float] = None) -> HTTPPool:
+    """Adjust the shared pool's limits in place (existing idle connections are kept)."""
+    pool = get_pool()
+    if max_per_host is not None:
+        pool.max_per_host = max(1, int(max_per_host))
+    if idle_timeout is not None:
+        pool.idle_timeout = float(idle_timeout)
+    return pool
+
+
+def post_json(
+    url: str, headers: Dict[str, str], payload: Dict[str, Any], timeout: float = 120.0, *, max_retries: int = 0,
+) -> str:
+    """POST `payload` as JSON over the shared pool and return the response text."""
+    return get_pool().post_json(url, headers, payload, timeout=timeout, max_retries=max_retries)
@@ -0,0 +1,123 @@
+# File: v2/backend/core/spine/bench_artifacts.py
+"""
+Benchmark: wrapping a large provider result into an Artifact.
+
+Builds an `introspect.fetch.v1`-shaped result ({"records": [...], "count": N},
+rows with the provider's default columns) and times/measures (tracemalloc peak)
+CapabilityRegistry._normalize_to_artifacts on it:
+  - eager: the previous behaviour, hashing at construction (probe json.dumps of
+    meta, then the sorted json.dumps that is hashed)
+  - lazy:  the current behaviour, no hash until `.sha256` is read
+Also reports the cost of the first `.sha256` read and checks both hashes match.
+
+Run:
+    python -m v2.backend.core.spine.bench_artifacts [--records 50000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import importlib
+import json
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Tuple
+
+# `spine.__init__` re-exports a `registry` singleton under the module's name
+registry_mod = importlib.import_module("v2.backend.core.spine.registry")
+
+CAP = "introspect.fetch.v1"
+
+
+def fetch_result(n: int) -> Dict[str, Any]:
+    records: List[Dict[str, Any]] = []
+    for i in range(n):
+        records.append({
+            "id": i,
+            "filepath": f"v2/backend/core/pkg{i % 50:02d}/module_{i // 50:04d}.py",
+            "symbol_type": ("function", "class", "method", "module")[i % 4],
+            "name": f"symbol_{i}",
+            "lineno": 10 + i % 400,
+            "status": ("todo", "active", "resolved")[i % 3],
+            "description": f"Docstring issue {i}: summary line is missing or does not describe the return value.",
+            "route_method": None,
+            "route_path": None,
+            "ag_tag": None,
+            "unique_key_hash": hashlib.sha1(str(i).encode()).hexdigest(),
+            "discovered_at": "2025-01-01T00:00:00",
+            "last_seen_at": "2025-01-02T00:00:00",
+            "resolved_at": None,
+            "occurrences": 1 + i % 3,
+            "recurrence_count": 0,
+            "created_at": "2025-01-01T00:00:00",
+            "updated_at": "2025-01-02T00:00:00",
+            "mdata": '{"source": "docstring_scan"}',
+        })
+    return {"records": records, "count": n}
+
+
+def legacy_sha256(kind: str, uri: str, meta: Dict[str, Any]) -> str:
+    """registry._sha256 as it was: probe dump, then the hashed dump."""
+    def _jsonable(x: Any) -> Any:
+        try:
+            json.dumps(x)
+            return x
+        except Exception:
+            return repr(x)
+
+    blob = json.dumps(
+        {"kind": kind, "uri": uri, "meta": _jsonable(meta or {})},
+        sort_keys=True,
+        ensure_ascii=True,
+        separators=(",", ":"),
+        default=repr,
+    ).encode("utf-8")
+    return hashlib.sha256(blob).hexdigest()
+
+
+def _measure(fn: Callable[[], Any]) -> Tuple[float, float, Any]:
+    """(seconds, tracemalloc peak MiB, result) — timed without tracing, then traced for memory."""
+    t0 = time.perf_counter()
+    res = fn()
+    secs = time.perf_counter() - t0
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+    tracemalloc.stop()
+    return secs, peak, res
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--records", type=int, default=50_000)
+    args = ap.parse_args()
+
+    obj = fetch_result(args.records)
+    reg = registry_mod.CapabilityRegistry()
+
+    def eager() -> List[Any]:
+        arts = reg._normalize_to_artifacts(CAP, obj)
+        for a in arts:
+            a.sha256 = legacy_sha256(a.kind, a.uri, a.meta)
+        return arts
+
+    def lazy() -> List[Any]:
+        return reg._normalize_to_artifacts(CAP, obj)
+
+    t_eager, m_eager, a_eager = _measure(eager)
+    t_lazy, m_lazy, a_lazy = _measure(lazy)
+    t0 = time.perf_counter()
+    sha = a_lazy[0].sha256
+    t_hash = time.perf_counter() - t0
+
+    same = sha == a_eager[0].sha256
+    print(f"[bench_artifacts] {CAP} result with {args.records} records")
+    print(f"  eager hash at construction  {t_eager * 1000:>9.1f} ms   peak {m_eager:>8.1f} MiB")
+    print(f"  lazy (hash not read)        {t_lazy * 1000:>9.1f} ms   peak {m_lazy:>8.1f} MiB")
+    print(f"  lazy, first .sha256 read    {t_hash * 1000:>9.1f} ms   same hash={same}")
+    return 0 if same else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,101 @@
+# File: v2/backend/core/spine/bench_registry.py
+"""
+Microbenchmark: CapabilityRegistry.run dispatch overhead.
+
+Registers no-op providers with each calling convention the registry supports
+and times N dispatches of each through `.run`, against calling the provider
+directly. Providers return None, so result normalization is negligible and the
+difference is dispatch cost.
+
+Run:
+    python -m v2.backend.core.spine.bench_registry [--calls 100000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+# `spine.__init__` re-exports a `registry` singleton under the module's name
+registry_mod = importlib.import_module("v2.backend.core.spine.registry")
+
+
+def task_ctx(task, context):
+    return None
+
+
+def task_like_kwargs(task_like, context=None, **kwargs):
+    return None
+
+
+def payload_ctx(payload, context):
+    return None
+
+
+def payload_only(payload):
+    return None
+
+
+def name_payload_ctx(name, payload, context):
+    return None
+
+
+def odd_single(x):
+    return None
+
+
+PROVIDERS: List[Tuple[str, Callable[..., Any], Callable[[Dict[str, Any], Dict[str, Any]], Any]]] = [
+    ("task, context", task_ctx, lambda p, c: task_ctx(p, c)),
+    ("task_like, context=None, **kw", task_like_kwargs, lambda p, c: task_like_kwargs(p, c)),
+    ("payload, context", payload_ctx, lambda p, c: payload_ctx(p, c)),
+    ("payload", payload_only, lambda p, c: payload_only(p)),
+    ("name, payload, context", name_payload_ctx, lambda p, c: name_payload_ctx("cap", p, c)),
+    ("x (ladder form)", odd_single, lambda p, c: odd_single(p)),
+]
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--calls", type=int, default=100_000)
+    args = ap.parse_args()
+    n = args.calls
+
+    reg = registry_mod.CapabilityRegistry()
+    for label, fn, _direct in PROVIDERS:
+        reg.register(f"bench.{fn.__name__}", fn)
+
+    payload: Dict[str, Any] = {"k": 1}
+    ctx: Dict[str, Any] = {"run_id": "bench"}
+    print(f"[bench_registry] {n} no-op dispatches per provider signature")
+    total_run = total_direct = 0.0
+    for label, fn, direct in PROVIDERS:
+        cap = f"bench.{fn.__name__}"
+        reg.run(cap, payload, ctx)  # resolve + compile outside the timed loop
+
+        t0 = time.perf_counter()
+        for _ in range(n):
+            direct(payload, ctx)
+        t_direct = time.perf_counter() - t0
+
+        run = reg.run
+        t0 = time.perf_counter()
+        for _ in range(n):
+            run(cap, payload, ctx)
+        t_run = time.perf_counter() - t0
+
+        total_run += t_run
+        total_direct += t_direct
+        print(
+            f"  {label:<32} run {t_run / n * 1e6:>7.2f} us/call   direct {t_direct / n * 1e6:>6.2f} us/call   "
+            f"overhead {(t_run - t_direct) / n * 1e6:>7.2f} us"
+        )
+    k = len(PROVIDERS)
+    print(f"  {'mean':<32} run {total_run / (n * k) * 1e6:>7.2f} us/call   overhead "
+          f"{(total_run - total_direct) / (n * k) * 1e6:>7.2f} us")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -13,6 +13,9 @@ The pipeline runner supports the variable/conditional syntax used in patch_loop.
 - ${path.to.value?then_expr:else_expr}
 - Paths can refer to prior steps, e.g. ${fetch.result.rows}
 - Expressions can nest: ${enrich.result?${enrich.result}:${items}}
+- Steps only wait for the earlier steps their payload / `when:` reference (or
+  list in `depends_on:`); with `max_workers` > 1 independent steps run
+  concurrently on a thread pool.
 
 Notes:
 - Environment variable based middleware loading has been removed.
@@ -21,11 +24,13 @@ Notes:
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
 from importlib import import_module
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Tuple, TYPE_CHECKING
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, TYPE_CHECKING
 import re
+import time
 import yaml
 
 from .loader import CapabilitiesLoader
@@ -117,6 +122,41 @@ def build_spine(caps_path: str | Path, middlewares: Optional[List[Middleware]] =
 
 _MISSING = object()
 
+# Compiled `${...}` template: state -> resolved value
+Resolver = Callable[[Dict[str, Any]], Any]
+
+
+def _has_placeholder(obj: Any) -> bool:
+    """Cheap pre-scan: does any string in this subtree contain `${`?"""
+    if isinstance(obj, str):
+        return "${" in obj
+    if isinstance(obj, dict):
+        return any(map(_has_placeholder, obj.values()))
+    if isinstance(obj, list):
+        return any(map(_has_placeholder, obj))
+    return False
+
+
+@dataclass(frozen=True)
+class _PipelineStep:
+    """One pipeline step with its `when:` guard and payload compiled."""
+    id: str
+    capability: str
+    raw: Dict[str, Any]
+    when: Resolver
+    payload: Resolver
+
+
+@dataclass
+class PipelineRun:
+    """
+    Outcome of Spine.run_pipeline: the last executed step's artifacts plus one
+    {step, capability, wall_secs} entry per executed step, in file order.
+    Timings are kept beside the artifacts, never in their (hashed) meta.
+    """
+    artifacts: List[Artifact]
+    timings: List[Dict[str, Any]] = field(default_factory=list)
+
 
 @dataclass
 class Spine:
@@ -189,14 +229,47 @@ class Spine:
     # ------------------------- pipeline runner ----------------------
 
     _VAR_RX = re.compile(r"\$\{([^{}]+)\}")
+    _NAME_RX = re.compile(r"[\w\-]+")
 
     def load_pipeline_and_run(
-        self, pipeline_yaml: str | Path, *, variables: Dict[str, Any] | None = None,
+        self,
+        pipeline_yaml: str | Path,
+        *,
+        variables: Dict[str, Any] | None = None,
+        max_workers: Optional[int] = None,
     ) -> List[Artifact]:
+        """
+        Execute a YAML pipeline file (see `run_pipeline`) and return the artifacts
+        from the **last executed step** (in file order).
+        """
+        return self.run_pipeline(pipeline_yaml, variables=variables, max_workers=max_workers).artifacts
+
+    def run_pipeline(
+        self,
+        pipeline_yaml: str | Path,
+        *,
+        variables: Dict[str, Any] | None = None,
+        max_workers: Optional[int] = None,
+    ) -> PipelineRun:
         """
         Execute a YAML pipeline file with `${...}` substitution and simple conditionals.
 
-        Returns the artifacts from the **last executed step**.
+        Each step depends on the earlier steps whose ids its payload or `when:`
+        guard references, plus any listed in `depends_on:` (for ordering through
+        side effects, e.g. files a previous step wrote). With `max_workers` > 1
+        (argument, else the pipeline's top-level `max_workers:`, default 1) steps
+        whose dependencies are done run concurrently on a thread pool. A step
+        resolves against `vars` plus the results of the steps it (transitively)
+        depends on, merged in file order, so results do not depend on scheduling;
+        with one worker every step sees all earlier results, exactly as a plain
+        in-order run. Per-step wall times are returned in `PipelineRun.timings`,
+        not in artifact meta (which feeds the artifact's sha256).
+
+        Each step's `when:` and payload are compiled once into resolvers (see
+        `_compile`) before the first step runs.
+
+        Returns the artifacts from the **last executed step** (in file order)
+        together with the per-step timings.
         """
         assert self.registry is not None
         p = Path(pipeline_yaml).resolve()
@@ -207,81 +280,226 @@ class Spine:
         defaults: Dict[str, Any] = dict(data.get("defaults") or {})
         vars_in: Dict[str, Any] = dict(defaults)
         vars_in.update(dict(variables or {}))
+        workers = max(1, int(max_workers if max_workers is not None else (data.get("max_workers") or 1)))
 
-        # state collects both variables and step outputs (batons)
-        state: Dict[str, Any] = {"vars": vars_in}
-        last_artifacts: List[Artifact] = []
-
+        steps: List[_PipelineStep] = []
         for idx, step in enumerate(data.get("steps") or [], 1):
             if not isinstance(step, dict):
                 raise ValueError(f"step {idx} must be a mapping")
             step_id: str = str(step.get("id") or f"step{idx}")
-
             capability: str = str(step.get("capability") or "").strip()
             if not capability:
                 raise ValueError(f"step {step_id}: missing capability")
+            steps.append(_PipelineStep(
+                step_id, capability, step,
+                when=self._compile(step.get("when", True)),
+                payload=self._compile(step.get("payload") or {}),
+            ))
 
-            # when: guard (default True)
-            when_expr = step.get("when", True)
-            should_run = self._coerce_bool(self._resolve(when_expr, state))
-            if not should_run:
-                continue
-
-            raw_payload = step.get("payload") or {}
-            payload = self._resolve(raw_payload, state)
-
-            # Dispatch
-            env = new_envelope(intent="pipeline", subject=step_id, capability=capability, producer="spine.pipeline")
-            task = Task(envelope=env, payload_schema=capability, payload=payload)
-            arts = self.registry.dispatch_task(task, context={"vars": vars_in, "state": state, "step": step_id})
-            last_artifacts = arts
+        # state collects both variables and step outputs (batons)
+        state: Dict[str, Any] = {"vars": vars_in}
+        outcomes: Dict[int, Optional[List[Artifact]]] = {}  # step index -> artifacts (None = skipped by `when`)
+        timings: Dict[int, float] = {}  # step index -> wall seconds
+
+        if workers == 1:
+            for i, st in enumerate(steps):
+                ran = self._run_step(st, state, vars_in)
+                outcomes[i] = ran[0] if ran else None
+                if ran:
+                    state[st.id] = {"result": ran[1]}
+                    timings[i] = ran[2]
+        else:
+            self._run_dag(steps, vars_in, workers, outcomes, timings)
 
-            # Capture a baton-like object to expose as ${.result}
-            if len(arts) == 1 and isinstance(arts[0].meta, dict) and "result" in arts[0].meta:
-                baton: Any = arts[0].meta["result"]
-            else:
-                baton = [to_dict(a) for a in arts]
-            state[step_id] = {"result": baton}
+        last_artifacts: List[Artifact] = []
+        for i in range(len(steps)):
+            if outcomes.get(i) is not None:
+                last_artifacts = outcomes[i]  # type: ignore[assignment]
+        return PipelineRun(
+            artifacts=last_artifacts,
+            timings=[
+                {"step": steps[i].id, "capability": steps[i].capability, "wall_secs": round(timings[i], 6)}
+                for i in sorted(timings)
+            ],
+        )
 
-        return last_artifacts
+    def _run_dag(
+        self,
+        steps: List[_PipelineStep],
+        vars_in: Dict[str, Any],
+        workers: int,
+        outcomes: Dict[int, Optional[List[Artifact]]],
+        timings: Dict[int, float],
+    ) -> None:
+        """Run steps as their dependencies complete; the earliest failing step's error is raised."""
+        deps = self._step_dependencies(steps)
+        ancestors: List[Set[int]] = []
+        for i in range(len(steps)):
+            closure: Set[int] = set(deps[i])
+            for d in deps[i]:
+                closure |= ancestors[d]
+            ancestors.append(closure)
+
+        batons: Dict[int, Any] = {}
+        pending = list(range(len(steps)))
+        running: Dict[Future, int] = {}
+        errors: Dict[int, BaseException] = {}
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="spine-step") as pool:
+            while pending or running:
+                if not errors:
+                    for i in [i for i in pending if all(d in outcomes for d in deps[i])]:
+                        if len(running) >= workers:
+                            break
+                        pending.remove(i)
+                        view: Dict[str, Any] = {"vars": vars_in}
+                        for a in sorted(ancestors[i]):
+                            if outcomes[a] is not None:
+                                view[steps[a].id] = {"result": batons[a]}
+                        running[pool.submit(self._run_step, steps[i], view, vars_in)] = i
+                if not running:
+                    break
+                done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for fut in done:
+                    i = running.pop(fut)
+                    try:
+                        ran = fut.result()
+                    except BaseException as e:  # noqa: BLE001 - re-raised below
+                        errors[i] = e
+                        continue
+                    outcomes[i] = ran[0] if ran else None
+                    if ran:
+                        batons[i] = ran[1]
+                        timings[i] = ran[2]
+        if errors:
+            raise errors[min(errors)]
+
+    def _step_dependencies(self, steps: List[_PipelineStep]) -> List[List[int]]:
+        """
+        For each step, the indices of earlier steps whose id appears in a `${...}`
+        of its payload or `when:`, or in `depends_on:` (every earlier step with
+        that id, so a skipped duplicate still falls back to the one before it).
+        """
+        out: List[List[int]] = []
+        seen: Dict[str, List[int]] = {}
+        for i, st in enumerate(steps):
+            names: Set[str] = set()
+            self._collect_names(st.raw.get("payload"), names)
+            self._collect_names(st.raw.get("when", True), names)
+            after = st.raw.get("depends_on") or []
+            names.update(str(n) for n in ([after] if isinstance(after, str) else after))
+            out.append(sorted(j for n in names for j in seen.get(n, ())))
+            seen.setdefault(st.id, []).append(i)
+        return out
+
+    def _collect_names(self, obj: Any, names: Set[str]) -> None:
+        if isinstance(obj, dict):
+            for v in obj.values():
+                self._collect_names(v, names)
+        elif isinstance(obj, list):
+            for v in obj:
+                self._collect_names(v, names)
+        elif isinstance(obj, str) and "${" in obj:
+            for m in self._VAR_RX.finditer(obj):
+                names.update(self._NAME_RX.findall(m.group(1)))
+            # nested ${...} inside a token is not matched by _VAR_RX on its own
+            names.update(self._NAME_RX.findall(obj[obj.index("${"):]))
+
+    def _run_step(
+        self, st: "_PipelineStep", state: Dict[str, Any], vars_in: Dict[str, Any],
+    ) -> Optional[Tuple[List[Artifact], Any, float]]:
+        """
+        Evaluate the guard, resolve the payload and dispatch one step.
+        Returns (artifacts, baton, wall_secs) or None when the guard skips it.
+        """
+        assert self.registry is not None
+        step_id, capability = st.id, st.capability
+        # when: guard (default True)
+        should_run = self._coerce_bool(st.when(state))
+        if not should_run:
+            return None
+
+        payload = st.payload(state)
+
+        # Dispatch
+        env = new_envelope(intent="pipeline", subject=step_id, capability=capability, producer="spine.pipeline")
+        task = Task(envelope=env, payload_schema=capability, payload=payload)
+        t0 = time.perf_counter()
+        arts = self.registry.dispatch_task(task, context={"vars": vars_in, "state": state, "step": step_id})
+        secs = time.perf_counter() - t0
+
+        # Capture a baton-like object to expose as ${.result}
+        if len(arts) == 1 and isinstance(arts[0].meta, dict) and "result" in arts[0].meta:
+            baton: Any = arts[0].meta["result"]
+        else:
+            baton = [to_dict(a) for a in arts]
+        return arts, baton, secs
 
     # ------------------------- templating ---------------------------
 
     def _resolve(self, obj: Any, state: Dict[str, Any]) -> Any:
         """
-        Deep-resolve ${...} in strings, lists, dicts.
+        Deep-resolve ${...} in strings, lists, dicts (one-off; see `_compile`).
 
         If a string is exactly a single ${...} token, the resolved value is returned
         *as-is* (can be a non-string like list/dict/bool). Otherwise tokens are stringified.
         """
+        return self._compile(obj)(state)
+
+    def _compile(self, obj: Any) -> Resolver:
+        """
+        Compile a payload / guard into a resolver `fn(state) -> value`.
+
+        Tokenising, expression splitting and literal parsing happen here, once.
+        Subtrees without placeholders are returned by reference (not walked or
+        copied per call); containers holding placeholders are rebuilt per call
+        around their static children. Evaluation errors (unknown names, bad
+        ternaries) are still raised when the resolver runs, not when compiled.
+        """
+        static, node = self._compile_node(obj)
+        if static:
+            return lambda state: node
+        return node
+
+    def _compile_node(self, obj: Any) -> Tuple[bool, Any]:
+        """(True, value) for a placeholder-free subtree, else (False, resolver)."""
         if isinstance(obj, dict):
-            return {k: self._resolve(v, state) for k, v in obj.items()}
+            if not _has_placeholder(obj):
+                return True, obj
+            items = [(k, *self._compile_node(v)) for k, v in obj.items()]
+            return False, lambda state: {k: (n if static else n(state)) for k, static, n in items}
         if isinstance(obj, list):
-            return [self._resolve(v, state) for v in obj]
+            if not _has_placeholder(obj):
+                return True, obj
+            elems = [self._compile_node(v) for v in obj]
+            return False, lambda state: [(n if static else n(state)) for static, n in elems]
         if isinstance(obj, str):
-            tokens = list(self._VAR_RX.finditer(obj))
+            tokens = list(self._VAR_RX.finditer(obj)) if "${" in obj else []
             if not tokens:
-                return obj
+                return True, obj
 
             # If the entire string is one token, return the evaluated value directly.
             if len(tokens) == 1 and tokens[0].span() == (0, len(obj)):
-                expr = tokens[0].group(1)
-                return self._eval_expr(expr, state)
+                return False, self._compile_expr(tokens[0].group(1))
 
             # Otherwise, interpolate all tokens to string
-            out = []
+            pieces: List[Tuple[bool, Any]] = []
             last = 0
             for m in tokens:
-                out.append(obj[last:m.start()])
-                out.append(self._stringify(self._eval_expr(m.group(1), state)))
+                pieces.append((True, obj[last:m.start()]))
+                pieces.append((False, self._compile_expr(m.group(1))))
                 last = m.end()
-            out.append(obj[last:])
-            return "".join(out)
-        return obj
+            pieces.append((True, obj[last:]))
+            stringify = self._stringify
+            return False, lambda state: "".join(p if lit else stringify(p(state)) for lit, p in pieces)
+        return True, obj
 
     def _eval_expr(self, expr: str, state: Dict[str, Any]) -> Any:
+        """Evaluate expression inside ${...} (one-off; see `_compile_expr`)."""
+        return self._compile_expr(expr)(state)
+
+    def _compile_expr(self, expr: str) -> Resolver:
         """
-        Evaluate expression inside ${...}.
+        Compile an expression inside ${...}.
 
         - Ternary: ?:
         - Default: NAME:default
@@ -296,30 +514,38 @@ class Spine:
             rest = expr[q_idx + 1 :]
             c_idx = self._top_level_char(rest, ":")
             if c_idx == -1:
-                raise ValueError(f"invalid ternary expression: {expr!r}")
-            then_part = rest[:c_idx].strip()
-            else_part = rest[c_idx + 1 :].strip()
-            cond_val = self._resolve_path_or_var(cond, state, missing_ok=True)
-            branch = then_part if self._truthy(cond_val) else else_part
-            # Support nested ${...} in branches by resolving as a standalone string
-            if branch.startswith("${") and branch.endswith("}"):
-                return self._resolve(branch, state)
-            return self._parse_literal(branch)
+                def _invalid(state: Dict[str, Any]) -> Any:
+                    raise ValueError(f"invalid ternary expression: {expr!r}")
+                return _invalid
+            cond_fn = self._compile_path(cond, missing_ok=True)
+            then_fn = self._compile_branch(rest[:c_idx].strip())
+            else_fn = self._compile_branch(rest[c_idx + 1 :].strip())
+            truthy = self._truthy
+            return lambda state: (then_fn if truthy(cond_fn(state)) else else_fn)(state)
 
         # Handle default NAME:default (only when there's a single top-level ':' )
         c_idx = self._top_level_char(expr, ":")
         if c_idx != -1:
-            name = expr[:c_idx].strip()
-            default_raw = expr[c_idx + 1 :].strip()
-            val = self._resolve_path_or_var(name, state, missing_ok=True)
-            # Treat None/empty-string as missing so defaults work even if blank
-            if val is not _MISSING and not (val is None or (isinstance(val, str) and val.strip() == "")):
-                return val
-            return self._parse_literal(default_raw)
+            val_fn = self._compile_path(expr[:c_idx].strip(), missing_ok=True)
+            default = self._parse_literal(expr[c_idx + 1 :].strip())
+
+            def _with_default(state: Dict[str, Any]) -> Any:
+                val = val_fn(state)
+                # Treat None/empty-string as missing so defaults work even if blank
+                if val is not _MISSING and not (val is None or (isinstance(val, str) and val.strip() == "")):
+                    return val
+                return default
+            return _with_default
 
         # Simple name/path
-        val = self._resolve_path_or_var(expr, state, missing_ok=False)
-        return val
+        return self._compile_path(expr, missing_ok=False)
+
+    def _compile_branch(self, branch: str) -> Resolver:
+        # Support nested ${...} in branches by resolving as a standalone string
+        if branch.startswith("${") and branch.endswith("}"):
+            return self._compile(branch)
+        value = self._parse_literal(branch)
+        return lambda state: value
 
     @staticmethod
     def _parse_literal(text: str) -> Any:
@@ -373,27 +599,35 @@ class Spine:
 
         Examples: "fetch.result", "fetch.result.rows", "ITEMS".
         """
+        return self._compile_path(name, missing_ok=missing_ok)(state)
+
+    @staticmethod
+    def _compile_path(name: str, *, missing_ok: bool) -> Resolver:
         name = name.strip()
         root_key, *rest = name.split(".")
 
-        # First check step results by id
-        if root_key in state:
-            cur: Any = state[root_key]
-        else:
-            # look in vars
-            vars_map = state.get("vars", {})
-            if root_key in vars_map:
-                cur = vars_map[root_key]
-            else:
-                return _MISSING if missing_ok else (_ for _ in ()).throw(KeyError(f"unknown name: {name!r}"))
-
-        for key in rest:
-            if isinstance(cur, dict) and key in cur:
-                cur = cur[key]
+        def _lookup(state: Dict[str, Any]) -> Any:
+            # First check step results by id
+            if root_key in state:
+                cur: Any = state[root_key]
             else:
-                cur = None
-                break
-        return cur
+                # look in vars
+                vars_map = state.get("vars", {})
+                if root_key in vars_map:
+                    cur = vars_map[root_key]
+                elif missing_ok:
+                    return _MISSING
+                else:
+                    raise KeyError(f"unknown name: {name!r}")
+
+            for key in rest:
+                if isinstance(cur, dict) and key in cur:
+                    cur = cur[key]
+                else:
+                    cur = None
+                    break
+            return cur
+        return _lookup
 
 
 # ---------------------------- static self-test ---------------------------------
@@ -454,6 +688,8 @@ if __name__ == "__main__":
         )
         arts3 = s1.load_pipeline_and_run(pipe, variables={"msg": "hi"})
         ok3 = len(arts3) == 1 and (arts3[0].meta or {}).get("result", {}).get("echo", {}).get("prev") == "hi"
+        run3 = s1.run_pipeline(pipe, variables={"msg": "hi"})
+        ok3 = ok3 and [t["step"] for t in run3.timings] == ["s1", "s2"] and "wall_secs" not in str(run3.artifacts)
         print("[bootstrap.selftest] pipeline:", "OK" if ok3 else "FAIL")
         failures += 0 if ok3 else 1
 
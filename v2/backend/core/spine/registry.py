@@ -4,7 +4,10 @@ Spine Capability Registry (runtime)
 
 - Maps capability name → callable (provider function).
 - Stable `.run(name, payload, context)` API used by orchestrator/loader.
-- Normalizes provider returns into lightweight Artifact records.
+- Calling convention is compiled once per capability (on first resolve) into
+  a dispatch plan; `.run` then makes exactly one provider call.
+- Normalizes provider returns into lightweight Artifact records (content hash
+  computed lazily, on first read of `.sha256`).
 - **Promotes plain-dict errors** (e.g., {"error": "...", ...}) to Problem artifacts
   so engines always see failures without guessing.
 
@@ -19,7 +22,7 @@ Exports (compat):
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import hashlib
 import importlib
 import inspect
@@ -30,40 +33,59 @@ import traceback
 # ------------------------------- Artifacts ----------------------------------
 
 
+class _LazySha256:
+    """Data descriptor for Artifact.sha256: an empty hash is computed on first read."""
+
+    def __get__(self, obj: Any, owner: Any = None) -> str:
+        if obj is None:
+            return ""  # dataclass default
+        d = obj.__dict__
+        sha = d.get("_sha256")
+        if not sha:
+            sha = d["_sha256"] = _sha256(obj.kind, obj.uri, obj.meta or {})
+        return sha
+
+    def __set__(self, obj: Any, value: Optional[str]) -> None:
+        obj.__dict__["_sha256"] = value or ""
+
+
 @dataclass
 class Artifact:
-    """Minimal artifact envelope for capability outputs."""
+    """
+    Minimal artifact envelope for capability outputs.
+
+    `sha256` is filled in on first read when constructed empty: serialising a
+    large `meta` (e.g. a 50k-record fetch result) just to hash it is skipped
+    unless somebody actually asks for the hash. The hash reflects `meta` as it
+    is at that first read.
+    """
     kind: str                  # "Result" | "Problem" | ...
     uri: str                   # e.g., spine://result/<cap> or spine://capability/<cap>
-    sha256: str                # deterministic content hash (may be empty for Problems)
+    sha256: str = _LazySha256()  # type: ignore[assignment]  # content hash ("" → computed lazily)
     meta: Dict[str, Any] = field(default_factory=dict)
 
     def to_dict(self) -> Dict[str, Any]:
         return {"kind": self.kind, "uri": self.uri, "sha256": self.sha256, "meta": self.meta}
 
 
-def _sha256(kind: str, uri: str, meta: Dict[str, Any]) -> str:
+def _sha256(kind: Any, uri: Any, meta: Dict[str, Any]) -> str:
     """Compute a deterministic sha256 over a small JSON envelope."""
-    def _jsonable(x: Any) -> Any:
-        try:
-            json.dumps(x)
-            return x
-        except Exception:
-            return repr(x)
-
-    blob = json.dumps(
-        {"kind": kind, "uri": uri, "meta": _jsonable(meta or {})},
-        sort_keys=True,
-        ensure_ascii=True,
-        separators=(",", ":"),
-        default=repr,
-    ).encode("utf-8")
-    return hashlib.sha256(blob).hexdigest()
+    env = {
+        "kind": kind if kind is None or isinstance(kind, str) else repr(kind),
+        "uri": uri if uri is None or isinstance(uri, str) else repr(uri),
+        "meta": meta or {},
+    }
+    try:
+        # Single pass; a meta that is not plain JSON hashes as its repr (as before)
+        blob = json.dumps(env, sort_keys=True, ensure_ascii=True, separators=(",", ":"))
+    except (TypeError, ValueError):
+        env["meta"] = repr(meta)
+        blob = json.dumps(env, sort_keys=True, ensure_ascii=True, separators=(",", ":"), default=repr)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
 
 
 def _make_result(cap: str, meta: Dict[str, Any]) -> Artifact:
-    uri = f"spine://result/{cap}"
-    return Artifact("Result", uri, _sha256("Result", uri, meta), meta)
+    return Artifact("Result", f"spine://result/{cap}", "", meta)
 
 
 def _make_problem(cap: str, code: str, message: str, *, details: Optional[Dict[str, Any]] = None,
@@ -87,8 +109,111 @@ def _make_problem(cap: str, code: str, message: str, *, details: Optional[Dict[s
                 continue
             meta[k] = v
 
-    uri = f"spine://capability/{cap}"
-    return Artifact("Problem", uri, _sha256("Problem", uri, meta), meta)
+    return Artifact("Problem", f"spine://capability/{cap}", "", meta)
+
+
+# ------------------------------ Dispatch plans ------------------------------
+
+
+class _TaskLike:
+    """Task stand-in passed to providers that take a task (only `.payload` is read)."""
+    __slots__ = ("payload",)
+
+    def __init__(self, p: Any) -> None:
+        self.payload = p
+
+
+# form -> fn -> invoker(capability, payload, ctx)
+_INVOKERS: Dict[str, Callable[[Callable[..., Any]], Callable[[str, Any, Dict[str, Any]], Any]]] = {
+    "cap_task_ctx": lambda fn: lambda c, p, x: fn(c, _TaskLike(p), x),
+    "cap_task": lambda fn: lambda c, p, x: fn(c, _TaskLike(p)),
+    "cap_payload_ctx": lambda fn: lambda c, p, x: fn(c, p, x),
+    "cap_payload": lambda fn: lambda c, p, x: fn(c, p),
+    "task_ctx": lambda fn: lambda c, p, x: fn(_TaskLike(p), x),
+    "task": lambda fn: lambda c, p, x: fn(_TaskLike(p)),
+    "payload_ctx": lambda fn: lambda c, p, x: fn(p, x),
+    "payload": lambda fn: lambda c, p, x: fn(p),
+    "kw_task_ctx": lambda fn: lambda c, p, x: fn(task_like=_TaskLike(p), context=x),
+    "kw_task": lambda fn: lambda c, p, x: fn(task_like=_TaskLike(p)),
+}
+
+# Tolerant forms, in the order dispatch has always tried them: (form, positional args, keyword names)
+_LADDER = (
+    ("task_ctx", 2, ()),
+    ("task", 1, ()),
+    ("payload_ctx", 2, ()),
+    ("payload", 1, ()),
+    ("kw_task_ctx", 0, ("task_like", "context")),
+    ("kw_task", 0, ("task_like",)),
+)
+_NAME_PARAMS = ("name", "capability", "cap")
+_TASK_PARAMS = ("task", "task_like")
+_PAYLOAD_PARAMS = ("payload", "data", "params", "spec")
+
+
+@dataclass(frozen=True)
+class _DispatchPlan:
+    """
+    How to call one provider, decided once from its signature.
+
+    `form` names the chosen call shape; `retry_wrapped` keeps the old rule that
+    a raw-payload call failing on a missing `.payload` is retried with a task.
+    A plan with form "ladder" (signature not introspectable) uses trial calls.
+    """
+    fn: Callable[..., Any]
+    form: str
+    call: Optional[Callable[[str, Any, Dict[str, Any]], Any]] = None  # (capability, payload, ctx)
+    retry_wrapped: bool = False
+
+
+def _plan_for(fn: Callable[..., Any], form: str, retry_wrapped: bool = False) -> _DispatchPlan:
+    return _DispatchPlan(fn, form, _INVOKERS[form](fn), retry_wrapped)
+
+
+def _signature_guess(names: List[str]) -> Optional[Tuple[str, int]]:
+    """Name-based convention from the leading parameter names (same rules as before)."""
+    if not names:
+        return None
+    first = names[0]
+    second = names[1] if len(names) > 1 else None
+    third = names[2] if len(names) > 2 else None
+    if first in _NAME_PARAMS and second is not None:
+        arg2 = "task" if second in _TASK_PARAMS else "payload"
+        if third is not None:
+            return f"cap_{arg2}_ctx", 3
+        return f"cap_{arg2}", 2
+    if first in _TASK_PARAMS:
+        return ("task_ctx", 2) if second is not None else ("task", 1)
+    if first in _PAYLOAD_PARAMS:
+        return ("payload_ctx", 2) if second is not None else ("payload", 1)
+    return None
+
+
+def compile_dispatch_plan(fn: Callable[..., Any]) -> _DispatchPlan:
+    """
+    Pick the provider's calling convention from its signature: the name-based
+    guess if the signature accepts it, else the first tolerant-ladder form it
+    accepts (checked with Signature.bind, no trial calls).
+    """
+    try:
+        sig = inspect.signature(fn)
+    except (TypeError, ValueError):
+        return _DispatchPlan(fn, "ladder")
+
+    def _binds(n_args: int, kwargs: Tuple[str, ...] = ()) -> bool:
+        try:
+            sig.bind(*([None] * n_args), **{k: None for k in kwargs})
+            return True
+        except TypeError:
+            return False
+
+    guess = _signature_guess(list(sig.parameters))
+    if guess is not None and _binds(guess[1]):
+        return _plan_for(fn, guess[0])
+    for form, n_args, kwargs in _LADDER:
+        if _binds(n_args, kwargs):
+            return _plan_for(fn, form, retry_wrapped=(form == "payload"))
+    return _DispatchPlan(fn, "incompatible")
 
 
 # ---------------------------- Capability Registry ---------------------------
@@ -98,7 +223,8 @@ class CapabilityRegistry:
     """In-memory map of capabilities to provider callables."""
 
     def __init__(self) -> None:
-        # capability -> spec dict: {"target": callable|str, "input_schema": str|None, "output_schema": str|None}
+        # capability -> spec dict: {"target": callable|str, "input_schema": str|None, "output_schema": str|None,
+        #                           "plan": _DispatchPlan (once resolved)}
         self._caps: Dict[str, Dict[str, Any]] = {}
 
     # ---- registration ----
@@ -143,6 +269,15 @@ class CapabilityRegistry:
             return func
         raise TypeError(f"Invalid target spec for {capability}: {target!r}")
 
+    def _plan(self, capability: str) -> _DispatchPlan:
+        """Resolve the provider and compile its dispatch plan once; cached on the spec."""
+        spec = self._caps.get(capability)
+        plan = spec.get("plan") if spec is not None else None
+        if plan is None:
+            plan = compile_dispatch_plan(self._resolve(capability))
+            self._caps[capability]["plan"] = plan
+        return plan
+
     def has(self, capability: str) -> bool:
         return capability in self._caps
 
@@ -165,8 +300,6 @@ class CapabilityRegistry:
             for i, x in enumerate(obj):
                 # Already an Artifact?
                 if isinstance(x, Artifact):
-                    if not getattr(x, "sha256", None):
-                        x.sha256 = _sha256(x.kind, x.uri, x.meta or {})
                     out.append(x)
                     continue
 
@@ -175,8 +308,7 @@ class CapabilityRegistry:
                     kind = x.get("kind")
                     uri = x.get("uri")
                     meta = x.get("meta") or {}
-                    sha = x.get("sha256") or _sha256(kind, uri, meta)
-                    out.append(Artifact(kind, uri, sha, meta))
+                    out.append(Artifact(kind, uri, x.get("sha256") or "", meta))
                     continue
 
                 # Plain dict → promote error if present else wrap as Result
@@ -201,8 +333,7 @@ class CapabilityRegistry:
                 kind = obj.get("kind")
                 uri = obj.get("uri")
                 meta = obj.get("meta") or {}
-                sha = obj.get("sha256") or _sha256(kind, uri, meta)
-                return [Artifact(kind, uri, sha, meta)]  # type: ignore[arg-type]
+                return [Artifact(kind, uri, obj.get("sha256") or "", meta)]  # type: ignore[arg-type]
 
             # Plain dict → promote error if present
             if "error" in obj:
@@ -223,79 +354,56 @@ class CapabilityRegistry:
         """
         Execute a capability and wrap provider results in Artifacts.
 
-        Signature-aware dispatch:
+        Signature-aware dispatch (plan compiled once per capability, see compile_dispatch_plan):
           - If provider params start with ('name'|'capability'|'cap'), pass the capability as first arg.
           - If a param looks like ('task'|'task_like'), pass a wrapper with `.payload`.
           - Otherwise, pass the raw payload dict.
-          - Supports context positional or keyword; falls back to tolerant variants.
+          - Supports context positional or keyword; odd signatures get the first
+            tolerant variant they accept.
+        A TypeError raised inside the provider is reported, not retried.
         """
         try:
-            fn = self._resolve(capability)
+            plan = self._plan(capability)
         except Exception as e:
             return [ _make_problem(capability, "CapabilityNotFound", str(e), exc=e) ]
 
         ctx = context or {}
 
-        class _TaskLike:
-            __slots__ = ("payload",)
-
-            def __init__(self, p: Any) -> None:
-                self.payload = p
+        if plan.form == "ladder":
+            return self._run_ladder(capability, plan.fn, payload, ctx)
+        if plan.form == "incompatible":
+            return [
+                _make_problem(
+                    capability,
+                    "ProviderInvocationError",
+                    "incompatible runner signature (accepts none of the supported call forms)",
+                )
+            ]
 
-        wrapped = _TaskLike(payload)
-
-        # Inspect parameters to choose the safest call form.
-        names: List[str] = []
         try:
-            sig = inspect.signature(fn)
-            params = list(sig.parameters.values())
-            names = [p.name for p in params]
-        except Exception:
-            names = []
-
-        def _call_with(*args, **kwargs):
-            return fn(*args, **kwargs)
-
-        # 1) Signature-based best guess
-        try:
-            if names:
-                first = names[0]
-                second = names[1] if len(names) > 1 else None
-                third = names[2] if len(names) > 2 else None
-
-                # run(name, payload|task, context?)
-                if first in ("name", "capability", "cap") and second is not None:
-                    wants_task = second in ("task", "task_like")
-                    arg2 = wrapped if wants_task else payload
-                    if third is not None:
-                        return self._normalize_to_artifacts(capability, _call_with(capability, arg2, ctx))
-                    return self._normalize_to_artifacts(capability, _call_with(capability, arg2))
-
-                # run(task, context?) / run(task)
-                if first in ("task", "task_like"):
-                    if second is not None:
-                        return self._normalize_to_artifacts(capability, _call_with(wrapped, ctx))
-                    return self._normalize_to_artifacts(capability, _call_with(wrapped))
-
-                # run(payload, context?) / run(payload)
-                if first in ("payload", "data", "params", "spec"):
-                    if second is not None:
-                        return self._normalize_to_artifacts(capability, _call_with(payload, ctx))
-                    return self._normalize_to_artifacts(capability, _call_with(payload))
-        except TypeError:
-            # Fall through to tolerant ladder
-            pass
+            return self._normalize_to_artifacts(capability, plan.call(capability, payload, ctx))
+        except AttributeError as ae:
+            msg = str(ae)
+            # If we passed a raw dict and provider expected `.payload`, retry with wrapped once.
+            if plan.retry_wrapped and "has no attribute 'payload'" in msg:
+                try:
+                    return self._normalize_to_artifacts(capability, plan.fn(_TaskLike(payload)))
+                except Exception as e_wrap:
+                    return [ _make_problem(capability, "ProviderError", f"after task-like retry: {e_wrap}", exc=e_wrap) ]
+            return [ _make_problem(capability, "ProviderError", f"{ae}", exc=ae) ]
         except Exception as e:
-            return [ _make_problem(capability, "ProviderError", f"error during signature-based dispatch: {e}", exc=e) ]
+            return [ _make_problem(capability, "ProviderError", f"{e}", exc=e) ]
 
-        # 2) Tolerant ladder (covers odd signatures)
+    def _run_ladder(self, capability: str, fn: Callable[..., Any], payload: Any, ctx: Dict[str, Any]) -> List[Artifact]:
+        """Trial-call dispatch, only for callables whose signature cannot be inspected."""
+        wrapped = _TaskLike(payload)
         attempts = [
-            lambda: _call_with(wrapped, ctx),
-            lambda: _call_with(wrapped),
-            lambda: _call_with(payload, ctx),
-            lambda: _call_with(payload),
-            lambda: _call_with(task_like=wrapped, context=ctx),
-            lambda: _call_with(task_like=wrapped),
+            lambda: fn(wrapped, ctx),
+            lambda: fn(wrapped),
+            lambda: fn(payload, ctx),
+            lambda: fn(payload),
+            lambda: fn(task_like=wrapped, context=ctx),
+            lambda: fn(task_like=wrapped),
         ]
 
         last_type_error: Optional[BaseException] = None
@@ -308,17 +416,15 @@ class CapabilityRegistry:
                 continue
             except AttributeError as ae:
                 msg = str(ae)
-                # If we passed a raw dict and provider expected `.payload`, retry with wrapped once.
-                if idx == 3 and ("has no attribute 'payload'" in msg or "object has no attribute 'payload'" in msg):
+                if idx == 3 and "has no attribute 'payload'" in msg:
                     try:
-                        return self._normalize_to_artifacts(capability, _call_with(wrapped))
+                        return self._normalize_to_artifacts(capability, fn(wrapped))
                     except Exception as e_wrap:
                         return [ _make_problem(capability, "ProviderError", f"after task-like retry: {e_wrap}", exc=e_wrap) ]
                 return [ _make_problem(capability, "ProviderError", f"{ae}", exc=ae) ]
             except Exception as e:
                 return [ _make_problem(capability, "ProviderError", f"{e}", exc=e) ]
 
-        # 3) Exhausted only with TypeErrors
         return [
             _make_problem(
                 capability,
@@ -9,14 +9,66 @@ import json
 import os
 import re
 
+# Digests of files written by ManifestAppender, keyed by resolved path and
+# validated against (size, mtime_ns, inode) so stale entries are never used.
+_KNOWN_DIGESTS: Dict[str, Tuple[Tuple[int, int, int], str]] = {}
+
+_HASH_CHUNK = 1024 * 1024
+
+
+def _stat_key(p: Path) -> Tuple[int, int, int]:
+    st = p.stat()
+    return (int(st.st_size), int(st.st_mtime_ns), int(st.st_ino))
+
+
+def _sha256_of_file(p: Path) -> str:
+    """Digest `p`, reusing the one recorded by the appender that wrote it if still current."""
+    p = Path(p)
+    known = _KNOWN_DIGESTS.get(str(p.resolve()))
+    if known is not None and known[0] == _stat_key(p):
+        return known[1]
+    h = hashlib.sha256()
+    with p.open("rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
 class ManifestAppender:
-    def __init__(self, manifest_path: Path) -> None:
+    """
+    Streaming JSONL manifest writer.
+
+    One buffered handle stays open for the appender's lifetime (flushes are
+    batched by the buffer), and the SHA-256 of the file is updated as bytes are
+    written. Call close() (or use it as a context manager) when done; the final
+    digest is then reused by write_sha256sums_for_file instead of re-reading.
+    """
+
+    def __init__(self, manifest_path: Path, buffer_bytes: int = 1024 * 1024) -> None:
         self.manifest_path = Path(manifest_path)
         self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
-        if not self.manifest_path.exists():
-            self.manifest_path.write_text("", encoding="utf-8")
+        self._buffer_bytes = int(buffer_bytes)
+        self._sha = hashlib.sha256()
+        self._size = 0
+        if self.manifest_path.exists():
+            # Appending to an existing manifest: seed the digest with its content.
+            with self.manifest_path.open("rb") as f:
+                for chunk in iter(lambda: f.read(_HASH_CHUNK), b""):
+                    self._sha.update(chunk)
+                    self._size += len(chunk)
+        self._fh = self.manifest_path.open("ab", buffering=self._buffer_bytes)
+
+    # ---- raw I/O ----
+
+    def _write(self, data: bytes) -> None:
+        if self._fh is None:
+            self._fh = self.manifest_path.open("ab", buffering=self._buffer_bytes)
+        self._fh.write(data)
+        self._sha.update(data)
+        self._size += len(data)
 
     def _read_lines(self) -> List[str]:
+        self.flush()
         if not self.manifest_path.exists():
             return []
         raw = self.manifest_path.read_text(encoding="utf-8", errors="replace")
@@ -25,16 +77,34 @@ class ManifestAppender:
         return [ln.rstrip("\n") for ln in raw.splitlines()]
 
     def _write_lines(self, lines: Iterable[str]) -> None:
+        # Full rewrite (only when a header must be inserted before existing records).
+        self.close()
         text = "\n".join([ln.rstrip("\n") for ln in lines]) + "\n"
-        self.manifest_path.write_text(text, encoding="utf-8")
+        data = text.encode("utf-8")
+        self.manifest_path.write_bytes(data)
+        self._sha = hashlib.sha256(data)
+        self._size = len(data)
+
+    def _first_line(self) -> Optional[str]:
+        self.flush()
+        with self.manifest_path.open("r", encoding="utf-8", errors="replace") as f:
+            for ln in f:
+                if ln.strip():
+                    return ln.rstrip("\n")
+        return None
+
+    # ---- public API ----
+
+    @property
+    def sha256(self) -> str:
+        """Hex digest of everything in the file so far."""
+        return self._sha.hexdigest()
 
     def ensure_header(self, header_record: dict) -> None:
-        lines = self._read_lines()
-        first_idx = None
-        for i, ln in enumerate(lines):
-            if ln.strip():
-                first_idx = i
-                break
+        header_line = json.dumps(header_record, ensure_ascii=False, sort_keys=True)
+        if self._size == 0:
+            self._write((header_line + "\n").encode("utf-8"))
+            return
 
         def _is_header(s: str) -> bool:
             try:
@@ -43,33 +113,56 @@ class ManifestAppender:
             except Exception:
                 return False
 
-        if first_idx is None:
-            self._write_lines([json.dumps(header_record, ensure_ascii=False, sort_keys=True)])
+        first = self._first_line()
+        if first is not None and _is_header(first):
             return
 
-        if _is_header(lines[first_idx]):
+        lines = self._read_lines()
+        first_idx = None
+        for i, ln in enumerate(lines):
+            if ln.strip():
+                first_idx = i
+                break
+        if first_idx is None:
+            self._write_lines([header_line])
             return
 
         new_lines = []
         new_lines.extend(lines[:first_idx])
-        new_lines.append(json.dumps(header_record, ensure_ascii=False, sort_keys=True))
+        new_lines.append(header_line)
         new_lines.extend(lines[first_idx:])
         self._write_lines(new_lines)
 
     def append_record(self, record: dict) -> None:
         line = json.dumps(record, ensure_ascii=False, sort_keys=True) + "\n"
-        with self.manifest_path.open("ab") as f:
-            f.write(line.encode("utf-8"))
+        self._write(line.encode("utf-8"))
 
     def append_many(self, records: Iterable[Dict[str, Any]]) -> int:
         n = 0
-        with self.manifest_path.open("ab") as f:
-            for rec in records:
-                line = json.dumps(rec, ensure_ascii=False, sort_keys=True) + "\n"
-                f.write(line.encode("utf-8"))
-                n += 1
+        for rec in records:
+            self.append_record(rec)
+            n += 1
         return n
 
+    def flush(self) -> None:
+        """Push buffered records to disk (e.g. before the file is stat'ed or read)."""
+        if self._fh is not None:
+            self._fh.flush()
+        if self.manifest_path.exists():
+            _KNOWN_DIGESTS[str(self.manifest_path.resolve())] = (_stat_key(self.manifest_path), self.sha256)
+
+    def close(self) -> None:
+        if self._fh is not None:
+            self.flush()
+            self._fh.close()
+            self._fh = None
+
+    def __enter__(self) -> "ManifestAppender":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
 
 def _artifact_record(kind: str, path: Path, extra: Optional[dict] = None) -> dict:
     rec = {
@@ -92,6 +185,7 @@ def emit_standard_artifacts(
     out_guide: Optional[Path] = None,
 ) -> int:
     count = 0
+    appender.flush()  # the bundle's own size below must include buffered records
 
     if out_bundle and Path(out_bundle).exists():
         appender.append_record(_artifact_record("manifest.bundle", Path(out_bundle)))
@@ -197,8 +291,7 @@ def write_sha256sums_for_file(target_file: Path, out_sums_path: Path) -> None:
     if not p.exists():
         return
 
-    data = p.read_bytes()
-    digest = hashlib.sha256(data).hexdigest()
+    digest = _sha256_of_file(p)
     line = f"{digest}  {p.name}\n"
     out_sums_path = Path(out_sums_path)
     out_sums_path.parent.mkdir(parents=True, exist_ok=True)
@@ -0,0 +1,142 @@
+"""
+Microbenchmark: repo discovery (walk + segment excludes + include/exclude globs).
+
+Compares the previous discover_repo_paths (os.walk, fnmatch per pattern per
+file, exclude set rebuilt per directory, extra stat per file) with the current
+one (single scandir walk through DiscoveryEngine, globs compiled into one regex)
+on a synthetic tree with ~100k entries, using the globs from config/packager.yml.
+Also times glob matching alone over the same relative paths.
+
+Run:
+    python -m v2.backend.core.utils.code_bundles.code_bundles.execute.bench_discovery [--entries 100000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import fnmatch
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import List, Tuple
+
+from v2.backend.core.utils.code_bundles.code_bundles.execute.funcs import discover_repo_paths
+from v2.backend.core.utils.code_bundles.code_bundles.src.packager.core.discovery import compile_globs
+
+INCLUDE = ["config/**", "cold_start/**", "recovery/**", "scripts/**", "v2/**"]
+EXCLUDE = [
+    "**/.git/**", "**/__pycache__/**", "**/*.pyc", "**/.mypy_cache/**", "**/.pytest_cache/**",
+    "**/.idea/**", "**/.vscode/**", "secret_management/**", "**/node_modules/**", "**/dist/**",
+    "**/build/**", "**/.venv/**",
+]
+SEGMENTS = [".git", "__pycache__", ".mypy_cache", ".pytest_cache", ".idea", ".vscode",
+            "node_modules", "dist", "build", ".venv", "venv", "v1"]
+
+_TOPS = ["v2", "v2", "v2", "scripts", "config", "recovery", "docs", "secret_management"]
+_SUBS = ["", "__pycache__/", "build/", "node_modules/pkg/"]
+_EXTS = [".py", ".py", ".py", ".pyc", ".json", ".md", ".sql", ".js"]
+
+
+def synthetic_paths(n: int) -> List[str]:
+    """~n relative file paths spread over a few top-level dirs, with some excluded subtrees."""
+    out: List[str] = []
+    for i in range(n):
+        top = _TOPS[i % len(_TOPS)]
+        sub = _SUBS[(i // 7) % len(_SUBS)] if i % 5 == 0 else ""
+        out.append(f"{top}/pkg{i % 40:02d}/mod{(i // 40) % 25:02d}/{sub}f{i}{_EXTS[i % len(_EXTS)]}")
+    return out
+
+
+def make_tree(root: Path, rels: List[str]) -> None:
+    for rel in rels:
+        p = root / rel
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_bytes(b"")
+
+
+def legacy_discover(src_root: Path) -> List[Tuple[Path, str]]:
+    """discover_repo_paths as it was before the shared DiscoveryEngine walk."""
+    def match_any(rel_posix: str, globs: List[str]) -> bool:
+        for g in globs:
+            if fnmatch.fnmatch(rel_posix, g.replace("\\", "/")):
+                return True
+        return False
+
+    def seg_excluded(parts: Tuple[str, ...]) -> bool:
+        segs = set(SEGMENTS)
+        return any(seg in segs for seg in parts[:-1])
+
+    out: List[Tuple[Path, str]] = []
+    for cur, dirs, files in os.walk(src_root):
+        dirs[:] = [d for d in dirs if not seg_excluded((Path(cur) / d).relative_to(src_root).parts)]
+        for fn in sorted(files):
+            p = Path(cur) / fn
+            if not p.is_file():
+                continue
+            rel_posix = p.relative_to(src_root).as_posix()
+            if not match_any(rel_posix, INCLUDE):
+                continue
+            if match_any(rel_posix, EXCLUDE):
+                continue
+            out.append((p, rel_posix))
+    out.sort(key=lambda t: t[1])
+    return out
+
+
+def _best(fn, repeat: int) -> Tuple[float, object]:
+    best, res = float("inf"), None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        res = fn()
+        best = min(best, time.perf_counter() - t0)
+    return best, res
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--entries", type=int, default=100_000)
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+
+    rels = synthetic_paths(args.entries)
+
+    # Glob matching alone (no I/O)
+    def old_match() -> int:
+        return sum(
+            1 for r in rels
+            if any(fnmatch.fnmatch(r, g) for g in INCLUDE) and not any(fnmatch.fnmatch(r, g) for g in EXCLUDE)
+        )
+
+    inc, exc = compile_globs(tuple(INCLUDE)), compile_globs(tuple(EXCLUDE))
+
+    def new_match() -> int:
+        return sum(1 for r in rels if inc(r) and not exc(r))
+
+    t_old_m, n_old = _best(old_match, args.repeat)
+    t_new_m, n_new = _best(new_match, args.repeat)
+
+    with tempfile.TemporaryDirectory() as td:
+        root = Path(td)
+        make_tree(root, rels)
+        t_old_w, a = _best(lambda: legacy_discover(root), args.repeat)
+        t_new_w, b = _best(
+            lambda: discover_repo_paths(
+                src_root=root,
+                include_globs=INCLUDE,
+                exclude_globs=EXCLUDE,
+                segment_excludes=SEGMENTS,
+            ),
+            args.repeat,
+        )
+
+    print(f"[bench_discovery] {args.entries} files, {len(INCLUDE)} include / {len(EXCLUDE)} exclude globs")
+    print(f"  glob match  fnmatch per pattern {t_old_m:>7.3f}s   compiled {t_new_m:>7.3f}s   "
+          f"speedup={t_old_m / t_new_m if t_new_m else 0:4.1f}x   same={n_old == n_new}")
+    print(f"  discovery   legacy os.walk      {t_old_w:>7.3f}s   engine   {t_new_w:>7.3f}s   "
+          f"speedup={t_old_w / t_new_w if t_new_w else 0:4.1f}x   same={a == b} ({len(b)} kept)")
+    return 0 if (n_old == n_new and a == b) else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,194 @@
+"""
+Benchmark: full vs incremental packager runs on a synthetic tree.
+
+Builds a synthetic repository (default 5,000 files: Python, SQL, JS and
+Markdown), then times:
+  - full:          clear outputs + copy_snapshot + augment_manifest
+  - incr (cold):   first incremental run (empty fingerprint index)
+  - incr (1 edit): incremental run after editing a single .py file
+and checks that the incremental manifest matches a full run over the edited
+tree (record for record, ignoring run timestamps and the run-telemetry
+bundle_summary / artifact records).
+
+Run:
+    python -m v2.backend.core.utils.code_bundles.code_bundles.execute.bench_incremental [--files 5000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import tempfile
+import time
+from pathlib import Path
+from types import SimpleNamespace as NS
+from typing import List, Tuple
+
+from v2.backend.core.utils.code_bundles.code_bundles.execute.funcs import (
+    clear_dir_contents,
+    copy_snapshot,
+    discover_repo_paths,
+    sync_snapshot,
+)
+from v2.backend.core.utils.code_bundles.code_bundles.execute.read_scanners import augment_manifest
+from v2.backend.core.utils.code_bundles.code_bundles.src.packager.core.incremental import (
+    FingerprintIndex,
+    packager_salt,
+    use_index,
+)
+
+_TS = re.compile(r'"(detected_at|generated_at)": "[^"]*"')
+
+_PY = '''"""Synthetic module {i}."""
+import os
+from typing import List
+
+
+class Widget{i}:
+    """Widget number {i}."""
+
+    def __init__(self, size: int = {i}) -> None:
+        self.size = size
+
+    def grow(self, n: int) -> int:
+        if n > 10:
+            return self.size + n
+        for _ in range(n):
+            self.size += 1
+        return self.size
+
+
+def helper_{i}(items: List[int]) -> int:
+    total = 0
+    for x in items:
+        if x % 2:
+            total += x
+        elif x > {i}:
+            total -= x
+    return total + len(os.environ.get("SYNTH_{m}", ""))
+'''
+
+_SQL = "CREATE TABLE t_{i} (id INTEGER PRIMARY KEY, name TEXT);\nSELECT id, name FROM t_{i} WHERE id > {i};\n"
+_JS = "import {{ x }} from './m{m}.js';\nexport function f{i}(a) {{ return a + {i} + process.env.SYNTH_{m}; }}\n"
+_MD = "# Note {i}\n\nSynthetic documentation file {i}.\n"
+
+
+def make_tree(root: Path, n_files: int) -> None:
+    """Deterministic tree: 80% .py, 10% .sql, 6% .js, 4% .md across 50 packages."""
+    for i in range(n_files):
+        pkg = root / f"pkg{i % 50:02d}"
+        pkg.mkdir(parents=True, exist_ok=True)
+        r = i % 50
+        if r < 40:
+            (pkg / f"mod_{i}.py").write_text(_PY.format(i=i, m=i % 7), encoding="utf-8")
+        elif r < 45:
+            (pkg / f"q_{i}.sql").write_text(_SQL.format(i=i), encoding="utf-8")
+        elif r < 48:
+            (pkg / f"m_{i}.js").write_text(_JS.format(i=i, m=i % 7), encoding="utf-8")
+        else:
+            (pkg / f"n_{i}.md").write_text(_MD.format(i=i), encoding="utf-8")
+
+
+def make_cfg(src: Path, art: Path) -> NS:
+    art.mkdir(parents=True, exist_ok=True)
+    return NS(
+        source_root=src.resolve(),
+        emitted_prefix="output/patch_code_bundles",
+        include_globs=["**/*"],
+        exclude_globs=[],
+        segment_excludes=[],
+        case_insensitive=False,
+        follow_symlinks=False,
+        out_bundle=(art / "design_manifest.jsonl").resolve(),
+        out_sums=(art / "design_manifest.SHA256SUMS").resolve(),
+        out_runspec=None,
+        out_guide=None,
+        transport=NS(part_stem="design_manifest", part_ext=".txt", parts_index_name="design_manifest_parts_index.json"),
+        emit_ast=True,
+        workers=1,
+        parse_cache_mb=512,
+        incremental={},
+    )
+
+
+def _discover(cfg: NS) -> List[Tuple[Path, str]]:
+    return discover_repo_paths(
+        src_root=cfg.source_root,
+        include_globs=list(cfg.include_globs),
+        exclude_globs=list(cfg.exclude_globs),
+        segment_excludes=list(cfg.segment_excludes),
+        case_insensitive=False,
+        follow_symlinks=False,
+    )
+
+
+def full_run(cfg: NS, snap: Path) -> float:
+    t0 = time.perf_counter()
+    clear_dir_contents(Path(cfg.out_bundle).parent)
+    clear_dir_contents(snap)
+    repo = _discover(cfg)
+    copy_snapshot(repo, snap)
+    augment_manifest(cfg=cfg, discovered_repo=repo, mode_local=True, mode_github=False, path_mode="local")
+    return time.perf_counter() - t0
+
+
+def incremental_run(cfg: NS, snap: Path, index_path: Path) -> float:
+    t0 = time.perf_counter()
+    clear_dir_contents(Path(cfg.out_bundle).parent)
+    repo = _discover(cfg)
+    index = FingerprintIndex.load(index_path, salt=packager_salt(emit_ast=cfg.emit_ast, source_root=cfg.source_root))
+    delta = index.refresh(repo)
+    sync_snapshot(repo, snap, delta.dirty)
+    with use_index(index):
+        augment_manifest(cfg=cfg, discovered_repo=repo, mode_local=True, mode_github=False, path_mode="local")
+    index.save()
+    return time.perf_counter() - t0
+
+
+def scanner_records(manifest: Path) -> List[str]:
+    """Manifest lines up to the bundle_summary, with run timestamps blanked."""
+    out: List[str] = []
+    for line in manifest.read_text(encoding="utf-8").splitlines():
+        if '"record_type": "bundle_summary"' in line:
+            break
+        out.append(_TS.sub(r'"\1": "-"', line))
+    return out
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--files", type=int, default=5000)
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as td:
+        root = Path(td)
+        src, art, snap = root / "src", root / "art", root / "snap"
+        index_path = root / "cache" / "fingerprints.json"
+        make_tree(src, args.files)
+        cfg = make_cfg(src, art)
+
+        t_full = full_run(cfg, snap)
+        t_cold = incremental_run(cfg, snap, index_path)
+
+        edited = next(iter(sorted(src.rglob("*.py"))))
+        edited.write_text(edited.read_text(encoding="utf-8") + "\n\ndef added(x):\n    return x * 2\n", encoding="utf-8")
+        t_warm = incremental_run(cfg, snap, index_path)
+        incr_records = scanner_records(Path(cfg.out_bundle))
+        snap_incr = sorted(p.relative_to(snap).as_posix() for p in snap.rglob("*") if p.is_file())
+
+        t_full2 = full_run(cfg, snap)
+        full_records = scanner_records(Path(cfg.out_bundle))
+        snap_full = sorted(p.relative_to(snap).as_posix() for p in snap.rglob("*") if p.is_file())
+
+    print(f"[bench_incremental] {args.files} files, 1 edited ({edited.name})")
+    print(f"  full run            {t_full:>8.2f}s")
+    print(f"  incremental (cold)  {t_cold:>8.2f}s")
+    print(f"  incremental (edit)  {t_warm:>8.2f}s   speedup vs full={t_full2 / t_warm if t_warm else 0:5.1f}x")
+    print(f"  full run (edit)     {t_full2:>8.2f}s")
+    same = incr_records == full_records and snap_incr == snap_full
+    print(f"  manifest records identical to full run: {same} ({len(full_records)} records)")
+    return 0 if same else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
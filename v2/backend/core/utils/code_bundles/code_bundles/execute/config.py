@@ -114,6 +114,11 @@ def build_cfg(
     gh = None
     if gh_owner and gh_repo:
         gh = NS(owner=gh_owner, repo=gh_repo, branch=gh_branch, base_path=gh_base)
+        # Optional publish knobs; consumers fall back to execute/github.py DEFAULTS when absent
+        for key in ("api_base", "user_agent", "timeout", "long_timeout", "throttle_every", "sleep_secs",
+                    "publish_api", "upload_workers"):
+            if key in gh_map:
+                setattr(gh, key, gh_map[key])
 
     mode = (publish_mode or "local").lower()
 
@@ -161,6 +166,9 @@ def build_cfg(
         prompts=None,
         prompt_mode="none",
         emit_ast=bool(emit_ast),
+        parse_cache_mb=float(yml.get("parse_cache_mb", 512)),
+        workers=int(yml.get("workers", 1)),
+        incremental=dict(yml.get("incremental") or {}),
 
         # expose YAML sections for downstream writers
         manifest_paths=mp,
@@ -40,7 +40,8 @@ from v2.backend.core.utils.code_bundles.code_bundles.execute.funcs import (
     read_root_publish_analysis,
     clear_dir_contents,
     discover_repo_paths,
-    copy_snapshot
+    copy_snapshot,
+    sync_snapshot,
 )
 from v2.backend.core.utils.code_bundles.code_bundles.execute.read_scanners import (
     augment_manifest
@@ -72,6 +73,11 @@ from v2.backend.core.utils.code_bundles.code_bundles.bundle_io import (
 )
 
 from v2.backend.core.utils.code_bundles.code_bundles.telemetry.runtime_flow import FlowLogger
+from v2.backend.core.utils.code_bundles.code_bundles.src.packager.core.incremental import (
+    FingerprintIndex,
+    install_index,
+    packager_salt,
+)
 from v2.backend.core.utils.code_bundles.code_bundles.src.packager.io.guide_writer import GuideWriter
 
 
@@ -158,9 +164,15 @@ def main() -> int:
     print(f"[packager] follow_symlinks: {cfg.follow_symlinks} case_insensitive: {cfg.case_insensitive}")
     print("[packager] Packager: start")
 
+    # Incremental mode keeps the code snapshot and a per-file fingerprint index between runs
+    inc_cfg = dict(getattr(cfg, "incremental", {}) or {})
+    incremental = bool(inc_cfg.get("enabled", False))
+    print(f"[packager] incremental: {incremental}")
+
     if do_local:
         clear_dir_contents(artifact_root)
-        clear_dir_contents(code_output_root)
+        if not incremental:
+            clear_dir_contents(code_output_root)
 
     with flow.phase("packager.run", step=10):
         result = Packager(cfg, rules=None).run(external_source=None)
@@ -179,10 +191,33 @@ def main() -> int:
         )
     print(f"[packager] discovered repo files: {len(discovered_repo)}")
 
+    index: Optional[FingerprintIndex] = None
+    dirty: set = set()
+    if incremental:
+        cache_dir = Path(str(inc_cfg.get("cache_dir") or "output/packager_cache"))
+        if not cache_dir.is_absolute():
+            cache_dir = repo_root / cache_dir
+        with flow.phase("incremental.refresh", step=25, files=len(discovered_repo)):
+            index = FingerprintIndex.load(
+                cache_dir / "fingerprints.json",
+                salt=packager_salt(emit_ast=bool(cfg.emit_ast), source_root=cfg.source_root),
+            )
+            delta = index.refresh(discovered_repo)
+        dirty = delta.dirty
+        install_index(index)
+        print(
+            f"[packager] incremental: {len(delta.added)} added, {len(delta.changed)} changed, "
+            f"{len(delta.removed)} removed, {delta.unchanged} unchanged"
+        )
+
     if do_local:
         with flow.phase("snapshot.local", step=30, files=len(discovered_repo)):
-            copied = copy_snapshot(discovered_repo, code_output_root)
-        print(f"[packager] Local snapshot: copied {copied} files to {code_output_root}")
+            if index is not None:
+                copied, removed = sync_snapshot(discovered_repo, code_output_root, dirty)
+                print(f"[packager] Local snapshot: copied {copied}, removed {removed} files in {code_output_root}")
+            else:
+                copied = copy_snapshot(discovered_repo, code_output_root)
+                print(f"[packager] Local snapshot: copied {copied} files to {code_output_root}")
 
     # LOCAL augment
     if do_local:
@@ -219,6 +254,10 @@ def main() -> int:
             )
         print(f"[packager] github memory publish: {rep}")
 
+    if index is not None:
+        index.save()
+        print(f"[packager] incremental: cache hits={index.stats['hits']} misses={index.stats['misses']}")
+
     # Chunking (after augmentation)
     if do_local:
         with flow.phase("chunk.local", step=50):
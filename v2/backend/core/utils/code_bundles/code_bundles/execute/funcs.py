@@ -1,14 +1,17 @@
 from __future__ import annotations
-import os
 import yaml
-import fnmatch
 import inspect
 from pathlib import Path
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, Iterable, List, Set, Tuple
 
 from v2.backend.core.utils.code_bundles.code_bundles.execute.loader import (
     ConfigPaths,
 )
+from v2.backend.core.utils.code_bundles.code_bundles.src.packager.core.discovery import (
+    compile_globs,
+    discover_pairs,
+    segment_set,
+)
 import v2.backend.core.utils.code_bundles.code_bundles.src.packager.core.orchestrator as orch_mod
 
 
@@ -16,21 +19,14 @@ import v2.backend.core.utils.code_bundles.code_bundles.src.packager.core.orchest
 # Discovery helpers
 # ──────────────────────────────────────────────────────────────────────────────
 def match_any(rel_posix: str, globs: List[str], case_insensitive: bool = False) -> bool:
-    if not globs:
-        return False
-    rp = rel_posix.casefold() if case_insensitive else rel_posix
-    for g in globs:
-        pat = g.replace("\\", "/")
-        pat = pat.casefold() if case_insensitive else pat
-        if fnmatch.fnmatch(rp, pat):
-            return True
-    return False
+    matcher = compile_globs(tuple(globs or ()), bool(case_insensitive))
+    return matcher is not None and matcher(rel_posix)
 
 
 def seg_excluded(parts: Tuple[str, ...], segment_excludes: List[str], case_insensitive: bool = False) -> bool:
     if not segment_excludes:
         return False
-    segs = set((s.casefold() if case_insensitive else s) for s in segment_excludes)
+    segs = segment_set(tuple(segment_excludes), bool(case_insensitive))
     for seg in parts[:-1]:
         s = seg.casefold() if case_insensitive else seg
         if s in segs:
@@ -67,6 +63,51 @@ def copy_snapshot(items: List[Tuple[Path, str]], dest_root: Path) -> int:
             print(f"[packager] WARN: copy failed {rel}: {type(e).__name__}: {e}")
     return count
 
+
+def sync_snapshot(items: List[Tuple[Path, str]], dest_root: Path, dirty: Iterable[str]) -> Tuple[int, int]:
+    """
+    Incremental copy_snapshot: copy only files in `dirty` (or missing / different
+    size at the destination) and delete destination files that are no longer
+    discovered, leaving dest_root as clear_dir_contents + copy_snapshot would.
+    Returns (copied, removed).
+    """
+    dest_root = Path(dest_root)
+    dest_root.mkdir(parents=True, exist_ok=True)
+    dirty_set: Set[str] = set(dirty)
+    wanted: Set[str] = set()
+    copied = 0
+    for local, rel in items:
+        wanted.add(rel)
+        dst = dest_root / rel
+        if rel not in dirty_set:
+            try:
+                if dst.stat().st_size == local.stat().st_size:
+                    continue
+            except OSError:
+                pass
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            dst.write_bytes(local.read_bytes())
+            copied += 1
+        except Exception as e:
+            print(f"[packager] WARN: copy failed {rel}: {type(e).__name__}: {e}")
+
+    removed = 0
+    for p in sorted(dest_root.rglob("*"), reverse=True):
+        try:
+            if p.is_file() or p.is_symlink():
+                if p.relative_to(dest_root).as_posix() not in wanted:
+                    p.unlink()
+                    removed += 1
+            elif p.is_dir():
+                try:
+                    p.rmdir()  # only succeeds when empty
+                except OSError:
+                    pass
+        except Exception:
+            pass
+    return copied, removed
+
 # ──────────────────────────────────────────────────────────────────────────────
 # Delta pruning (code + artifacts)
 # ──────────────────────────────────────────────────────────────────────────────
@@ -118,32 +159,21 @@ def discover_repo_paths(
     case_insensitive: bool = False,
     follow_symlinks: bool = False,
 ) -> List[Tuple[Path, str]]:
-    out: List[Tuple[Path, str]] = []
-    for cur, dirs, files in os.walk(src_root, followlinks=follow_symlinks):
-        pruned_dirs = []
-        for d in dirs:
-            try:
-                parts = (Path(cur) / d).relative_to(src_root).parts
-            except Exception:
-                pruned_dirs.append(d)
-                continue
-            if seg_excluded(parts, segment_excludes, case_insensitive):
-                continue
-            pruned_dirs.append(d)
-        dirs[:] = pruned_dirs
-
-        for fn in sorted(files):
-            p = Path(cur) / fn
-            if not p.is_file():
-                continue
-            rel_posix = p.relative_to(src_root).as_posix()
-            if include_globs and not match_any(rel_posix, include_globs, case_insensitive):
-                continue
-            if exclude_globs and match_any(rel_posix, exclude_globs, case_insensitive):
-                continue
-            out.append((p, rel_posix))
-    out.sort(key=lambda t: t[1])
-    return out
+    """
+    (absolute path, repo-relative POSIX path) for every file under src_root that
+    passes the segment excludes and globs, sorted by relative path. Single walk
+    via DiscoveryEngine with the globs compiled once (junk files are kept, as
+    this walk always has).
+    """
+    return discover_pairs(
+        Path(src_root),
+        include_globs=include_globs or (),
+        exclude_globs=exclude_globs or (),
+        segment_excludes=segment_excludes or (),
+        case_insensitive=case_insensitive,
+        follow_symlinks=follow_symlinks,
+        skip_junk=False,
+    )
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -44,6 +44,8 @@ DEFAULTS = NS(
     long_timeout=60,
     throttle_every=50,
     sleep_secs=0.25,
+    publish_api='tree',
+    upload_workers=8,
     raw_base='https://raw.githubusercontent.com',
 )
 
@@ -209,6 +211,9 @@ def publish_to_github(
     api_base = str(_cfg_get(getattr(cfg.publish, 'github', {}), 'api_base', DEFAULTS.api_base))
     timeout_s = int(_cfg_get(getattr(cfg.publish, 'github', {}), 'timeout', DEFAULTS.timeout))
     user_agent = str(_cfg_get(getattr(cfg.publish, 'github', {}), 'user_agent', DEFAULTS.user_agent))
+    publish_api = str(_cfg_get(getattr(cfg.publish, 'github', {}), 'publish_api', DEFAULTS.publish_api)).lower()
+    upload_workers = int(_cfg_get(getattr(cfg.publish, 'github', {}), 'upload_workers', DEFAULTS.upload_workers))
+    long_timeout = int(_cfg_get(getattr(cfg.publish, 'github', {}), 'long_timeout', DEFAULTS.long_timeout))
 
     # Apply base_path for CODE
     base_prefix = (base_path or "").strip().strip("/")
@@ -221,7 +226,7 @@ def publish_to_github(
         code_payload = code_items_repo_rel
 
     target = GitHubTarget(owner=gh.owner, repo=gh.repo, branch=gh.branch, base_path="")
-    pub = GitHubPublisher(target=target, token=token)
+    pub = GitHubPublisher(target=target, token=token, api_base=api_base)
 
     # Optional artifacts clean (design_manifest subtree only)
     if bool(getattr(cfg.publish, "clean_before_publish", False)):
@@ -235,7 +240,8 @@ def publish_to_github(
 
     # Code files
     print(f"[packager] Publish(GitHub): code files: {len(code_payload)} to base_path='{base_prefix or '/'}'")
-    pub.publish_many_files(code_payload, message="publish: code snapshot", throttle_every=throttle_n, sleep_secs=throttle_slp)
+    if publish_api != "tree":
+        pub.publish_many_files(code_payload, message="publish: code snapshot", throttle_every=throttle_n, sleep_secs=throttle_slp)
 
     # Artifacts (always under repo-root/{dest_dir})
     art_dir = Path(cfg.out_bundle).parent
@@ -274,6 +280,21 @@ def publish_to_github(
         else:
             print("[packager] Publish(GitHub): analysis/ not present (skipping)")
 
+    if publish_api == "tree":
+        # Code + artifacts: only changed blobs uploaded, one commit for everything
+        print(f"[packager] Publish(GitHub): artifacts: {len(candidates)}")
+        rep = pub.publish_tree(
+            list(code_payload) + candidates,
+            message="publish: code snapshot + design manifest",
+            workers=upload_workers,
+            timeout=long_timeout,
+        )
+        print(
+            f"[packager] Publish(GitHub): {rep.changed}/{rep.files} files changed, "
+            f"{rep.uploaded} blobs uploaded, commit={rep.commit or '-'} ({rep.secs:.2f}s)"
+        )
+        return
+
     if not candidates:
         print("[packager] Publish(GitHub): nothing to publish in artifacts")
         return
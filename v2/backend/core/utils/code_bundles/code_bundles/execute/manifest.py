@@ -59,14 +59,14 @@ def append_parts_artifacts_into_manifest(
     part_ext: str,
     parts_index_name: str,
 ) -> int:
-    app = ManifestAppender(manifest_path)
-    count = emit_transport_parts(
-        appender=app,
-        parts_dir=parts_dir,
-        part_stem=part_stem,
-        part_ext=part_ext,
-        parts_index_name=parts_index_name,
-    )
+    with ManifestAppender(manifest_path) as app:
+        count = emit_transport_parts(
+            appender=app,
+            parts_dir=parts_dir,
+            part_stem=part_stem,
+            part_ext=part_ext,
+            parts_index_name=parts_index_name,
+        )
     return count
 
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import inspect
 import json
 import time
@@ -80,6 +81,20 @@ from v2.backend.core.utils.code_bundles.code_bundles.src.packager.core.record_ad
     Producer,
     load_wrapper_policy,
 )
+from v2.backend.core.utils.code_bundles.code_bundles.src.packager.core.parsed_modules import (
+    ParsedModuleStore,
+    active_store,
+    use_store,
+)
+from v2.backend.core.utils.code_bundles.code_bundles.src.packager.core.incremental import (
+    active_index,
+    cached_records,
+)
+from v2.backend.core.utils.code_bundles.code_bundles.execute.scanner_pool import (
+    ScannerTask,
+    resolve_workers,
+    run_scanners,
+)
 
 
 # --- Memory-only appender for GitHub flavor ---
@@ -135,6 +150,127 @@ def append_records(
     return n
 
 
+def _parse_budget_bytes(cfg: NS) -> int:
+    return int(float(getattr(cfg, "parse_cache_mb", 512) or 0) * 1024 * 1024)
+
+
+def _parse_once(fn):
+    """
+    Run an augment pass with a fresh parsed-module store active, so every Python
+    scanner shares one read + ast.parse per file. The store is dropped on return.
+    """
+    @functools.wraps(fn)
+    def wrapper(*, cfg: NS, **kwargs):
+        with use_store(ParsedModuleStore(budget_bytes=_parse_budget_bytes(cfg))):
+            return fn(cfg=cfg, **kwargs)
+    return wrapper
+
+
+def _parse_summary(counts: Dict[str, int], durations_ms: Dict[str, int]) -> None:
+    """Add the parsed-module store's counters to the bundle_summary buckets."""
+    store = active_store()
+    if store is None:
+        return
+    st = store.stats
+    # requests = parses the scanners would have done on their own; parses = actual
+    counts["parse.requests"] = int(st["requests"])
+    counts["parse.parses"] = int(st["parses"])
+    counts["parse.over_budget"] = int(st["over_budget"])
+    durations_ms["parse_ms"] = int(store.parse_secs * 1000)
+    print(
+        f"[packager] parsed-module store: {st['parses']} parses for {st['requests']} requests "
+        f"({st['over_budget']} over budget), parse={store.parse_secs:.2f}s"
+    )
+
+
+def _index_python_file(root: Path, local: Path, rel: str, want_ast: bool) -> Any:
+    try:
+        # Preferred signature (keyword-only)
+        return index_python_file(
+            repo_root=root,
+            local_path=local,
+            repo_rel_posix=rel,
+            emit_ast=want_ast,
+        )
+    except TypeError:
+        # Fallback: same without 'emit_ast'
+        try:
+            return index_python_file(
+                repo_root=root,
+                local_path=local,
+                repo_rel_posix=rel,
+            )
+        except TypeError:
+            # Legacy positional signature
+            return index_python_file(repo_root=root, local_path=local, repo_rel_posix=rel)
+
+
+def _incremental_summary(counts: Dict[str, int]) -> None:
+    """Add the fingerprint index's cache counters to the bundle_summary counts."""
+    index = active_index()
+    if index is None:
+        return
+    counts["incremental.files"] = int(index.stats["files"])
+    counts["incremental.hits"] = int(index.stats["hits"])
+    counts["incremental.misses"] = int(index.stats["misses"])
+
+
+def _scan_deps(repo_root: Path, _repo: List[Tuple[Path, str]], cfg: NS) -> List[Dict[str, Any]]:
+    return scan_dependencies(repo_root=repo_root, cfg=cfg)
+
+
+def _wired_scanner_tasks(cfg: NS, root: Path, discovered_repo: List[Tuple[Path, str]]) -> List[ScannerTask]:
+    """Wired scanners in manifest order: (summary key, log name, scanner, args)."""
+    repo = (root, discovered_repo)
+    return [
+        ScannerTask("doc_coverage", "doc_coverage", scan_doc_coverage, repo),
+        ScannerTask("complexity", "complexity", scan_complexity, repo),
+        ScannerTask("owners", "owners_index", scan_owners, repo),
+        ScannerTask("env", "env_index", scan_env, repo),
+        ScannerTask("entrypoints", "entrypoints", scan_entrypoints, repo),
+        ScannerTask("html", "html_index", scan_html, repo),
+        ScannerTask("sql", "sql_index", scan_sql, repo),
+        ScannerTask("js_ts", "js_ts_index", scan_js_ts, repo),
+        ScannerTask("deps", "deps", _scan_deps, repo + (cfg,)),
+        ScannerTask("static_check", "static_check", static_check_scan, repo),
+        ScannerTask("git", "git_info", scan_git, repo),
+        ScannerTask("license", "license_scan", scan_license, repo),
+        ScannerTask("secrets", "secrets_scan", scan_secrets, repo),
+        ScannerTask("assets", "assets_index", scan_assets, repo),
+    ]
+
+
+def _run_wired_scanners(
+    cfg: NS,
+    discovered_repo: List[Tuple[Path, str]],
+    append: Callable[[Callable[..., Any], List[Dict[str, Any]]], int],
+) -> Tuple[Dict[str, int], Dict[str, int]]:
+    """
+    Run the wired scanners (across a process pool when cfg.workers > 1) and hand
+    each one's records to `append` in wired order, so the manifest does not
+    depend on which scanner finishes first. Returns (counts, durations_ms).
+    """
+    tasks = _wired_scanner_tasks(cfg, Path(cfg.source_root), discovered_repo)
+    workers = resolve_workers(getattr(cfg, "workers", 1))
+    t0 = time.perf_counter()
+    results = run_scanners(tasks, workers=workers, parse_budget_bytes=_parse_budget_bytes(cfg))
+    wall = time.perf_counter() - t0
+
+    counts: Dict[str, int] = {}
+    durations: Dict[str, int] = {}
+    for task, res in zip(tasks, results):
+        if res.error is not None:
+            print(f"[packager] WARN: scanner '{task.name}' failed: {res.error}")
+            counts[task.key] = 0
+        else:
+            counts[task.key] = append(task.fn, res.records)
+        durations[f"scan.{task.key}_ms"] = int(res.secs * 1000)
+    durations["scanners_ms"] = int(wall * 1000)
+    print(f"[packager] wired scanners: {len(tasks)} in {wall:.2f}s (workers={workers})")
+    return counts, durations
+
+
+@_parse_once
 def augment_manifest(
     *,
     cfg: NS,
@@ -196,24 +332,10 @@ def augment_manifest(
 
         want_ast = bool(getattr(cfg, "emit_ast", False))
         try:
-            # Preferred signature (keyword-only)
-            res = index_python_file(
-                repo_root=Path(cfg.source_root),
-                local_path=local,
-                repo_rel_posix=rel,
-                emit_ast=want_ast,
+            # Unchanged files (incremental runs) come back from the fingerprint index
+            res = cached_records(
+                "python_index", rel, lambda: _index_python_file(Path(cfg.source_root), local, rel, want_ast)
             )
-        except TypeError:
-            # Fallback: same without 'emit_ast'
-            try:
-                res = index_python_file(
-                    repo_root=Path(cfg.source_root),
-                    local_path=local,
-                    repo_rel_posix=rel,
-                )
-            except TypeError:
-                # Legacy positional signature
-                res = index_python_file(repo_root=Path(cfg.source_root), local_path=local, repo_rel_posix=rel)
         except Exception as e:
             print(f"[packager] WARN: python_index failed for {rel}: {type(e).__name__}: {e}")
             continue
@@ -222,7 +344,7 @@ def augment_manifest(
         edges: List[Dict[str, Any]] = []
         extras: Optional[Any] = None
 
-        if isinstance(res, tuple) and len(res) >= 2:
+        if isinstance(res, (tuple, list)) and len(res) >= 2:
             mod_rec, edges = res[:2]
             if want_ast and len(res) >= 3:
                 extras = res[2]
@@ -274,7 +396,7 @@ def augment_manifest(
     for local, rel in discovered_repo:
         if not rel.endswith(".py"):
             continue
-        qrec = quality_for_python(path=local, repo_rel_posix=rel)
+        qrec = cached_records("quality", rel, lambda: quality_for_python(path=local, repo_rel_posix=rel))
         quality_count += append_records(
             app, [qrec], map_path, _producer_from_callable(quality_for_python), run_ts, policy
         )
@@ -288,33 +410,11 @@ def augment_manifest(
     t3 = time.perf_counter()
 
     # Run wired scanners (all routed through the wrapper)
-    def run_scanner(name: str, fn, *args, **kwargs):
-        try:
-            records = fn(*args, **kwargs) or []
-        except Exception as e:
-            print(f"[packager] WARN: scanner '{name}' failed: {type(e).__name__}: {e}")
-            return 0
-        return append_records(app, records, map_path, _producer_from_callable(fn), run_ts, policy)
-
-    wired_counts: Dict[str, int] = {}
-    root = Path(cfg.source_root)
-
-    wired_counts["doc_coverage"] = run_scanner("doc_coverage", scan_doc_coverage, root, discovered_repo)
-    wired_counts["complexity"] = run_scanner("complexity", scan_complexity, root, discovered_repo)
-    wired_counts["owners"] = run_scanner("owners_index", scan_owners, root, discovered_repo)
-    wired_counts["env"] = run_scanner("env_index", scan_env, root, discovered_repo)
-    wired_counts["entrypoints"] = run_scanner("entrypoints", scan_entrypoints, root, discovered_repo)
-    wired_counts["html"] = run_scanner("html_index", scan_html, root, discovered_repo)
-    wired_counts["sql"] = run_scanner("sql_index", scan_sql, root, discovered_repo)
-    wired_counts["js_ts"] = run_scanner("js_ts_index", scan_js_ts, root, discovered_repo)
-    wired_counts["deps"] = run_scanner(
-        "deps", lambda repo_root, _repo: scan_dependencies(repo_root=repo_root, cfg=cfg), root, discovered_repo
+    wired_counts, scan_durations = _run_wired_scanners(
+        cfg,
+        discovered_repo,
+        lambda fn, records: append_records(app, records, map_path, _producer_from_callable(fn), run_ts, policy),
     )
-    wired_counts["static_check"] = run_scanner("static_check", static_check_scan, root, discovered_repo)
-    wired_counts["git"] = run_scanner("git_info", scan_git, root, discovered_repo)
-    wired_counts["license"] = run_scanner("license_scan", scan_license, root, discovered_repo)
-    wired_counts["secrets"] = run_scanner("secrets_scan", scan_secrets, root, discovered_repo)
-    wired_counts["assets"] = run_scanner("assets_index", scan_assets, root, discovered_repo)
 
     # Final summary (record_type=bundle_summary) — intentionally not wrapped
     counts_base = {
@@ -334,13 +434,18 @@ def augment_manifest(
             }
         )
 
+    durations_base = {
+        "index_ms": int((t1 - t0) * 1000),
+        "quality_ms": int((t2 - t1) * 1000),
+        "graph_ms": int((t3 - t2) * 1000),
+        **scan_durations,
+    }
+    _parse_summary(counts_base, durations_base)
+    _incremental_summary(counts_base)
+
     summary = build_bundle_summary(
         counts=counts_base,
-        durations_ms={
-            "index_ms": int((t1 - t0) * 1000),
-            "quality_ms": int((t2 - t1) * 1000),
-            "graph_ms": int((t3 - t2) * 1000),
-        },
+        durations_ms=durations_base,
     )
     if isinstance(summary, dict):
         app.append_record(summary)
@@ -361,6 +466,7 @@ def augment_manifest(
         part_ext=str(cfg.transport.part_ext),
         parts_index_name=str(cfg.transport.parts_index_name),
     )
+    app.close()
 
     write_sha256sums_for_parts(
         parts_dir=Path(cfg.out_bundle).parent,
@@ -371,6 +477,7 @@ def augment_manifest(
     )
 
 
+@_parse_once
 def augment_manifest_memory(
     *,
     cfg: NS,
@@ -432,22 +539,9 @@ def augment_manifest_memory(
 
         want_ast = bool(getattr(cfg, "emit_ast", False))
         try:
-            # Preferred signature (keyword-only)
-            res = index_python_file(
-                repo_root=Path(cfg.source_root),
-                local_path=local,
-                repo_rel_posix=rel,
-                emit_ast=want_ast,
+            res = cached_records(
+                "python_index", rel, lambda: _index_python_file(Path(cfg.source_root), local, rel, want_ast)
             )
-        except TypeError:
-            try:
-                res = index_python_file(
-                    repo_root=Path(cfg.source_root),
-                    local_path=local,
-                    repo_rel_posix=rel,
-                )
-            except TypeError:
-                res = index_python_file(repo_root=Path(cfg.source_root), local_path=local, repo_rel_posix=rel)
         except Exception as e:
             print(f"[packager] WARN: python_index failed for {rel}: {type(e).__name__}: {e}")
             continue
@@ -456,7 +550,7 @@ def augment_manifest_memory(
         edges: List[Dict[str, Any]] = []
         extras: Optional[Any] = None
 
-        if isinstance(res, tuple) and len(res) >= 2:
+        if isinstance(res, (tuple, list)) and len(res) >= 2:
             mod_rec, edges = res[:2]
             if want_ast and len(res) >= 3:
                 extras = res[2]
@@ -507,7 +601,7 @@ def augment_manifest_memory(
     for local, rel in discovered_repo:
         if not rel.endswith(".py"):
             continue
-        qrec = quality_for_python(path=local, repo_rel_posix=rel)
+        qrec = cached_records("quality", rel, lambda: quality_for_python(path=local, repo_rel_posix=rel))
         quality_count += append_records(
             app, [qrec], map_path, _producer_from_callable(quality_for_python), run_ts, policy
         )
@@ -519,33 +613,11 @@ def augment_manifest_memory(
 
     t3 = time.perf_counter()
 
-    def run_scanner(name: str, fn, *args, **kwargs):
-        try:
-            records = fn(*args, **kwargs) or []
-        except Exception as e:
-            print(f"[packager] WARN: scanner '{name}' failed: {type(e).__name__}: {e}")
-            return 0
-        return append_records(app, records, map_path, _producer_from_callable(fn), run_ts, policy)
-
-    wired_counts: Dict[str, int] = {}
-    root = Path(cfg.source_root)
-
-    wired_counts["doc_coverage"] = run_scanner("doc_coverage", scan_doc_coverage, root, discovered_repo)
-    wired_counts["complexity"] = run_scanner("complexity", scan_complexity, root, discovered_repo)
-    wired_counts["owners"] = run_scanner("owners_index", scan_owners, root, discovered_repo)
-    wired_counts["env"] = run_scanner("env_index", scan_env, root, discovered_repo)
-    wired_counts["entrypoints"] = run_scanner("entrypoints", scan_entrypoints, root, discovered_repo)
-    wired_counts["html"] = run_scanner("html_index", scan_html, root, discovered_repo)
-    wired_counts["sql"] = run_scanner("sql_index", scan_sql, root, discovered_repo)
-    wired_counts["js_ts"] = run_scanner("js_ts_index", scan_js_ts, root, discovered_repo)
-    wired_counts["deps"] = run_scanner(
-        "deps", lambda repo_root, _repo: scan_dependencies(repo_root=repo_root, cfg=cfg), root, discovered_repo
+    wired_counts, scan_durations = _run_wired_scanners(
+        cfg,
+        discovered_repo,
+        lambda fn, records: append_records(app, records, map_path, _producer_from_callable(fn), run_ts, policy),
     )
-    wired_counts["static_check"] = run_scanner("static_check", static_check_scan, root, discovered_repo)
-    wired_counts["git"] = run_scanner("git_info", scan_git, root, discovered_repo)
-    wired_counts["license"] = run_scanner("license_scan", scan_license, root, discovered_repo)
-    wired_counts["secrets"] = run_scanner("secrets_scan", scan_secrets, root, discovered_repo)
-    wired_counts["assets"] = run_scanner("assets_index", scan_assets, root, discovered_repo)
 
     counts_base = {
         "modules": int(module_count),
@@ -564,13 +636,18 @@ def augment_manifest_memory(
             }
         )
 
+    durations_base = {
+        "index_ms": int((t1 - t0) * 1000),
+        "quality_ms": int((t2 - t1) * 1000),
+        "graph_ms": int((t3 - t2) * 1000),
+        **scan_durations,
+    }
+    _parse_summary(counts_base, durations_base)
+    _incremental_summary(counts_base)
+
     summary = build_bundle_summary(
         counts=counts_base,
-        durations_ms={
-            "index_ms": int((t1 - t0) * 1000),
-            "quality_ms": int((t2 - t1) * 1000),
-            "graph_ms": int((t3 - t2) * 1000),
-        },
+        durations_ms=durations_base,
     )
     if isinstance(summary, dict):
         app.append_record(summary)
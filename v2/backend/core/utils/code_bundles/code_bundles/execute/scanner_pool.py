@@ -0,0 +1,170 @@
+"""
+Parallel executor for the wired packager scanners.
+
+Each wired scanner (doc_coverage, complexity, owners, env, ...) walks the whole
+discovered repo and ends with one aggregate `*.summary` record, so the unit of
+work is one scanner over the full file list: the scanners run side by side in a
+process pool and their records are merged back in task order, which keeps the
+manifest byte-for-byte identical to a sequential run.
+
+Public entry points:
+  - ScannerTask(key, name, fn, args, kwargs)
+  - resolve_workers(value) -> int
+  - run_scanners(tasks, workers=..., parse_budget_bytes=...) -> List[ScannerResult]
+
+Notes:
+- workers <= 1 runs the tasks in-process, one after another (previous behaviour).
+- Workers reuse the parent's parsed-module store when forked; otherwise each
+  worker gets its own store so Python scanners sharing a worker parse once.
+- Per-file records a worker computes for the incremental fingerprint index
+  (if one is active) are shipped back and merged into the parent's index.
+- A scanner that raises yields an empty result with `error` set; a pool that
+  cannot start (or breaks) falls back to the sequential path.
+"""
+
+from __future__ import annotations
+
+import os
+import pickle
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from v2.backend.core.utils.code_bundles.code_bundles.src.packager.core.incremental import active_index
+from v2.backend.core.utils.code_bundles.code_bundles.src.packager.core.parsed_modules import (
+    ParsedModuleStore,
+    active_store,
+    install_store,
+)
+
+
+@dataclass
+class ScannerTask:
+    key: str                      # bundle_summary counter key, e.g. "doc_coverage"
+    name: str                     # name used in log lines, e.g. "owners_index"
+    fn: Callable[..., Any]        # module-level callable (must be picklable)
+    args: Tuple[Any, ...] = ()
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class ScannerResult:
+    key: str
+    name: str
+    records: List[Dict[str, Any]]
+    error: Optional[str] = None
+    secs: float = 0.0
+    parse_requests: int = 0
+    parses: int = 0
+    parse_secs: float = 0.0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    cache_updates: Dict[str, Dict[str, str]] = field(default_factory=dict)
+
+
+def _usable_cpus() -> int:
+    try:
+        return len(os.sched_getaffinity(0)) or 1  # type: ignore[attr-defined]
+    except (AttributeError, OSError):
+        return os.cpu_count() or 1
+
+
+def resolve_workers(value: Any) -> int:
+    """`workers` setting → process count (0/None = one per usable CPU; never more than that)."""
+    cpus = _usable_cpus()
+    try:
+        n = int(value) if value is not None else 0
+    except (TypeError, ValueError):
+        n = 1
+    if n <= 0:
+        n = cpus
+    return max(1, min(n, cpus))
+
+
+_IN_WORKER = False
+
+
+def _init_worker(parse_budget_bytes: int) -> None:
+    global _IN_WORKER
+    _IN_WORKER = True
+    if active_store() is None:
+        install_store(ParsedModuleStore(budget_bytes=parse_budget_bytes))
+    index = active_index()
+    if index is not None:
+        index.take_fresh()  # inherited from the parent on fork; only ship back our own
+
+
+def _parse_counters() -> Tuple[int, int, float]:
+    store = active_store()
+    if store is None:
+        return 0, 0, 0.0
+    return store.stats["requests"], store.stats["parses"], store.parse_secs
+
+
+def _run_task(task: ScannerTask) -> ScannerResult:
+    req0, parses0, psecs0 = _parse_counters()
+    index = active_index()
+    hits0, misses0 = (index.stats["hits"], index.stats["misses"]) if index else (0, 0)
+    t0 = time.perf_counter()
+    try:
+        records = list(task.fn(*task.args, **task.kwargs) or [])
+        error = None
+    except Exception as e:
+        records, error = [], f"{type(e).__name__}: {e}"
+    secs = time.perf_counter() - t0
+    req1, parses1, psecs1 = _parse_counters()
+    result = ScannerResult(
+        key=task.key,
+        name=task.name,
+        records=records,
+        error=error,
+        secs=secs,
+        parse_requests=req1 - req0,
+        parses=parses1 - parses0,
+        parse_secs=psecs1 - psecs0,
+    )
+    if _IN_WORKER and index is not None:
+        result.cache_hits = index.stats["hits"] - hits0
+        result.cache_misses = index.stats["misses"] - misses0
+        result.cache_updates = index.take_fresh()
+    return result
+
+
+def run_scanners(
+    tasks: Sequence[ScannerTask],
+    *,
+    workers: int = 1,
+    parse_budget_bytes: int = 512 * 1024 * 1024,
+) -> List[ScannerResult]:
+    """Run `tasks` and return their results in task order."""
+    tasks = list(tasks)
+    if workers <= 1 or len(tasks) <= 1:
+        return [_run_task(t) for t in tasks]
+
+    try:
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(tasks)),
+            initializer=_init_worker,
+            initargs=(int(parse_budget_bytes),),
+        ) as ex:
+            futures = [ex.submit(_run_task, t) for t in tasks]
+            results = [f.result() for f in futures]
+    except (BrokenProcessPool, OSError, pickle.PicklingError) as e:
+        print(f"[packager] WARN: scanner pool unavailable ({type(e).__name__}: {e}); running sequentially")
+        return [_run_task(t) for t in tasks]
+
+    # Parses done in workers count against the parent's store totals.
+    store = active_store()
+    if store is not None:
+        store.stats["requests"] += sum(r.parse_requests for r in results)
+        store.stats["parses"] += sum(r.parses for r in results)
+        store.parse_secs += sum(r.parse_secs for r in results)
+    index = active_index()
+    if index is not None:
+        for r in results:
+            index.stats["hits"] += r.cache_hits
+            index.stats["misses"] += r.cache_misses
+            index.merge_fresh(r.cache_updates)
+    return results
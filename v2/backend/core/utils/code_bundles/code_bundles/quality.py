@@ -22,6 +22,7 @@ from typing import Any, Dict, List, Optional, Tuple
 from v2.backend.core.utils.code_bundles.code_bundles.contracts import (
     build_quality_metric,
 )
+from v2.backend.core.utils.code_bundles.code_bundles.src.packager.core.parsed_modules import load_module
 
 
 def _text_loc_sloc(text: str) -> Tuple[int, int]:
@@ -89,12 +90,13 @@ def quality_for_python(*, path: Path, repo_rel_posix: str) -> Dict[str, Any]:
     text: Optional[str] = None
     notes: List[str] = []
 
-    try:
-        text = path.read_text(encoding="utf-8")
-    except UnicodeDecodeError:
-        notes.append("decode_error")
-    except Exception:
+    parsed = load_module(path, repo_rel_posix)
+    if parsed.read_error is not None:
         notes.append("read_error")
+    elif not parsed.utf8_ok:
+        notes.append("decode_error")
+    else:
+        text = parsed.text
 
     if text is None:
         # Cannot read; return minimal
@@ -113,7 +115,9 @@ def quality_for_python(*, path: Path, repo_rel_posix: str) -> Dict[str, Any]:
     loc, sloc = _text_loc_sloc(text)
 
     try:
-        mod = ast.parse(text, filename=repo_rel_posix)
+        mod = parsed.tree
+        if mod is None:
+            raise parsed.syntax_error or SyntaxError(repo_rel_posix)
         cyclo = _cyclomatic_complexity(mod)
         n_functions = 0
         n_classes = 0
@@ -2,10 +2,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Tuple, List
+from typing import Callable, FrozenSet, Iterable, List, Optional, Tuple
 import os
 import fnmatch
+import re
 
 # Files we always ignore
 _JUNK = {"Thumbs.db", ".DS_Store"}
@@ -21,6 +23,28 @@ def _norm_glob(pattern: str) -> str:
     return pattern.replace("\\", "/")
 
 
+@lru_cache(maxsize=256)
+def compile_globs(patterns: Tuple[str, ...], ci: bool = False) -> Optional[Callable[[str], bool]]:
+    """
+    Compile `patterns` into one matcher: a single alternation regex built from
+    fnmatch.translate, so a path is tested once instead of once per pattern.
+    Same semantics as any(_match_glob(p, g, ci) for g in patterns).
+    Returns None for an empty pattern list.
+    """
+    if not patterns:
+        return None
+    parts = []
+    for g in patterns:
+        pat = _cf(_norm_glob(g), ci)
+        parts.append(fnmatch.translate(os.path.normcase(pat)))
+    rx = re.compile("|".join(parts))
+    match = rx.match
+    normcase = os.path.normcase
+    if ci:
+        return lambda rel_posix: match(normcase(rel_posix.casefold())) is not None
+    return lambda rel_posix: match(normcase(rel_posix)) is not None
+
+
 def _match_glob(rel_posix: str, pattern: str, ci: bool) -> bool:
     """
     Cross-platform glob match:
@@ -33,6 +57,12 @@ def _match_glob(rel_posix: str, pattern: str, ci: bool) -> bool:
     return fnmatch.fnmatch(rel_posix, pat)
 
 
+@lru_cache(maxsize=256)
+def segment_set(segment_excludes: Tuple[str, ...], ci: bool = False) -> FrozenSet[str]:
+    """Case-folded (if ci) set of excluded directory segments, built once per config."""
+    return frozenset(_cf(x, ci) for x in segment_excludes)
+
+
 @dataclass(frozen=True)
 class DiscoveryConfig:
     root: Path
@@ -41,6 +71,7 @@ class DiscoveryConfig:
     exclude_globs: Tuple[str, ...]
     case_insensitive: bool = False
     follow_symlinks: bool = False
+    skip_junk: bool = True
 
 
 class DiscoveryEngine:
@@ -48,6 +79,10 @@ class DiscoveryEngine:
 
     def __init__(self, cfg: DiscoveryConfig) -> None:
         self.cfg = cfg
+        ci = cfg.case_insensitive
+        self._segs = segment_set(tuple(cfg.segment_excludes), ci)
+        self._include = compile_globs(tuple(cfg.include_globs), ci)
+        self._exclude = compile_globs(tuple(cfg.exclude_globs), ci)
 
     def _seg_excluded(self, rel_parts: Tuple[str, ...]) -> bool:
         """
@@ -56,56 +91,102 @@ class DiscoveryEngine:
         NOTE: No allow-list exceptions. If a segment (like 'output') is present
         in `segment_excludes`, *any* path containing that segment is excluded.
         """
-        excluded = set(_cf(x, self.cfg.case_insensitive) for x in self.cfg.segment_excludes)
+        ci = self.cfg.case_insensitive
         for seg in rel_parts[:-1]:  # exclude the filename itself
-            if _cf(seg, self.cfg.case_insensitive) in excluded:
+            if _cf(seg, ci) in self._segs:
                 return True
         return False
 
-    def discover(self) -> List[Path]:
+    def _wanted(self, rel_posix: str) -> bool:
+        # include_globs: if set, require a match; exclude_globs: skip if any match
+        if self._include is not None and not self._include(rel_posix):
+            return False
+        if self._exclude is not None and self._exclude(rel_posix):
+            return False
+        return True
+
+    def discover_pairs(self) -> List[Tuple[Path, str]]:
+        """
+        Walk once and return (absolute path, repo-relative POSIX path) pairs,
+        sorted by the relative path.
+
+        Walks with os.scandir so file/dir checks use the directory entry type
+        (no extra stat per file). Pruning matches the os.walk-based walk this
+        replaces: a directory is pruned when any segment *above* it is excluded
+        (`_seg_excluded` drops the last part), so files directly inside an
+        excluded directory are still listed.
+        """
         root = self.cfg.root
         if not root.exists():
             raise FileNotFoundError(root)
 
-        out: List[Path] = []
-
-        for cur, dirs, files in os.walk(root, followlinks=self.cfg.follow_symlinks):
-            # Deterministic order
-            dirs.sort()
-            files.sort()
-
-            # Prune directories by segment excludes
-            pruned: List[str] = []
-            for d in dirs:
-                rel_parts = (Path(cur) / d).relative_to(root).parts
-                if self._seg_excluded(rel_parts):
-                    continue
-                pruned.append(d)
-            dirs[:] = pruned
-
-            # Files
-            for fn in files:
-                if fn in _JUNK:
+        ci = self.cfg.case_insensitive
+        segs = self._segs
+        follow = self.cfg.follow_symlinks
+        skip_junk = self.cfg.skip_junk
+        wanted = self._wanted
+        out: List[Tuple[Path, str]] = []
+
+        # stack entries: (abs dir, rel prefix ("" or "a/b/"), any segment of this dir excluded)
+        stack: List[Tuple[str, str, bool]] = [(str(root), "", False)]
+        while stack:
+            cur, prefix, cur_excluded = stack.pop()
+            try:
+                with os.scandir(cur) as it:
+                    entries = sorted(it, key=lambda e: e.name)
+            except OSError:
+                continue
+            subdirs: List[Tuple[str, str, bool]] = []
+            for e in entries:
+                try:
+                    is_dir = e.is_dir()
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    if cur_excluded:
+                        continue
+                    if not follow and e.is_symlink():
+                        continue
+                    subdirs.append((e.path, prefix + e.name + "/", _cf(e.name, ci) in segs))
                     continue
-                p = Path(cur) / fn
-                rel_posix = p.relative_to(root).as_posix()
-
-                # include_globs: if set, require a match
-                if self.cfg.include_globs and not any(
-                    _match_glob(rel_posix, g, self.cfg.case_insensitive) for g in self.cfg.include_globs
-                ):
+                if skip_junk and e.name in _JUNK:
                     continue
-
-                # exclude_globs: skip if any match
-                if self.cfg.exclude_globs and any(
-                    _match_glob(rel_posix, g, self.cfg.case_insensitive) for g in self.cfg.exclude_globs
-                ):
+                try:
+                    if not e.is_file():
+                        continue
+                except OSError:
                     continue
-
-                out.append(p)
+                rel_posix = prefix + e.name
+                if wanted(rel_posix):
+                    out.append((Path(e.path), rel_posix))
+            stack.extend(reversed(subdirs))
 
         # Stable sort by repo-relative path
-        out.sort(key=lambda x: x.relative_to(root).as_posix())
+        out.sort(key=lambda t: t[1])
         return out
 
-
+    def discover(self) -> List[Path]:
+        return [p for p, _ in self.discover_pairs()]
+
+
+def discover_pairs(
+    root: Path,
+    *,
+    include_globs: Iterable[str] = (),
+    exclude_globs: Iterable[str] = (),
+    segment_excludes: Iterable[str] = (),
+    case_insensitive: bool = False,
+    follow_symlinks: bool = False,
+    skip_junk: bool = True,
+) -> List[Tuple[Path, str]]:
+    """One-call form of DiscoveryEngine(DiscoveryConfig(...)).discover_pairs()."""
+    cfg = DiscoveryConfig(
+        root=Path(root),
+        segment_excludes=tuple(segment_excludes),
+        include_globs=tuple(include_globs),
+        exclude_globs=tuple(exclude_globs),
+        case_insensitive=bool(case_insensitive),
+        follow_symlinks=bool(follow_symlinks),
+        skip_junk=bool(skip_junk),
+    )
+    return DiscoveryEngine(cfg).discover_pairs()
@@ -0,0 +1,240 @@
+"""
+File-fingerprint index for incremental packager runs.
+
+Between runs the packager keeps, per discovered file, a fingerprint
+(size, mtime_ns, sha256) and the raw (unwrapped, unmapped) records each
+per-file scanner produced for it. On the next run a file whose fingerprint is
+unchanged gets its cached records back instead of being read and scanned
+again; repo-wide summaries are still aggregated over every file, so the
+manifest matches a full run.
+
+Usage:
+    index = FingerprintIndex.load(cache_dir / "fingerprints.json", salt=packager_salt(cfg))
+    delta = index.refresh(discovered_repo)
+    with use_index(index):
+        ...run scanners...
+    index.save()
+
+Scanners call `cached_records(scanner, rel, compute)`; with no active index
+it simply returns `compute()`.
+
+Notes:
+- Change detection: same (size, mtime_ns) as last run → unchanged without
+  reading the file; otherwise the file is hashed and compared by sha256.
+- Cached values are stored as JSON text and decoded on every hit, so callers
+  may mutate what they get back (append_records maps paths in place).
+- The salt covers the packager's own source and the config that shapes
+  records (emit_ast, source_root); any change discards all cached records.
+- Values that are not JSON-serialisable are computed every run, never cached.
+- secrets_scan deliberately does not use the cache: its records carry
+  value previews / evidence, which must not be persisted to cache_dir.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, TypeVar
+
+INDEX_VERSION = 1
+_HASH_CHUNK = 1024 * 1024
+
+T = TypeVar("T")
+
+
+def _sha256_file(p: Path) -> str:
+    h = hashlib.sha256()
+    with p.open("rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def packager_salt(*, emit_ast: bool, source_root: Path | str, extra: Optional[Dict[str, Any]] = None) -> str:
+    """Digest of the packager's own .py sources plus the config that shapes scanner records."""
+    pkg_root = Path(__file__).resolve().parents[3]  # .../code_bundles/code_bundles
+    h = hashlib.sha256(f"v{INDEX_VERSION}|{bool(emit_ast)}|{Path(source_root).resolve().as_posix()}".encode("utf-8"))
+    h.update(json.dumps(extra or {}, sort_keys=True, default=str).encode("utf-8"))
+    for p in sorted(pkg_root.rglob("*.py")):
+        if "__pycache__" in p.parts:
+            continue
+        h.update(p.relative_to(pkg_root).as_posix().encode("utf-8"))
+        try:
+            h.update(p.read_bytes())
+        except OSError:
+            pass
+    return h.hexdigest()
+
+
+@dataclass
+class Delta:
+    """What changed since the previous run (repo-relative POSIX paths)."""
+    added: List[str] = field(default_factory=list)
+    changed: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    unchanged: int = 0
+
+    @property
+    def dirty(self) -> Set[str]:
+        return set(self.added) | set(self.changed)
+
+
+class FingerprintIndex:
+    """Per-file fingerprints plus cached per-file scanner records (JSON on disk)."""
+
+    def __init__(self, path: Path | str, salt: str = "") -> None:
+        self.path = Path(path)
+        self.salt = salt
+        # previous run: rel -> {"fp": [size, mtime_ns, sha256], "records": {scanner: json_text}}
+        self._prev: Dict[str, Dict[str, Any]] = {}
+        # this run
+        self._fps: Dict[str, List[Any]] = {}
+        self._unchanged: Set[str] = set()
+        self._fresh: Dict[str, Dict[str, str]] = {}
+        self._lock = threading.Lock()
+        self.stats = {"files": 0, "hashed": 0, "hits": 0, "misses": 0}
+
+    # ---- persistence ----
+
+    @classmethod
+    def load(cls, path: Path | str, salt: str = "") -> "FingerprintIndex":
+        idx = cls(path, salt)
+        try:
+            data = json.loads(idx.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return idx
+        if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+            return idx
+        files = data.get("files") or {}
+        if not isinstance(files, dict):
+            return idx
+        same_salt = data.get("salt") == salt
+        for rel, ent in files.items():
+            if isinstance(ent, dict) and isinstance(ent.get("fp"), list) and len(ent["fp"]) == 3:
+                idx._prev[rel] = {"fp": ent["fp"], "records": (ent.get("records") or {}) if same_salt else {}}
+        return idx
+
+    def save(self) -> None:
+        """Write fingerprints of this run's files and their records (fresh, or carried over)."""
+        files: Dict[str, Any] = {}
+        for rel, fp in self._fps.items():
+            recs: Dict[str, str] = {}
+            if rel in self._unchanged:
+                recs.update(self._prev.get(rel, {}).get("records") or {})
+            recs.update(self._fresh.get(rel) or {})
+            files[rel] = {"fp": fp, "records": recs}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        tmp.write_text(
+            json.dumps({"version": INDEX_VERSION, "salt": self.salt, "files": files}, ensure_ascii=False),
+            encoding="utf-8",
+        )
+        os.replace(tmp, self.path)
+
+    # ---- change detection ----
+
+    def refresh(self, discovered: Iterable[Tuple[Path, str]]) -> Delta:
+        """Fingerprint `discovered` and classify each file against the previous run."""
+        delta = Delta()
+        self._fps.clear()
+        self._unchanged.clear()
+        for local, rel in discovered:
+            try:
+                st = Path(local).stat()
+            except OSError:
+                continue
+            prev = self._prev.get(rel)
+            pfp = prev["fp"] if prev else None
+            if pfp and pfp[0] == st.st_size and pfp[1] == st.st_mtime_ns:
+                fp = pfp
+            else:
+                try:
+                    sha = _sha256_file(Path(local))
+                except OSError:
+                    continue
+                self.stats["hashed"] += 1
+                fp = [int(st.st_size), int(st.st_mtime_ns), sha]
+            self._fps[rel] = fp
+            if pfp is None:
+                delta.added.append(rel)
+            elif pfp[2] == fp[2]:
+                self._unchanged.add(rel)
+                delta.unchanged += 1
+            else:
+                delta.changed.append(rel)
+        delta.removed = sorted(set(self._prev) - set(self._fps))
+        self.stats["files"] = len(self._fps)
+        return delta
+
+    def is_unchanged(self, rel: str) -> bool:
+        return rel in self._unchanged
+
+    # ---- record cache ----
+
+    def cached(self, scanner: str, rel: str, compute: Callable[[], T]) -> T:
+        if rel in self._unchanged:
+            blob = (self._prev.get(rel, {}).get("records") or {}).get(scanner)
+            if blob is not None:
+                with self._lock:
+                    self.stats["hits"] += 1
+                return json.loads(blob)
+        value = compute()
+        try:
+            blob = json.dumps(value, ensure_ascii=False)
+        except (TypeError, ValueError):
+            return value
+        with self._lock:
+            self.stats["misses"] += 1
+            if rel in self._fps:
+                self._fresh.setdefault(rel, {})[scanner] = blob
+        return value
+
+    # ---- worker-process support (see execute/scanner_pool.py) ----
+
+    def take_fresh(self) -> Dict[str, Dict[str, str]]:
+        with self._lock:
+            out, self._fresh = self._fresh, {}
+        return out
+
+    def merge_fresh(self, fresh: Dict[str, Dict[str, str]]) -> None:
+        with self._lock:
+            for rel, recs in fresh.items():
+                self._fresh.setdefault(rel, {}).update(recs)
+
+
+_ACTIVE: Optional[FingerprintIndex] = None
+
+
+def install_index(index: Optional[FingerprintIndex]) -> Optional[FingerprintIndex]:
+    """Make `index` active with no scope (e.g. for a worker process); returns the previous one."""
+    global _ACTIVE
+    prev = _ACTIVE
+    _ACTIVE = index
+    return prev
+
+
+@contextmanager
+def use_index(index: Optional[FingerprintIndex]) -> Iterator[Optional[FingerprintIndex]]:
+    """Make `index` the one `cached_records` consults (None = no caching)."""
+    prev = install_index(index)
+    try:
+        yield index
+    finally:
+        install_index(prev)
+
+
+def active_index() -> Optional[FingerprintIndex]:
+    return _ACTIVE
+
+
+def cached_records(scanner: str, rel: str, compute: Callable[[], T]) -> T:
+    """Per-file scanner result for `rel`, from the active index when the file is unchanged."""
+    index = _ACTIVE
+    if index is None:
+        return compute()
+    return index.cached(scanner, rel, compute)
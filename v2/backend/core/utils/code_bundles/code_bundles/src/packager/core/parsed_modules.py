@@ -0,0 +1,160 @@
+"""
+Per-run parsed-module store shared by the Python scanners.
+
+Every Python scanner (python_index, quality, doc_coverage, complexity,
+static_check, env_index) needs the same three things for a file: its source,
+its line table and its AST. Without sharing, each scanner re-reads and
+re-parses every .py file, so one packager run parses a file five or six times.
+
+Usage:
+    store = ParsedModuleStore(budget_bytes=512 * 1024 * 1024)
+    with use_store(store):
+        ...run scanners...
+    store.stats  -> {"requests": ..., "parses": ..., ...}
+
+Scanners call `load_module(path, rel)`; with no active store it reads and
+parses directly, so scanners keep working when called standalone.
+
+Notes:
+- Text is UTF-8 decoded with errors="replace" and universal newlines (what the
+  scanners did individually); `utf8_ok` records whether a strict decode would
+  have succeeded, for scanners that report decode errors.
+- Trees are shared between scanners and must be treated as read-only.
+- Memory is bounded by an estimate (source size x AST overhead). Once the
+  budget is spent, further modules are still parsed and returned but not
+  retained; scanners sweep files in the same order, so keeping the first N
+  modules beats evicting the ones the next scanner is about to ask for.
+"""
+
+from __future__ import annotations
+
+import ast
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+# Measured on this tree with tracemalloc: an ast.Module costs roughly 35 bytes
+# per source byte; the decoded text and line table add a few more.
+AST_BYTES_PER_SOURCE_BYTE = 40
+DEFAULT_BUDGET_BYTES = 512 * 1024 * 1024
+
+
+@dataclass
+class ParsedModule:
+    """Source, line table and AST of one Python file (read once)."""
+    path: Path
+    source: bytes = b""
+    text: str = ""
+    utf8_ok: bool = True
+    lines: List[str] = field(default_factory=list)
+    tree: Optional[ast.Module] = None
+    syntax_error: Optional[SyntaxError] = None
+    read_error: Optional[OSError] = None
+
+    @property
+    def cost(self) -> int:
+        return max(1, len(self.source)) * AST_BYTES_PER_SOURCE_BYTE
+
+
+def parse_module(path: Path, filename: Optional[str] = None) -> ParsedModule:
+    """Read and parse `path` (no caching). Never raises for I/O or syntax errors."""
+    mod = ParsedModule(path=Path(path))
+    try:
+        mod.source = mod.path.read_bytes()
+    except OSError as e:
+        mod.read_error = e
+        return mod
+    try:
+        mod.source.decode("utf-8")
+    except UnicodeDecodeError:
+        mod.utf8_ok = False
+    text = mod.source.decode("utf-8", errors="replace")
+    mod.text = text.replace("\r\n", "\n").replace("\r", "\n")
+    mod.lines = mod.text.splitlines()
+    try:
+        mod.tree = ast.parse(mod.text, filename=filename or str(path))
+    except SyntaxError as e:
+        mod.syntax_error = e
+    except (ValueError, RecursionError, MemoryError) as e:
+        # e.g. null bytes; surface as a SyntaxError so callers handle one type
+        mod.syntax_error = SyntaxError(f"{type(e).__name__}: {e}")
+    return mod
+
+
+class ParsedModuleStore:
+    """Thread-safe, memory-bounded cache of ParsedModule keyed by resolved path."""
+
+    def __init__(self, budget_bytes: int = DEFAULT_BUDGET_BYTES) -> None:
+        self.budget_bytes = max(0, int(budget_bytes))
+        self._mods: Dict[str, ParsedModule] = {}
+        self._used = 0
+        self._lock = threading.Lock()
+        self.parse_secs = 0.0
+        self.stats = {"requests": 0, "parses": 0, "retained": 0, "over_budget": 0}
+
+    def get(self, path: Path, filename: Optional[str] = None) -> ParsedModule:
+        key = str(Path(path).resolve())
+        with self._lock:
+            self.stats["requests"] += 1
+            mod = self._mods.get(key)
+        if mod is not None:
+            return mod
+
+        t0 = time.perf_counter()
+        mod = parse_module(path, filename)
+        dt = time.perf_counter() - t0
+
+        with self._lock:
+            self.stats["parses"] += 1
+            self.parse_secs += dt
+            if key in self._mods:  # another thread got there first
+                return self._mods[key]
+            if self._used + mod.cost <= self.budget_bytes:
+                self._mods[key] = mod
+                self._used += mod.cost
+                self.stats["retained"] += 1
+            else:
+                self.stats["over_budget"] += 1
+        return mod
+
+    def clear(self) -> None:
+        with self._lock:
+            self._mods.clear()
+            self._used = 0
+
+
+_ACTIVE: Optional[ParsedModuleStore] = None
+
+
+def install_store(store: Optional[ParsedModuleStore]) -> Optional[ParsedModuleStore]:
+    """Make `store` active with no scope (e.g. for a worker process); returns the previous one."""
+    global _ACTIVE
+    prev = _ACTIVE
+    _ACTIVE = store
+    return prev
+
+
+@contextmanager
+def use_store(store: ParsedModuleStore) -> Iterator[ParsedModuleStore]:
+    """Make `store` the one `load_module` consults; frees its modules on exit."""
+    prev = install_store(store)
+    try:
+        yield store
+    finally:
+        install_store(prev)
+        store.clear()
+
+
+def active_store() -> Optional[ParsedModuleStore]:
+    return _ACTIVE
+
+
+def load_module(path: Path, filename: Optional[str] = None) -> ParsedModule:
+    """Return the parsed module for `path` from the active store (or parse it now)."""
+    store = _ACTIVE
+    if store is None:
+        return parse_module(path, filename)
+    return store.get(path, filename)
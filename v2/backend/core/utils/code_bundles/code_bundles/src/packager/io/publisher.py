@@ -2,11 +2,13 @@
 from __future__ import annotations
 
 import base64
+import hashlib
 import json
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, Optional, Tuple
+from typing import Any, Dict, Iterable, Optional, Tuple
 from urllib import request, error, parse
 
 
@@ -64,18 +66,77 @@ def _join_paths(prefix: str, rel: str) -> str:
     return f"{prefix}/{rel}" if prefix else rel
 
 
+# ──────────────────────────────────────────────────────────────────────────────
+# Git Data API: one tree/commit/ref update for many files
+# ──────────────────────────────────────────────────────────────────────────────
+def git_blob_sha(data: bytes) -> str:
+    """SHA-1 git assigns to a blob with this content (what trees reference)."""
+    h = hashlib.sha1()
+    h.update(b"blob %d\0" % len(data))
+    h.update(data)
+    return h.hexdigest()
+
+
+def _blob_mode(remote_mode: Optional[str], src: Path) -> str:
+    """Tree mode for an uploaded file: the remote regular-file mode if any, else from the local exec bit."""
+    if remote_mode in ("100644", "100755"):
+        return remote_mode
+    try:
+        return "100755" if src.stat().st_mode & 0o111 else "100644"
+    except OSError:
+        return "100644"
+
+
+def _git_api(api_base: str, target: GitHubTarget, token: str, method: str, path: str,
+             payload: Optional[dict] = None, timeout: int = 60) -> dict:
+    url = f"{api_base.rstrip('/')}/repos/{target.owner}/{target.repo}{path}"
+    data = json.dumps(payload).encode("utf-8") if payload is not None else None
+    req = request.Request(url, data=data, headers=_headers(token), method=method)
+    try:
+        with request.urlopen(req, timeout=timeout) as resp:
+            return json.loads(resp.read().decode("utf-8"))
+    except error.HTTPError as e:
+        msg = e.read().decode("utf-8", errors="ignore")
+        raise RuntimeError(f"GitHub API {method} {path} failed: {e.code} {e.reason}\n{msg}") from None
+
+
+@dataclass
+class TreePublishReport:
+    files: int = 0
+    changed: int = 0
+    uploaded: int = 0            # distinct blobs uploaded (identical contents share one)
+    commit: Optional[str] = None  # None when nothing changed
+    truncated_remote: bool = False
+    secs: float = 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "kind": "github",
+            "decision": "tree-commit" if self.commit else "unchanged",
+            "files": self.files,
+            "changed": self.changed,
+            "uploaded": self.uploaded,
+            "commit": self.commit,
+            "truncated_remote": self.truncated_remote,
+            "secs": round(self.secs, 3),
+        }
+
+
 class GitHubPublisher:
     """
-    Simple GitHub publisher using the Contents API.
+    Simple GitHub publisher.
     - Creates or updates files under base_path on the specified branch.
-    - Uses PUT /contents/{path} with base64-encoded content.
+    - publish_bytes / publish_file / publish_many_files: Contents API,
+      PUT /contents/{path} with base64-encoded content (one commit per file).
+    - publish_tree: Git Data API, only changed blobs, one commit for all files.
     """
 
-    def __init__(self, target: GitHubTarget, token: str) -> None:
+    def __init__(self, target: GitHubTarget, token: str, api_base: str = "https://api.github.com") -> None:
         if not token:
             raise ValueError("GitHubPublisher: token is empty")
         self.target = target
         self.token = token
+        self.api_base = api_base
 
     def publish_bytes(self, repo_rel_path: str, data: bytes, message: str = "publish") -> None:
         """
@@ -108,11 +169,78 @@ class GitHubPublisher:
             if throttle_every and (i % throttle_every == 0):
                 time.sleep(sleep_secs)
 
-
-
-
-
-
-
-
-
+    def publish_tree(
+        self,
+        items: Iterable[Tuple[Path, str]],
+        message: str = "publish",
+        *,
+        workers: int = 8,
+        timeout: int = 60,
+    ) -> TreePublishReport:
+        """
+        Publish many local files in ONE commit via the Git Data API.
+        items: iterable of (local_path, repo_rel_path); paths go under base_path.
+
+        Git blob SHAs are computed locally and compared with the branch's tree
+        (one recursive GET), so only changed files are uploaded; blobs are
+        created on a pool of `workers` threads, then a single tree, commit and
+        fast-forward ref update land them. Nothing is committed when no file
+        differs.
+        """
+        t0 = time.perf_counter()
+        api, tgt, tok = self.api_base, self.target, self.token
+        branch = parse.quote(tgt.branch)
+
+        local: Dict[str, Tuple[Path, str]] = {}  # repo path -> (local file, blob sha)
+        for src, rel in items:
+            path = _join_paths(tgt.base_path, rel)
+            local[path] = (Path(src), git_blob_sha(Path(src).read_bytes()))
+        report = TreePublishReport(files=len(local))
+
+        head_sha = _git_api(api, tgt, tok, "GET", f"/git/refs/heads/{branch}", timeout=timeout)["object"]["sha"]
+        base_tree = _git_api(api, tgt, tok, "GET", f"/git/commits/{head_sha}", timeout=timeout)["tree"]["sha"]
+        remote = _git_api(api, tgt, tok, "GET", f"/git/trees/{base_tree}?recursive=1", timeout=timeout)
+        # A truncated listing just means some unchanged files get re-uploaded (same blob SHA).
+        report.truncated_remote = bool(remote.get("truncated"))
+        remote_sha = {e["path"]: e.get("sha") for e in remote.get("tree") or [] if e.get("type") == "blob"}
+        remote_mode = {e["path"]: e.get("mode") for e in remote.get("tree") or [] if e.get("type") == "blob"}
+
+        changed = sorted(p for p, (_src, sha) in local.items() if remote_sha.get(p) != sha)
+        report.changed = len(changed)
+        if not changed:
+            report.secs = time.perf_counter() - t0
+            return report
+
+        # One upload per distinct content
+        by_sha: Dict[str, Path] = {}
+        for p in changed:
+            src, sha = local[p]
+            by_sha.setdefault(sha, src)
+
+        def _upload(sha_src: Tuple[str, Path]) -> Tuple[str, str]:
+            sha, src = sha_src
+            b64 = base64.b64encode(src.read_bytes()).decode("ascii")
+            blob = _git_api(api, tgt, tok, "POST", "/git/blobs", {"content": b64, "encoding": "base64"}, timeout)
+            return sha, blob["sha"]
+
+        with ThreadPoolExecutor(max_workers=max(1, min(int(workers), len(by_sha)))) as pool:
+            uploaded = dict(pool.map(_upload, by_sha.items()))
+        report.uploaded = len(uploaded)
+        for sha, remote_blob in uploaded.items():
+            if sha != remote_blob:
+                raise RuntimeError(f"GitHub blob SHA mismatch for {by_sha[sha]}: local {sha}, remote {remote_blob}")
+
+        # Keep an existing file's mode (e.g. 100755); new files take the local exec bit
+        entries = [
+            {"path": p, "mode": _blob_mode(remote_mode.get(p), local[p][0]), "type": "blob", "sha": local[p][1]}
+            for p in changed
+        ]
+        tree = _git_api(api, tgt, tok, "POST", "/git/trees", {"base_tree": base_tree, "tree": entries}, timeout)
+        commit = _git_api(
+            api, tgt, tok, "POST", "/git/commits",
+            {"message": message, "tree": tree["sha"], "parents": [head_sha]}, timeout,
+        )
+        _git_api(api, tgt, tok, "PATCH", f"/git/refs/heads/{branch}", {"sha": commit["sha"], "force": False}, timeout)
+        report.commit = commit["sha"]
+        report.secs = time.perf_counter() - t0
+        return report
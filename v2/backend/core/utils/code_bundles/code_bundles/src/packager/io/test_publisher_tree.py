@@ -0,0 +1,204 @@
+# File: v2/backend/core/utils/code_bundles/code_bundles/src/packager/io/test_publisher_tree.py
+"""
+GitHubPublisher.publish_tree against a local fake GitHub (Git Data API subset).
+
+The fake server keeps blobs, flat trees, commits and one branch ref in memory
+and logs every request, so the tests can check what was uploaded and that each
+publish lands as a single commit.
+
+Run:
+    pytest -q v2/backend/core/utils/code_bundles/code_bundles/src/packager/io/test_publisher_tree.py
+"""
+
+import base64
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from v2.backend.core.utils.code_bundles.code_bundles.src.packager.io.publisher import (
+    GitHubPublisher,
+    GitHubTarget,
+    git_blob_sha,
+)
+
+
+class _FakeGitHub:
+    def __init__(self) -> None:
+        self.blobs = {}            # sha -> bytes
+        self.trees = {"t0": {}}    # sha -> {path: blob sha}
+        self.modes = {"t0": {}}    # tree sha -> {path: mode} (100644 when absent)
+        self.commits = {"c0": {"tree": "t0", "parents": []}}
+        self.ref = "c0"
+        self.log = []              # (method, path)
+        self.lock = threading.Lock()
+
+    def handle(self, method, path, body):
+        m = re.match(r"^/repos/o/r(/.*)$", path)
+        route = m.group(1) if m else path
+        with self.lock:
+            self.log.append((method, route.split("?")[0]))
+            if method == "GET" and route == "/git/refs/heads/main":
+                return 200, {"object": {"sha": self.ref}}
+            if method == "GET" and route.startswith("/git/commits/"):
+                c = self.commits[route.rsplit("/", 1)[1]]
+                return 200, {"tree": {"sha": c["tree"]}}
+            if method == "GET" and route.startswith("/git/trees/"):
+                tsha = route.split("/")[3].split("?")[0]
+                tree, modes = self.trees[tsha], self.modes[tsha]
+                entries = [{"path": p, "type": "blob", "sha": s, "mode": modes.get(p, "100644")} for p, s in sorted(tree.items())]
+                return 200, {"tree": entries, "truncated": False}
+            if method == "POST" and route == "/git/blobs":
+                data = base64.b64decode(body["content"])
+                sha = git_blob_sha(data)
+                self.blobs[sha] = data
+                return 201, {"sha": sha}
+            if method == "POST" and route == "/git/trees":
+                tree = dict(self.trees[body["base_tree"]])
+                modes = dict(self.modes[body["base_tree"]])
+                for e in body["tree"]:
+                    assert e["sha"] in self.blobs, "tree references a blob that was never uploaded"
+                    tree[e["path"]] = e["sha"]
+                    modes[e["path"]] = e["mode"]
+                sha = hashlib.sha1(json.dumps([tree, modes], sort_keys=True).encode()).hexdigest()
+                self.trees[sha] = tree
+                self.modes[sha] = modes
+                return 201, {"sha": sha}
+            if method == "POST" and route == "/git/commits":
+                sha = f"c{len(self.commits)}"
+                self.commits[sha] = {"tree": body["tree"], "parents": body["parents"], "message": body["message"]}
+                return 201, {"sha": sha}
+            if method == "PATCH" and route == "/git/refs/heads/main":
+                if self.commits[body["sha"]]["parents"] != [self.ref]:
+                    return 422, {"message": "Update is not a fast forward"}
+                self.ref = body["sha"]
+                return 200, {"object": {"sha": self.ref}}
+        return 404, {"message": "Not Found"}
+
+    def head_files(self):
+        tree = self.trees[self.commits[self.ref]["tree"]]
+        return {p: self.blobs[s] for p, s in tree.items()}
+
+    def head_modes(self):
+        tsha = self.commits[self.ref]["tree"]
+        return {p: self.modes[tsha].get(p, "100644") for p in self.trees[tsha]}
+
+    def count(self, method, route):
+        return sum(1 for m, r in self.log if m == method and r == route)
+
+
+def _serve(fake):
+    class Handler(BaseHTTPRequestHandler):
+        def _do(self):
+            n = int(self.headers.get("Content-Length") or 0)
+            body = json.loads(self.rfile.read(n).decode("utf-8")) if n else None
+            code, payload = fake.handle(self.command, self.path, body)
+            data = json.dumps(payload).encode("utf-8")
+            self.send_response(code)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        do_GET = do_POST = do_PATCH = _do
+
+        def log_message(self, *args):
+            pass
+
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    return srv
+
+
+def _publisher(srv, base_path=""):
+    return GitHubPublisher(
+        GitHubTarget(owner="o", repo="r", branch="main", base_path=base_path),
+        token="t",
+        api_base=f"http://127.0.0.1:{srv.server_address[1]}",
+    )
+
+
+def _files(root: Path, contents):
+    items = []
+    for rel, text in contents.items():
+        p = root / rel
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_bytes(text)
+        items.append((p, rel))
+    return items
+
+
+def test_git_blob_sha_matches_git():
+    # `printf 'hello\n' | git hash-object --stdin`
+    assert git_blob_sha(b"hello\n") == "ce013625030ba8dba906f756967f9e9ca394464a"
+    assert git_blob_sha(b"") == "e69de29bb2d1d6434b8b29ae775ad8c2e48c5391"
+
+
+def test_publish_tree_single_commit_and_only_changed_blobs():
+    fake = _FakeGitHub()
+    srv = _serve(fake)
+    try:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            items = _files(root, {"a.py": b"print(1)\n", "pkg/b.py": b"x = 2\n", "pkg/c.py": b"x = 2\n"})
+            pub = _publisher(srv, base_path="code")
+
+            rep = pub.publish_tree(items, message="first", workers=4)
+            assert rep.changed == 3 and rep.uploaded == 2  # b.py and c.py share one blob
+            assert rep.commit == fake.ref
+            assert fake.head_files() == {"code/a.py": b"print(1)\n", "code/pkg/b.py": b"x = 2\n", "code/pkg/c.py": b"x = 2\n"}
+            assert fake.count("POST", "/git/commits") == 1
+            assert fake.count("PATCH", "/git/refs/heads/main") == 1
+
+            # Unchanged: one tree read, no uploads, no commit
+            fake.log.clear()
+            rep = pub.publish_tree(items, message="noop")
+            assert rep.changed == 0 and rep.commit is None
+            assert fake.count("POST", "/git/blobs") == 0 and fake.count("POST", "/git/commits") == 0
+
+            # One edit: one blob, one commit on top of the previous head, other files kept
+            head_before = fake.ref
+            (root / "pkg/b.py").write_bytes(b"x = 3\n")
+            fake.log.clear()
+            rep = pub.publish_tree(items, message="edit")
+            assert (rep.changed, rep.uploaded) == (1, 1)
+            assert fake.commits[fake.ref]["parents"] == [head_before]
+            assert fake.head_files()["code/pkg/b.py"] == b"x = 3\n"
+            assert fake.head_files()["code/a.py"] == b"print(1)\n"
+            assert fake.count("POST", "/git/blobs") == 1
+            assert fake.count("GET", f"/git/trees/{fake.commits[head_before]['tree']}") == 1
+    finally:
+        srv.shutdown()
+
+
+def test_publish_tree_keeps_file_modes():
+    fake = _FakeGitHub()
+    # Remote already has an executable script
+    fake.blobs[git_blob_sha(b"echo 1\n")] = b"echo 1\n"
+    fake.trees["t1"] = {"run.sh": git_blob_sha(b"echo 1\n")}
+    fake.modes["t1"] = {"run.sh": "100755"}
+    fake.commits["c1"] = {"tree": "t1", "parents": ["c0"]}
+    fake.ref = "c1"
+    srv = _serve(fake)
+    try:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            # Local copies lost their exec bit; the new tool is executable locally
+            items = _files(root, {"run.sh": b"echo 2\n", "tool.sh": b"echo t\n", "lib.py": b"x = 1\n"})
+            os.chmod(root / "run.sh", 0o644)
+            os.chmod(root / "tool.sh", 0o755)
+            os.chmod(root / "lib.py", 0o644)
+            rep = _publisher(srv).publish_tree(items, message="modes")
+            assert rep.changed == 3
+            assert fake.head_files()["run.sh"] == b"echo 2\n"
+            modes = fake.head_modes()
+            assert modes["run.sh"] == "100755"  # kept from the base tree
+            assert modes["lib.py"] == "100644"
+            if os.name != "nt":  # no exec bit on Windows
+                assert modes["tool.sh"] == "100755"
+    finally:
+        srv.shutdown()
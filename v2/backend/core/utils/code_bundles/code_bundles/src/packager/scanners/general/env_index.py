@@ -84,6 +84,9 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional, Set, Tuple
 
+from v2.backend.core.utils.code_bundles.code_bundles.src.packager.core.parsed_modules import load_module
+from v2.backend.core.utils.code_bundles.code_bundles.src.packager.core.incremental import cached_records
+
 try:  # Python 3.11+
     import tomllib  # type: ignore[attr-defined]
 except Exception:  # pragma: no cover
@@ -334,14 +337,9 @@ class _PyEnvVisitor(ast.NodeVisitor):
         self.generic_visit(node)
 
 
-def _scan_python_env_usage(path: Path) -> Optional[_PyEnvUsage]:
-    try:
-        text = path.read_text(encoding="utf-8", errors="replace")
-    except Exception:
-        return None
-    try:
-        tree = ast.parse(text)
-    except Exception:
+def _scan_python_env_usage(path: Path, rel: Optional[str] = None) -> Optional[_PyEnvUsage]:
+    tree = load_module(path, rel).tree
+    if tree is None:
         return None
     v = _PyEnvVisitor()
     v.visit(tree)
@@ -373,6 +371,25 @@ def _scan_js_env_usage_text(text: str) -> Set[str]:
 # Public API
 # ──────────────────────────────────────────────────────────────────────────────
 
+def _python_env_record(local: Path, rel: str) -> Optional[Dict]:
+    usage = _scan_python_env_usage(local, rel)
+    if not usage:
+        return None
+    vars_sorted = sorted(usage.vars)
+    return {
+        "kind": "env.usage",
+        "language": "python",
+        "path": rel,
+        "vars": vars_sorted,
+        "count": len(vars_sorted),
+        "calls": {
+            "getenv": usage.calls_getenv,
+            "environ_index": usage.calls_environ_index,
+            "environ_get": usage.calls_environ_get,
+        },
+    }
+
+
 def scan(repo_root: Path, discovered: Iterable[RepoItem]) -> List[Dict]:
     """
     Scan the repository for environment variables in:
@@ -438,23 +455,11 @@ def scan(repo_root: Path, discovered: Iterable[RepoItem]) -> List[Dict]:
 
         # --- Python usage
         if rel.endswith(".py"):
-            usage = _scan_python_env_usage(local)
-            if usage:
-                vars_sorted = sorted(usage.vars)
-                records.append({
-                    "kind": "env.usage",
-                    "language": "python",
-                    "path": rel,
-                    "vars": vars_sorted,
-                    "count": len(vars_sorted),
-                    "calls": {
-                        "getenv": usage.calls_getenv,
-                        "environ_index": usage.calls_environ_index,
-                        "environ_get": usage.calls_environ_get,
-                    },
-                })
+            rec = cached_records("env_index.python", rel, lambda: _python_env_record(local, rel))
+            if rec:
+                records.append(rec)
                 py_files_count += 1
-                py_vars_all.update(usage.vars)
+                py_vars_all.update(rec["vars"])
 
         # --- JS/TS usage
         if ext in _JS_EXTS:
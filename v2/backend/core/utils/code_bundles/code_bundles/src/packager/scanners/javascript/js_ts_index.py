@@ -54,6 +54,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional, Set, Tuple
 
+from v2.backend.core.utils.code_bundles.code_bundles.src.packager.core.incremental import cached_records
+
 RepoItem = Tuple[Path, str]  # (local_path, repo_relative_posix)
 
 _MAX_READ_BYTES = 2 * 1024 * 1024  # 2 MiB safety cap
@@ -386,7 +388,7 @@ def scan(repo_root: Path, discovered: Iterable[RepoItem]) -> List[Dict]:
     per_file_funcs: List[Tuple[str, int]] = []
 
     for local, rel in items:
-        rec = analyze_file(local_path=local, repo_rel_posix=rel)
+        rec = cached_records("js_ts_index", rel, lambda: analyze_file(local_path=local, repo_rel_posix=rel))
         results.append(rec)
 
         ln = rec.get("lines", {})
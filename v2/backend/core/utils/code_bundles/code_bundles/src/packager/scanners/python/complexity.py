@@ -58,6 +58,9 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional, Tuple
 
+from v2.backend.core.utils.code_bundles.code_bundles.src.packager.core.incremental import cached_records
+from v2.backend.core.utils.code_bundles.code_bundles.src.packager.core.parsed_modules import load_module
+
 RepoItem = Tuple[Path, str]  # (local_path, repo_relative_posix)
 
 
@@ -223,15 +226,9 @@ class _FunctionCollector(ast.NodeVisitor):
 # Per-file analysis & aggregation helpers
 # ──────────────────────────────────────────────────────────────────────────────
 
-def _safe_parse(p: Path):
-    try:
-        text = p.read_text(encoding="utf-8", errors="replace")
-    except Exception:
-        return None
-    try:
-        return ast.parse(text)
-    except Exception:
-        return None
+def _safe_parse(p: Path, rel: Optional[str] = None):
+    # Shared with the other Python scanners via the per-run parsed-module store
+    return load_module(p, rel).tree
 
 def _percentile(values: List[float], pct: float) -> Optional[float]:
     if not values:
@@ -258,7 +255,7 @@ def analyze_file(*, local_path: Path, repo_rel_posix: str, top_n_functions: int
     Analyze a Python file's functions/methods for cyclomatic complexity.
     Always returns a record; unparsable files produce zeros.
     """
-    tree = _safe_parse(local_path)
+    tree = _safe_parse(local_path, repo_rel_posix)
     if tree is None:
         return {
             "kind": "quality.complexity",
@@ -320,7 +317,7 @@ def scan(repo_root: Path, discovered: Iterable[RepoItem]) -> List[Dict]:
     per_file_totals: List[Tuple[str, int, int]] = []  # (path, total_complexity, functions)
 
     for local, rel in files:
-        rec = analyze_file(local_path=local, repo_rel_posix=rel)
+        rec = cached_records("complexity", rel, lambda: analyze_file(local_path=local, repo_rel_posix=rel))
         results.append(rec)
 
         per_file_totals.append((rel, int(rec.get("total_complexity", 0)), int(rec.get("functions", 0))))
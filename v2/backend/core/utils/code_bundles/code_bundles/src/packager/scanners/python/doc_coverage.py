@@ -43,6 +43,9 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional, Tuple
 
+from v2.backend.core.utils.code_bundles.code_bundles.src.packager.core.incremental import cached_records
+from v2.backend.core.utils.code_bundles.code_bundles.src.packager.core.parsed_modules import load_module
+
 
 # Public type used by the runner to pass discovered files
 RepoItem = Tuple[Path, str]  # (local_path, repo_relative_posix)
@@ -69,15 +72,9 @@ def _has_doc(node: ast.AST) -> bool:
         return False
     return bool(str(doc).strip())
 
-def _safe_parse(p: Path) -> Optional[ast.Module]:
-    try:
-        text = p.read_text(encoding="utf-8", errors="replace")
-    except Exception:
-        return None
-    try:
-        return ast.parse(text)
-    except Exception:
-        return None
+def _safe_parse(p: Path, rel: Optional[str] = None) -> Optional[ast.Module]:
+    # Shared with the other Python scanners via the per-run parsed-module store
+    return load_module(p, rel).tree
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -90,7 +87,7 @@ def analyze_file(*, local_path: Path, repo_rel_posix: str) -> Optional[Dict]:
 
     Returns a record suitable for the manifest, or None if file cannot be parsed.
     """
-    tree = _safe_parse(local_path)
+    tree = _safe_parse(local_path, repo_rel_posix)
     if tree is None:
         # Could not parse; still return a minimal record with zeros
         return {
@@ -178,7 +175,7 @@ def scan(repo_root: Path, discovered: Iterable[RepoItem]) -> List[Dict]:
     overall_doc_with = 0
 
     for local, rel in files:
-        rec = analyze_file(local_path=local, repo_rel_posix=rel)
+        rec = cached_records("doc_coverage", rel, lambda: analyze_file(local_path=local, repo_rel_posix=rel))
         if rec is None:
             continue
         results.append(rec)
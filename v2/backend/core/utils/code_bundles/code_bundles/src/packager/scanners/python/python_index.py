@@ -9,18 +9,12 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
+from v2.backend.core.utils.code_bundles.code_bundles.src.packager.core.parsed_modules import load_module
+
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Helpers
 # ──────────────────────────────────────────────────────────────────────────────
-def _read_text(p: Path) -> str:
-    try:
-        return p.read_text(encoding="utf-8")
-    except UnicodeDecodeError:
-        # last-ditch fallback
-        return p.read_text(errors="replace")
-
-
 def _mod_name_from_rel(rel: str) -> str:
     # Convert repo_rel_posix to dotted module name (best-effort)
     # e.g. "pkg/subpkg/mod.py" -> "pkg.subpkg.mod" ; "__init__.py" maps to its package
@@ -90,13 +84,16 @@ def index_python_file(
       - import edges (list of dicts with src_path/dst_module; dst_path may be filled downstream)
       - optional AST extras (when emit_ast=True): symbols/xrefs/calls/docstrings/symbol_metrics lists
 
-    This function is **pure** and does not touch global state.
+    Source and AST come from the per-run parsed-module store (shared with the
+    other Python scanners); the tree is only read, never modified.
     """
 
-    text = _read_text(local_path)
-    try:
-        tree = ast.parse(text, filename=repo_rel_posix)
-    except SyntaxError as se:
+    parsed = load_module(local_path, repo_rel_posix)
+    if parsed.read_error is not None:
+        raise parsed.read_error
+    tree = parsed.tree
+    if tree is None:
+        se = parsed.syntax_error or SyntaxError("unparsable module")
         # Return a minimal record so callers can continue
         mod_rec = {
             "record_type": "module_index",
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 import ast
-import io
 import re
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional, Tuple
 
+from v2.backend.core.utils.code_bundles.code_bundles.src.packager.core.incremental import cached_records
+from v2.backend.core.utils.code_bundles.code_bundles.src.packager.core.parsed_modules import load_module
+
 __all__ = ["static_check_scan", "scan"]
 
 FAMILY = "static"  # canonical family name we’ll emit
@@ -63,20 +65,12 @@ def _rel_posix(p: Path, repo_root: Path) -> str:
     except Exception:
         return str(p).replace("\\", "/")
 
-def _read_text(path: Path) -> str:
-    # Be tolerant to odd encodings; preserve line positions.
-    with path.open("rb") as f:
-        raw = f.read()
-    return io.TextIOWrapper(io.BytesIO(raw), encoding="utf-8", errors="replace").read()
-
-
 # ──────────────────────────────────────────────────────────────────────────────
 # Line-based checks
 # ──────────────────────────────────────────────────────────────────────────────
 
 def _scan_lines(abs_path: Path, rel: str, issues: List[Issue]) -> None:
-    text = _read_text(abs_path)
-    for i, line in enumerate(text.splitlines(), start=1):
+    for i, line in enumerate(load_module(abs_path, rel).lines, start=1):
         # long lines
         if len(line) > _LONG_LINE_LIMIT:
             issues.append(Issue(
@@ -190,10 +184,8 @@ class _ASTVisitor(ast.NodeVisitor):
 
 
 def _scan_ast(abs_path: Path, rel: str, issues: List[Issue]) -> None:
-    try:
-        text = _read_text(abs_path)
-        tree = ast.parse(text)
-    except Exception:
+    tree = load_module(abs_path, rel).tree
+    if tree is None:
         # Tolerate parse errors; a separate syntax scanner could flag them if desired
         return
     _ASTVisitor(rel, issues).visit(tree)
@@ -203,6 +195,13 @@ def _scan_ast(abs_path: Path, rel: str, issues: List[Issue]) -> None:
 # Public API (wired by your orchestrator)
 # ──────────────────────────────────────────────────────────────────────────────
 
+def _check_file(abs_path: Path, rel: str) -> List[Dict]:
+    issues: List[Issue] = []
+    _scan_lines(abs_path, rel, issues)
+    _scan_ast(abs_path, rel, issues)
+    return [it.to_record() for it in issues]
+
+
 def static_check_scan(repo_root: Path, discovered_repo: Iterable[Tuple[Path, str]]) -> List[Dict]:
     """
     Scanner entrypoint expected by your read_scanners.py wiring.
@@ -232,7 +231,7 @@ def static_check_scan(repo_root: Path, discovered_repo: Iterable[Tuple[Path, str
         }
     """
     repo_root = Path(repo_root).resolve()
-    issues: List[Issue] = []
+    records: List[Dict] = []
 
     for abs_path, rel in discovered_repo:
         # Filter to Python only (mirror other scanners’ convention)
@@ -243,11 +242,10 @@ def static_check_scan(repo_root: Path, discovered_repo: Iterable[Tuple[Path, str
         if not rel:
             rel = _rel_posix(abs_path, repo_root)
 
-        # Run checks
-        _scan_lines(abs_path, rel, issues)
-        _scan_ast(abs_path, rel, issues)
+        # Run checks (per-file records are reused for unchanged files on incremental runs)
+        records.extend(cached_records("static_check", rel, lambda: _check_file(abs_path, rel)))
 
-    return [it.to_record() for it in issues]
+    return records
 
 
 # Maintain compatibility if someone imports scan()
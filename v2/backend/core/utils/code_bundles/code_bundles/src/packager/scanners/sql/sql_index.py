@@ -60,6 +60,8 @@ from collections import Counter, defaultdict
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional, Set, Tuple
 
+from v2.backend.core.utils.code_bundles.code_bundles.src.packager.core.incremental import cached_records
+
 RepoItem = Tuple[Path, str]  # (local_path, repo_relative_posix)
 
 _MAX_READ_BYTES = 2 * 1024 * 1024  # 2 MiB safety cap
@@ -578,7 +580,7 @@ def scan(repo_root: Path, discovered: Iterable[RepoItem]) -> List[Dict]:
     stmts_total = 0
 
     for local, rel in files:
-        rec = analyze_file(local_path=local, repo_rel_posix=rel)
+        rec = cached_records("sql_index", rel, lambda: analyze_file(local_path=local, repo_rel_posix=rel))
         results.append(rec)
 
         stmts_total += int(rec.get("statements", 0))
@@ -11,9 +11,12 @@ from sqlalchemy import (
     String,
     Text,
     func,
+    literal_column,
+    text,
     Index,
     UniqueConstraint,
 )
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 # ----------------------------- SQLAlchemy Base --------------------------------
@@ -28,6 +31,15 @@ class Base(DeclarativeBase):
 SymbolType = Literal["module", "class", "function", "route", "unknown"]
 StatusType = Literal["active", "deprecated", "removed"]
 
+# Normalized status as indexed by idx_introspect_status_norm_id. Must be rendered
+# verbatim (literals, not bound parameters) for SQLite to use the index.
+STATUS_NORM_SQL = "lower(replace(replace(status, '_', ''), '-', ''))"
+
+
+def normalize_status(value: Optional[str]) -> str:
+    """Python twin of STATUS_NORM_SQL."""
+    return (value or "").replace("_", "").replace("-", "").lower()
+
 
 # ------------------------------- ORM Model ------------------------------------
 
@@ -85,10 +97,22 @@ class IntrospectionIndex(Base):
         Index("idx_introspect_relation_type", "relation_type"),
         Index("idx_introspect_ag_tag", "ag_tag"),
         Index("idx_introspect_key_hash", "unique_key_hash"),
+        Index("idx_introspect_status_norm_id", text(STATUS_NORM_SQL), "id"),
         UniqueConstraint("unique_key_hash", name="uq_introspect_key"),
         UniqueConstraint("filepath", "symbol_type", "name", "lineno", name="uq_introspect_natural"),
     )
 
+    # ------------- Normalized status (indexed expression) ---------------------
+
+    @hybrid_property
+    def status_norm(self) -> str:
+        return normalize_status(self.status)
+
+    @status_norm.inplace.expression
+    @classmethod
+    def _status_norm_expression(cls):
+        return literal_column(STATUS_NORM_SQL)
+
     # ------------- Convenience accessors for JSON metadata --------------------
 
     @property
@@ -155,5 +179,12 @@ class IntrospectionIndexOut(IntrospectionIndexIn):
     model_config = {"from_attributes": True}
 
 
-__all__ = ["Base", "IntrospectionIndex", "IntrospectionIndexIn", "IntrospectionIndexOut"]
+__all__ = [
+    "Base",
+    "IntrospectionIndex",
+    "IntrospectionIndexIn",
+    "IntrospectionIndexOut",
+    "STATUS_NORM_SQL",
+    "normalize_status",
+]
 
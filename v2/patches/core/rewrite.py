@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import ast
 import re
-from typing import Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
 # Detect triple-quoted blocks (top-level) and encoding comment
 _DOCSTRING_RX = re.compile(r'^[ \t]*[rRuUbB]*("""|\'\'\')')
@@ -91,8 +91,8 @@ def _find_existing_docstring_span(node: ast.AST, lines: list[str]) -> Optional[T
     return None
 
 
-def _insert_module_docstring(src_lines: list[str], block_lines: list[str]) -> list[str]:
-    """Insert module docstring at the top, after shebang and encoding comment."""
+def _module_docstring_index(src_lines: list[str]) -> int:
+    """Where a new module docstring goes: the top, after shebang and encoding comment."""
     i = 0
     # Shebang
     if i < len(src_lines) and src_lines[i].startswith("#!"):
@@ -100,18 +100,11 @@ def _insert_module_docstring(src_lines: list[str], block_lines: list[str]) -> li
     # Encoding
     if i < len(src_lines) and _ENCODING_RX.match(src_lines[i] or ""):
         i += 1
-    # Insert block at i
-    return src_lines[:i] + block_lines + src_lines[i:]
+    return i
 
 
-def _replace_span(src_lines: list[str], start: int, end: int, new_block: list[str]) -> list[str]:
-    return src_lines[:start] + new_block + src_lines[end + 1:]
-
-
-def _insert_after_line(src_lines: list[str], lineno0: int, new_block: list[str]) -> list[str]:
-    """Insert `new_block` AFTER the given 0-based line index."""
-    insert_at = min(max(lineno0 + 1, 0), len(src_lines))
-    return src_lines[:insert_at] + new_block + src_lines[insert_at:]
+# An edit replaces lines[start:stop] (0-based, stop exclusive; start == stop inserts)
+_Edit = Tuple[int, int, List[str]]
 
 
 def _find_orphan_module_string_span(lines: list[str], search_limit: int = 50) -> Optional[Tuple[int, int]]:
@@ -151,39 +144,47 @@ def _find_orphan_module_string_span(lines: list[str], search_limit: int = 50) ->
     return None
 
 
-def apply_docstring_update(
-    original_src: str,
-    target_lineno: int,
-    new_docstring: str,
-    *,
-    relpath: Optional[str] = None,
-) -> str:
+def _header_end(node: ast.AST, lines: list[str], header_line0: int) -> Optional[int]:
     """
-    Update or create a docstring at `target_lineno` (1-based).
-
-    If no symbol is found at that line, treat it as a module docstring update:
-      1) Replace an existing AST module docstring if present,
-      2) else replace a near-top “orphan” triple-quoted block if present,
-      3) else insert at canonical module top.
-
-    The renderer places opening/closing quotes on their own lines,
-    with exactly one blank line between summary and body.
+    0-based index of the last line of a def/class header (the one ending in ':'),
+    so a signature split over several lines is not cut in half by an insert.
+    None when the body starts on the header line (`def f(): ...`).
     """
-    try:
-        tree = ast.parse(original_src)
-    except SyntaxError:
-        # If the file cannot be parsed, return original unchanged
-        return original_src
+    body = getattr(node, "body", None) or []
+    if not body:
+        return header_line0
+    starts = [getattr(body[0], "lineno", None)] + [getattr(d, "lineno", None) for d in getattr(body[0], "decorator_list", [])]
+    first = min((x for x in starts if isinstance(x, int)), default=None)
+    if first is None:
+        return header_line0
+    if first - 1 <= header_line0:
+        return None
+    end = first - 2
+    while end > header_line0 and (lines[end].strip() == "" or lines[end].lstrip().startswith("#")):
+        end -= 1
+    return end
 
-    lines = _split_lines(original_src)
 
-    # Try to find a matching def/class at that line
-    target_node: Optional[ast.AST] = None
+def _symbol_index(tree: ast.AST) -> Dict[int, ast.AST]:
+    """def/class nodes by header line (first in ast.walk order wins, as a linear search would)."""
+    index: Dict[int, ast.AST] = {}
     for node in ast.walk(tree):
         if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
-            if getattr(node, "lineno", None) == int(target_lineno):
-                target_node = node
-                break
+            lineno = getattr(node, "lineno", None)
+            if isinstance(lineno, int):
+                index.setdefault(lineno, node)
+    return index
+
+
+def _plan_docstring_edit(
+    tree: ast.AST,
+    lines: list[str],
+    symbols: Dict[int, ast.AST],
+    target_lineno: int,
+    new_docstring: str,
+) -> Optional[_Edit]:
+    """The splice `apply_docstring_update` would make against `lines`, or None for no change."""
+    target_node = symbols.get(int(target_lineno))
 
     if target_node is None:
         # Module-level update requested
@@ -193,23 +194,28 @@ def apply_docstring_update(
             # Prefer a true module docstring if AST finds one
             span = _find_existing_docstring_span(tree, lines)
             if span:
-                return "".join(_replace_span(lines, span[0], span[1], block))
+                return (span[0], span[1] + 1, block)
 
             # Else replace a near-top orphan triple-quoted block if present
             orphan = _find_orphan_module_string_span(lines)
             if orphan:
-                return "".join(_replace_span(lines, orphan[0], orphan[1], block))
+                return (orphan[0], orphan[1] + 1, block)
 
             # Else insert at canonical module top
-            return "".join(_insert_module_docstring(lines, block))
+            i = _module_docstring_index(lines)
+            return (i, i, block)
 
         # If we cannot match a node or module top, bail out safely
-        return original_src
+        return None
 
     # Compute indentation
     header_line0 = max(int(getattr(target_node, "lineno", 1)) - 1, 0)
+    header_end0 = _header_end(target_node, lines, header_line0)
+    if header_end0 is None:
+        # One-line def/class: no line to put a docstring on without reflowing the body
+        return None
     header_indent = _indent_of(lines[header_line0])
-    body_indent = _guess_body_indent(lines, header_line0 + 1, header_indent)
+    body_indent = _guess_body_indent(lines, header_end0 + 1, header_indent)
 
     # New block rendered with body indentation (docstring sits at body level)
     block = _render_docstring_block(new_docstring, indent=body_indent)
@@ -217,8 +223,79 @@ def apply_docstring_update(
     # Replace existing docstring or insert right after header
     span = _find_existing_docstring_span(target_node, lines)
     if span:
-        new_lines = _replace_span(lines, span[0], span[1], block)
-    else:
-        new_lines = _insert_after_line(lines, header_line0, block)
+        return (span[0], span[1] + 1, block)
+    insert_at = min(max(header_end0 + 1, 0), len(lines))
+    return (insert_at, insert_at, block)
+
+
+def apply_docstring_update(
+    original_src: str,
+    target_lineno: int,
+    new_docstring: str,
+    *,
+    relpath: Optional[str] = None,
+) -> str:
+    """
+    Update or create a docstring at `target_lineno` (1-based).
 
-    return "".join(new_lines)
+    If no symbol is found at that line, treat it as a module docstring update:
+      1) Replace an existing AST module docstring if present,
+      2) else replace a near-top “orphan” triple-quoted block if present,
+      3) else insert at canonical module top.
+
+    The renderer places opening/closing quotes on their own lines,
+    with exactly one blank line between summary and body.
+    """
+    updated, _applied = apply_docstring_updates(original_src, [(target_lineno, new_docstring)], relpath=relpath)
+    return updated
+
+
+def apply_docstring_updates(
+    original_src: str,
+    updates: Iterable[Tuple[int, str]],
+    *,
+    relpath: Optional[str] = None,
+) -> Tuple[str, List[bool]]:
+    """
+    Apply several (target_lineno, docstring) updates to one file in a single pass.
+
+    The source is parsed once and every edit is planned against the original
+    lines (same rules as `apply_docstring_update`), then spliced bottom-up so no
+    edit shifts the lines another one targets. When several updates name the
+    same line the last one wins.
+
+    Returns (updated_src, applied) with applied[i] False for updates that made
+    no change: no matching symbol, superseded by a later update for the same
+    line, or overlapping another edit. An unparseable file is returned unchanged.
+    """
+    ups = [(int(lineno), str(doc)) for lineno, doc in updates]
+    applied = [False] * len(ups)
+    try:
+        tree = ast.parse(original_src)
+    except SyntaxError:
+        # If the file cannot be parsed, return original unchanged
+        return original_src, applied
+
+    lines = _split_lines(original_src)
+    symbols = _symbol_index(tree)
+
+    last_for_line: Dict[int, int] = {}
+    for i, (lineno, _doc) in enumerate(ups):
+        last_for_line[lineno] = i
+
+    planned: List[Tuple[_Edit, int]] = []
+    for i in sorted(last_for_line.values()):
+        edit = _plan_docstring_edit(tree, lines, symbols, ups[i][0], ups[i][1])
+        if edit is not None:
+            planned.append((edit, i))
+
+    # Bottom-up: highest start first; an edit may not reach into one already applied below it
+    planned.sort(key=lambda e: (e[0][0], e[0][1]), reverse=True)
+    floor = len(lines) + 1
+    for (start, stop, block), i in planned:
+        if stop > floor:
+            continue
+        lines[start:stop] = block
+        applied[i] = True
+        floor = start
+    return "".join(lines), applied